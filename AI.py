@@ -1,40 +1,18 @@
+import profiling  # DASHBOARD_PROFILE=1 이면 import/구간 시간을 잰다 (맨 먼저 import)
+profiling.begin("AI.py")
+
 import streamlit as st
-import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-import matplotlib.font_manager as fm
-import os
-import requests
-from math import pi
+from figure_cache import st_chart
+from dashboard_data import AI_CATEGORIES, AI_COLORS, AI_MODELS, ai_finance_frame
+
+# 차트 모듈(matplotlib · seaborn)은 첫 차트를 그릴 때 불러온다. 제목이 먼저 뜬다.
+ai_charts = profiling.lazy_import("ai_charts")
 
 # ==============================================================================
 # [SYSTEM] 폰트 로딩 (무결점 시스템)
 # ==============================================================================
-@st.cache_resource
-def load_and_configure_font():
-    font_url = "https://github.com/google/fonts/raw/main/ofl/nanumgothic/NanumGothic-ExtraBold.ttf" 
-    font_path = "NanumGothic-ExtraBold.ttf"
-
-    if not os.path.exists(font_path):
-        try:
-            with st.spinner("💾 AI 데이터베이스 동기화 중..."):
-                response = requests.get(font_url)
-                with open(font_path, "wb") as f:
-                    f.write(response.content)
-        except Exception as e:
-            return "sans-serif"
-
-    fm.fontManager.addfont(font_path)
-    font_name = fm.FontProperties(fname=font_path).get_name()
-    
-    plt.rcParams['font.family'] = font_name
-    plt.rcParams['axes.unicode_minus'] = False
-    sns.set(font=font_name, style='darkgrid', rc={"axes.unicode_minus":False})
-    
-    return font_name
-
-font_name = load_and_configure_font()
+# 나눔고딕 ExtraBold 는 저장소에 들어 있다. 차트를 그릴 때마다 font="extrabold" 로 적용한다.
+# (첫 차트를 그릴 때 fonts.py 가 자동으로 등록)
 
 # ==============================================================================
 # [DESIGN] 2026 Cyberpunk UI (가독성 & 탭 크기 강화)
@@ -148,27 +126,18 @@ st.markdown(f"""
 # ==============================================================================
 # [DATA] 4대 AI 데이터
 # ==============================================================================
-models = {
-    'Gemini 2.0 (Google)': [9.9, 9.7, 10.0, 9.9, 9.0, 9.5],
-    'GPT-5 (OpenAI)':      [9.8, 9.9, 9.0, 9.6, 8.8, 8.5],
-    'Grok 4 (xAI)':        [9.2, 9.4, 8.5, 9.0, 10.0, 8.0],
-    'Claude 4 (Anthropic)':[9.9, 9.8, 9.2, 8.5, 8.5, 9.0]
-}
-categories = ['코딩', '추론', '문맥', '멀티모달', '속도', '에이전트']
+# 능력치 · 투자 정보는 dashboard_data.py 에 있다 (리포트 이미지 일괄 생성 render_reports.py 와 함께 씀).
+models = AI_MODELS
+categories = AI_CATEGORIES
 
 # 투자 정보
-finance_data = {
-    'AI Model': ['GPT-5 (OpenAI)', 'Gemini (DeepMind)', 'Grok (xAI)', 'Claude (Anthropic)'],
-    'Valuation ($B)': [250, 200, 80, 60], 
-    'Backer': ['Microsoft', 'Alphabet', 'Elon Musk', 'Amazon'],
-    'Investment Focus': ['초지능(AGI) / B2B', '모바일 / 에이전트', '로봇 / 물리AI', 'AI 안전 / 코딩']
-}
-df_finance = pd.DataFrame(finance_data)
+df_finance = ai_finance_frame()
 
 # ==============================================================================
 # [UI] 헤더 & 4대 천왕 소개
 # ==============================================================================
 st.markdown('<div class="title-text">🤖 2026 AI 천하제일 무술대회</div>', unsafe_allow_html=True)
+profiling.first_paint()
 st.markdown("<h3 style='text-align: center; margin-bottom: 40px;'>⚔️ 실리콘 왕좌의 주인은 누가 될 것인가?</h3>", unsafe_allow_html=True)
 
 # 4대 AI 카드
@@ -242,83 +211,55 @@ with st.expander("📂 [1급 기밀] 심층 분석 보고서 열람 (Click to Op
 # ==============================================================================
 # [TABS] 메인 차트 및 분석
 # ==============================================================================
-tab1, tab2, tab3 = st.tabs(["💰 머니 게임 (Finance)", "⚔️ 스펙 레이더 (Stats)", "🔮 미래 시나리오 (Future)"])
-
-# 1. 머니 게임
-with tab1:
-    c_chart, c_desc = st.columns([1.5, 1])
-    with c_chart:
-        st.markdown("#### 📊 기업가치(Valuation) 비교 (단위: 10억 달러)")
-        fig_m, ax_m = plt.subplots(figsize=(10, 6))
-        fig_m.patch.set_alpha(0.0)
-        ax_m.set_facecolor('none')
-        
-        bars = ax_m.barh(df_finance['AI Model'], df_finance['Valuation ($B)'], 
-                         color=['#10A37F', '#4285F4', '#FFFFFF', '#D97757'])
-        
-        for bar in bars:
-            width = bar.get_width()
-            ax_m.text(width + 5, bar.get_y() + bar.get_height()/2, 
-                      f'${int(width)}B', va='center', color='white', fontweight='bold', fontsize=12)
-            
-        ax_m.spines['top'].set_visible(False)
-        ax_m.spines['right'].set_visible(False)
-        ax_m.spines['bottom'].set_color('white')
-        ax_m.spines['left'].set_color('white')
-        ax_m.tick_params(colors='white')
-        st.pyplot(fig_m)
-
-    with c_desc:
-        st.markdown("#### 💼 2026 투자자 현황")
-        st.dataframe(df_finance[['AI Model', 'Backer', 'Investment Focus']], hide_index=True, use_container_width=True)
-
-# 2. 스펙 레이더
-with tab2:
-    col_radar, col_desc = st.columns([1.5, 1])
-    with col_radar:
-        fig, ax = plt.subplots(figsize=(9, 9), subplot_kw=dict(polar=True))
-        fig.patch.set_alpha(0.0)
-        ax.set_facecolor('none')
-        ax.grid(color='#555', linestyle=':', linewidth=1)
-        ax.spines['polar'].set_color('#888')
-        
-        N = len(categories)
-        angles = [n / float(N) * 2 * pi for n in range(N)]
-        angles += angles[:1]
-        
-        plt.xticks(angles[:-1], categories, color='#00C9FF', size=14, fontweight='bold')
-        plt.yticks([2,4,6,8,10], [], color="#333")
-        plt.ylim(0, 10.5)
-
-        colors = {'Gemini 2.0 (Google)': '#4285F4', 'GPT-5 (OpenAI)': '#10A37F', 
-                  'Grok 4 (xAI)': '#FFFFFF', 'Claude 4 (Anthropic)': '#D97757'}
-
-        for model, values in models.items():
-            values += values[:1]
-            ax.plot(angles, values, linewidth=3, label=model, color=colors[model])
-            ax.fill(angles, values, color=colors[model], alpha=0.1)
-
-        legend = plt.legend(loc='upper right', bbox_to_anchor=(1.3, 1.1), 
-                            facecolor=(0,0,0,0.7), edgecolor='#555')
-        plt.setp(legend.get_texts(), color='white')
-        st.pyplot(fig)
-        
-    with col_desc:
-        st.markdown("#### 📊 4대 천왕 능력치")
-        st.info("💎 **제미나이:** 문맥/영상 이해 만점")
-        st.info("🧠 **GPT-5:** 추론/논리 만점")
-        st.info("🚀 **그록:** 속도/실시간성 만점")
-        st.info("💻 **클로드:** 코딩/안전성 만점")
-
-# 3. 미래 시나리오
-with tab3:
-    col_f1, col_f2 = st.columns(2)
-    with col_f1:
-        st.success("#### 🏆 제미나이 승리 시나리오")
-        st.write("스마트폰 OS(안드로이드)를 가진 구글이 '개인 비서' 시장을 독점합니다. 앱스토어는 사라지고 '제미나이 스토어'의 시대가 옵니다.")
-    with col_f2:
-        st.warning("#### ⚠️ 그록의 로봇 혁명")
-        st.write("테슬라 봇이 가정에 보급되면서 AI가 물리 세계로 나옵니다. 노동을 대체하는 그록이 가장 큰 부가가치를 창출합니다.")
+@profiling.fragment("AI 탭")
+def tabs_section():
+    # on_change="rerun" 이면 선택된 탭의 내용만 실행된다 (예전에는 안 보이는 탭의 차트까지 매번 그림).
+    # 탭들을 fragment 안에 두었으므로 탭을 바꿔도 위의 카드 · 요약은 다시 그리지 않는다.
+    tab1, tab2, tab3 = st.tabs(["💰 머니 게임 (Finance)", "⚔️ 스펙 레이더 (Stats)", "🔮 미래 시나리오 (Future)"],
+                               key="ai_tab", on_change="rerun")
+
+    # 1. 머니 게임
+    if tab1.open:
+        with tab1, profiling.section("Tab 1 머니 게임"):
+            c_chart, c_desc = st.columns([1.5, 1])
+            with c_chart:
+                st.markdown("#### 📊 기업가치(Valuation) 비교 (단위: 10억 달러)")
+                # 그림은 ai_charts.py 에서 그리고, 같은 데이터면 캐시된 이미지를 바로 보여준다.
+                st_chart(ai_charts.valuation, df_finance, font="extrabold")
+
+            with c_desc:
+                st.markdown("#### 💼 2026 투자자 현황")
+                st.dataframe(df_finance[['AI Model', 'Backer', 'Investment Focus']], hide_index=True, width="stretch")
+
+    # 2. 스펙 레이더
+    if tab2.open:
+        with tab2, profiling.section("Tab 2 스펙 레이더"):
+            col_radar, col_desc = st.columns([1.5, 1])
+            with col_radar:
+                st_chart(ai_charts.radar, models, categories, AI_COLORS, font="extrabold")
+                
+            with col_desc:
+                st.markdown("#### 📊 4대 천왕 능력치")
+                st.info("💎 **제미나이:** 문맥/영상 이해 만점")
+                st.info("🧠 **GPT-5:** 추론/논리 만점")
+                st.info("🚀 **그록:** 속도/실시간성 만점")
+                st.info("💻 **클로드:** 코딩/안전성 만점")
+
+    # 3. 미래 시나리오
+    if tab3.open:
+        with tab3, profiling.section("Tab 3 미래 시나리오"):
+            col_f1, col_f2 = st.columns(2)
+            with col_f1:
+                st.success("#### 🏆 제미나이 승리 시나리오")
+                st.write("스마트폰 OS(안드로이드)를 가진 구글이 '개인 비서' 시장을 독점합니다. 앱스토어는 사라지고 '제미나이 스토어'의 시대가 옵니다.")
+            with col_f2:
+                st.warning("#### ⚠️ 그록의 로봇 혁명")
+                st.write("테슬라 봇이 가정에 보급되면서 AI가 물리 세계로 나옵니다. 노동을 대체하는 그록이 가장 큰 부가가치를 창출합니다.")
+
+
+tabs_section()
 
 st.markdown("---")
-st.markdown("<div style='text-align: center; color: #aaa;'>Simulation by Gemini 2.0 | Powered by Streamlit</div>", unsafe_allow_html=True)
\ No newline at end of file
+st.markdown("<div style='text-align: center; color: #aaa;'>Simulation by Gemini 2.0 | Powered by Streamlit</div>", unsafe_allow_html=True)
+
+profiling.st_report()  # 프로파일 모드일 때만 사이드바에 시간표
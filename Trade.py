@@ -1,76 +1,43 @@
-import streamlit as st
-import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
-import seaborn as sns
-import matplotlib.font_manager as fm
+import profiling  # DASHBOARD_PROFILE=1 이면 import/구간 시간을 잰다 (맨 먼저 import)
+profiling.begin("Trade.py")
+
 import os
-import requests
+
+import pandas as pd
+import streamlit as st
+from trade_cube import region_donut_args
+from trade_refresh import trade_feed, SERIES_TAG, REGIONS_TAG
+from figure_cache import st_chart
+from trade_scenarios import history_params, run as run_scenarios
+from trade_forecast import trade_forecast
+from trade_interactive import series_source, trend_spec, balance_spec
+
+# 차트 모듈(matplotlib · seaborn)은 첫 차트를 그릴 때 불러온다. 제목이 먼저 뜬다.
+trade_charts = profiling.lazy_import("trade_charts")
 
 # ==============================================================================
-# [Part 1] 폰트 깨짐 방지 솔루션 (이 부분이 핵심입니다!)
+# [Part 1] 폰트 깨짐 방지 솔루션
 # ------------------------------------------------------------------------------
-# 시스템 폰트를 찾는 게 아니라, 웹에서 '나눔고딕'을 다운받아 강제로 등록합니다.
-# 코드가 길지만, 이 방식이 가장 확실합니다.
+# 저장소에 들어 있는 '나눔고딕'을 fonts.py 가 등록하고, 그래프를 그릴 때마다 적용합니다.
+# (예전처럼 웹에서 내려받느라 첫 화면이 멈추거나, 전역 설정을 바꾸지 않습니다.)
+# 등록은 첫 그래프를 그릴 때 자동으로 한 번 일어납니다.
 # ==============================================================================
 
-@st.cache_resource
-def setup_font_perfectly():
-    # 1. 폰트 파일 이름과 저장 경로 설정
-    font_filename = "NanumGothic.ttf"
-    font_url = "https://github.com/google/fonts/raw/main/ofl/nanumgothic/NanumGothic-Regular.ttf"
-    
-    # 2. 현재 폴더에 폰트 파일이 없으면 다운로드 (최초 1회만 실행됨)
-    if not os.path.exists(font_filename):
-        with st.spinner("📦 그래프용 한글 폰트를 설치하고 있습니다... (약 3~5초 소요)"):
-            try:
-                response = requests.get(font_url)
-                with open(font_filename, "wb") as f:
-                    f.write(response.content)
-                st.success("✅ 폰트 설치 완료! 그래프를 생성합니다.")
-            except Exception as e:
-                st.error(f"폰트 다운로드 실패: {e}")
-                return None
-
-    # 3. 다운로드 받은 폰트를 Matplotlib 폰트 매니저에 '강제 등록'
-    try:
-        fm.fontManager.addfont(font_filename)
-        # 등록된 폰트의 정확한 내부 이름을 가져옴
-        font_prop = fm.FontProperties(fname=font_filename)
-        font_name = font_prop.get_name()
-        
-        # 4. Matplotlib의 기본 폰트로 설정
-        plt.rc('font', family=font_name)
-        plt.rcParams['axes.unicode_minus'] = False # 마이너스(-) 기호 깨짐 방지
-        
-        return font_name
-    except Exception as e:
-        st.error(f"폰트 등록 오류: {e}")
-        return None
-
-# 폰트 설정 함수 실행 (이게 먼저 실행되어야 함)
-setup_font_perfectly()
-
 
 # ==============================================================================
-# [Part 2] 데이터 시뮬레이션 (2024~2025 무역 데이터 생성)
+# [Part 2] 실제 무역 데이터 불러오기 (K-stat 수출입 총괄, 연도별)
+# ------------------------------------------------------------------------------
+# 예전에는 np.random 으로 가짜 월별 데이터를 만들었지만, 이제 저장소의 K-stat 내보내기 파일을 쓴다.
+# 엑셀(.xls)은 처음 한 번만 Parquet 으로 변환되고(kstat_import.py), 여기서는 Parquet 만 읽는다.
+# 그 표를 기간 × 지역 × 품목으로 미리 더해 둔 큐브(trade_cube.py)에서 필요한 조각만 잘라 쓴다.
+# (국가별 · 품목별 자료가 들어와도 화면을 다시 그릴 때 group-by 를 하지 않는다)
+# 원본에 새 해(달)가 붙으면 trade_refresh.py 가 붙은 부분만 반영한 새 상태로 바꿔 끼운다.
+# 이번 실행은 처음 꺼낸 상태 하나로 끝까지 그린다.
 # ==============================================================================
-dates = pd.date_range(start='2024-01-01', end='2025-12-01', freq='MS')
-n_months = len(dates)
-np.random.seed(42)
-
-# 트렌드 설정: 수출은 반도체 호황으로 급성장, 수입은 유가 안정으로 완만
-trend_exp = np.linspace(54, 78, n_months) 
-trend_imp = np.linspace(52, 60, n_months)
-seasonality = np.sin(np.linspace(0, 4*np.pi, n_months)) * 2
-
-# 노이즈 추가
-exports = trend_exp + seasonality + np.random.normal(0, 1.0, n_months)
-imports = trend_imp + seasonality * 0.8 + np.random.normal(0, 1.0, n_months)
-trade_balance = exports - imports
-
-df = pd.DataFrame({'Date': dates, 'Exports': exports, 'Imports': imports, 'Trade_Balance': trade_balance})
+with profiling.section("데이터 불러오기"):
+    feed = trade_feed().state
+    cube = feed.cube
+    df = cube.series("year")  # Date / Exports / Imports / Trade_Balance (단위: 10억 달러)
 
 
 # ==============================================================================
@@ -79,6 +46,7 @@ df = pd.DataFrame({'Date': dates, 'Exports': exports, 'Imports': imports, 'Trade
 st.set_page_config(page_title="2025 대한민국 무역 전략 리포트", layout="wide")
 
 st.title("📊 2025 대한민국 무역 전략 대시보드")
+profiling.first_paint()
 st.markdown("""
 <style>
     .big-font { font-size:18px !important; color: #333; }
@@ -88,9 +56,28 @@ st.markdown("""
 
 st.markdown("**KITA(한국무역협회) 수석 애널리스트 인사이트 리포트**")
 st.info("💡 **Executive Summary:** 2025년은 AI 반도체 슈퍼사이클과 조선업 호황이 맞물리며 **'수출 7,000억 달러 시대'**를 여는 원년이 될 것입니다.")
+
+# Chart 1 · 2 를 그리는 방식: 서버에서 그린 이미지(matplotlib) 또는 브라우저에서 그리는 Vega-Lite.
+# 인터랙티브 쪽은 보이는 구간만 화면 폭만큼 솎아서 보내므로 자료가 길어도 가볍다 (trade_interactive.py).
+CHART_BACKENDS = ["이미지 (matplotlib)", "인터랙티브 (Vega-Lite)"]
+backend = st.radio("차트 방식", CHART_BACKENDS, horizontal=True, key="chart_backend",
+                   index=1 if os.environ.get("TRADE_CHART_BACKEND") == "vega" else 0)
+interactive = backend == CHART_BACKENDS[1]
 st.markdown("---")
 
 
+@profiling.fragment("인터랙티브 차트")
+def interactive_section(df, names, method, spec, title, key):
+    # 기간 슬라이더로 확대하면 이 차트만 다시: 고른 구간을 원본에서 다시 잘라 솎는다 (더 촘촘해짐).
+    source = series_source(df)
+    first, last = (d.astype(object) for d in source.bounds())
+    start, end = st.slider("기간 (좁히면 더 자세히)", min_value=first, max_value=last, value=(first, last),
+                           format="YYYY-MM", key=key)
+    records, total = source.window(start, end, names, method=method)
+    st.vega_lite_chart(spec(records, f"{title} ({start:%Y}-{end:%Y})"), width="stretch")
+    st.caption(f"{total:,}개 시점 중 {len(records) // len(names):,}개 표시 ({method})")
+
+
 # ------------------------------------------------------------------------------
 # Chart 1. 수출입 매크로 트렌드 (Line Chart)
 # ------------------------------------------------------------------------------
@@ -98,30 +85,12 @@ st.subheader("1. 수출입 매크로 트렌드 (Macro Trend)")
 col1, col2 = st.columns([1.8, 1])
 
 with col1:
-    fig1, ax1 = plt.subplots(figsize=(10, 5))
-    sns.set_style("whitegrid")
-    
-    # 그래프 그리기
-    ax1.plot(df['Date'], df['Exports'], label='수출액 (Exports)', color='#004c70', linewidth=3, marker='o') # 짙은 파랑
-    ax1.plot(df['Date'], df['Imports'], label='수입액 (Imports)', color='#d45087', linewidth=3, marker='s', linestyle='--') # 짙은 분홍
-    
-    # 골든크로스(흑자) 구간 색칠
-    ax1.fill_between(df['Date'], df['Exports'], df['Imports'], 
-                     where=(df['Exports'] >= df['Imports']), interpolate=True, color='#004c70', alpha=0.1)
-    
-    # 주석 달기 (최고점)
-    max_date = df['Date'][df['Exports'].idxmax()]
-    max_val = df['Exports'].max()
-    ax1.annotate(f'역대 최대 실적\n(${max_val:.1f}B)', xy=(max_date, max_val), xytext=(0, 20),
-                 textcoords='offset points', ha='center', fontsize=10, fontweight='bold',
-                 arrowprops=dict(arrowstyle='->', color='black'))
-
-    ax1.set_title("월별 수출입 실적 추이 (2024-2025)", fontsize=16, fontweight='bold', pad=20)
-    ax1.set_ylabel("금액 (10억 달러)", fontsize=12)
-    ax1.xaxis.set_major_formatter(mdates.DateFormatter('%y.%m'))
-    ax1.legend(loc='upper left', fontsize=12)
-    
-    st.pyplot(fig1)
+    # 그림은 trade_charts.py 에서 그리고, 같은 데이터면 캐시된 이미지를 바로 보여준다.
+    with profiling.section("Chart 1"):
+        if interactive:
+            interactive_section(df, ["Exports", "Imports"], "lttb", trend_spec, "수출입 실적 추이", "trend_window")
+        else:
+            st_chart(trade_charts.macro_trend, df, tags=(SERIES_TAG,))
 
 with col2:
     st.markdown('<div class="highlight">', unsafe_allow_html=True)
@@ -143,19 +112,13 @@ st.subheader("2. 무역수지 구조 및 리스크 관리")
 col3, col4 = st.columns([1.8, 1])
 
 with col3:
-    fig2, ax2 = plt.subplots(figsize=(10, 5))
-    
-    # 흑자(파랑) / 적자(빨강) 조건부 색상 지정
-    colors = ['#005eb8' if x >= 0 else '#e03a3e' for x in df['Trade_Balance']]
-    ax2.bar(df['Date'], df['Trade_Balance'], color=colors, alpha=0.8, width=20)
-    ax2.axhline(0, color='black', linewidth=1) # 0점 기준선
-    
-    ax2.set_title("월별 무역수지 흑자/적자 변동폭", fontsize=16, fontweight='bold', pad=20)
-    ax2.set_ylabel("수지 (10억 달러)", fontsize=12)
-    ax2.xaxis.set_major_formatter(mdates.DateFormatter('%y.%m'))
-    ax2.grid(axis='y', linestyle='--', alpha=0.5)
-    
-    st.pyplot(fig2)
+    with profiling.section("Chart 2"):
+        if interactive:
+            interactive_section(df, ["Trade_Balance"], "minmax", balance_spec, "무역수지 흑자/적자", "balance_window")
+        else:
+            st_chart(trade_charts.trade_balance, df, tags=(SERIES_TAG,))
+    st.caption(f"{feed.years[-1]}년 수출 전년 대비 {feed.yoy[-1, 0]:+.1f}% · 수입 {feed.yoy[-1, 1]:+.1f}% | "
+               f"{feed.years[0]}년 이후 누적 무역수지 {feed.running[-1]:+,.1f} 십억 달러")
 
 with col4:
     st.markdown('<div class="highlight">', unsafe_allow_html=True)
@@ -177,24 +140,10 @@ st.subheader("3. 2025년 글로벌 시장 포트폴리오 (G2 역전)")
 col5, col6 = st.columns([1, 1.2])
 
 with col5:
-    fig3, ax3 = plt.subplots(figsize=(6, 6))
-    
-    # 데이터 정의
-    regions = ['중국', '미국', '아세안', 'EU', '중동', '기타']
-    shares = [26.5, 27.2, 18.0, 11.0, 7.3, 10.0]
-    explode = (0, 0.05, 0, 0, 0, 0) # 미국만 살짝 띄우기 강조
-    
-    # 도넛 차트
-    wedges, texts, autotexts = ax3.pie(shares, labels=regions, autopct='%1.1f%%', startangle=140, 
-                                       explode=explode, colors=sns.color_palette('pastel'), pctdistance=0.85,
-                                       textprops={'fontsize': 12, 'weight': 'bold'})
-    
-    # 가운데 원으로 구멍 뚫기
-    centre_circle = plt.Circle((0,0), 0.70, fc='white')
-    fig3.gca().add_artist(centre_circle)
-    
-    ax3.set_title("권역별 수출 비중 목표치", fontsize=16, fontweight='bold')
-    st.pyplot(fig3)
+    # 지역별 자료가 있으면 큐브에서 최근 연도의 지역 비중을 잘라 오고 (가장 큰 곳을 띄움),
+    # 없으면(지금의 총괄표) dashboard_data.py 의 권역 / 비중(%) / 미국 강조 고정값을 쓴다.
+    with profiling.section("Chart 3"):
+        st_chart(trade_charts.region_donut, *region_donut_args(cube), tags=(REGIONS_TAG,))
 
 with col6:
     st.markdown('<div class="highlight">', unsafe_allow_html=True)
@@ -208,4 +157,65 @@ with col6:
     st.markdown('</div>', unsafe_allow_html=True)
 
 st.markdown("---")
-st.caption("Data Source: KITA Trade Statistics Prediction Model 2025 | Powered by Python & Streamlit")
\ No newline at end of file
+
+
+# ------------------------------------------------------------------------------
+# Chart 4. 유가 충격 시나리오 (Monte Carlo)
+# ------------------------------------------------------------------------------
+# 위 '리스크 요인'(유가 90달러 돌파) 을 숫자로: 월별 수출입 경로를 수만 개 뽑아 수지 분포를 본다.
+# 추세 · 변동성은 위 연도별 실적에서 뽑고(trade_scenarios.py), 유가 조건만 슬라이더로 바꾼다.
+# 슬라이더를 움직이면 이 구간만 다시 계산된다 (fragment).
+st.subheader("4. 유가 충격 시나리오 (Monte Carlo 리스크 분석)")
+
+
+@profiling.fragment("유가 시나리오")
+def scenario_section(df):
+    s1, s2, s3, s4 = st.columns(4)
+    oil = s1.slider("시작 유가 ($/배럴)", min_value=50, max_value=120, value=75, step=5,
+                    help="기준 수입(최근 연도)에 들어 있는 유가 $75 보다 높으면 첫 달부터 수입이 비싸집니다.")
+    shock = s2.slider("월별 유가 충격 확률 (%)", min_value=0, max_value=30, value=5)
+    energy = s3.slider("수입 중 에너지 비중 (%)", min_value=10, max_value=40, value=25)
+    paths = s4.selectbox("경로 수", [10_000, 100_000, 1_000_000], index=1, format_func="{:,}".format)
+
+    with profiling.section("Chart 4"):
+        result = run_scenarios(history_params(df, oil_start=float(oil), shock_prob=shock / 100,
+                                              energy_share=energy / 100, paths=paths))
+        c1, c2, c3 = st.columns(3)
+        c1.metric("1년 중 적자 달이 생길 확률", f"{result.p_any_deficit * 100:.1f}%")
+        c2.metric("연간 무역수지 (중앙값)", f"{result.annual_balance_q[2]:+,.1f} 십억 달러",
+                  f"90% 구간 {result.annual_balance_q[0]:+,.0f} ~ {result.annual_balance_q[-1]:+,.0f}",
+                  delta_color="off")
+        c3.metric(f"유가 ${result.params.oil_threshold:.0f} 돌파 확률 (12월)", f"{result.p_oil_over[-1] * 100:.1f}%")
+        st_chart(trade_charts.scenario_fan, result.chart_data(), tags=(SERIES_TAG,))
+
+
+scenario_section(df)
+
+st.markdown("---")
+
+
+# ------------------------------------------------------------------------------
+# Chart 5. 수출입 전망 (추세 분해 + Holt 예측)
+# ------------------------------------------------------------------------------
+# Executive Summary 의 '수출 7,000억 달러' 전망을 실적에 맞춘 모형으로 확인한다 (trade_forecast.py).
+# 같은 실적이면 적합한 모형을 그대로 쓰고, 새 기간이 붙으면 마지막 상태에서 이어서 계산한다.
+st.subheader("5. 수출입 전망 (추세 분해 · Holt 예측)")
+
+with profiling.section("Chart 5"):
+    forecast = trade_forecast(df)
+    next_year = pd.Timestamp(forecast.future_dates[0]).year
+    lower, upper = forecast.intervals[0.8]  # (계열, 기간): 수출 · 수입 · 수지
+    lo_x, hi_x, lo_b, hi_b = lower[0, 0], upper[0, 0], lower[2, 0], upper[2, 0]
+    f1, f2, f3 = st.columns(3)
+    f1.metric(f"{next_year}년 수출 예측", f"{forecast.mean[0, 0]:,.1f} 십억 달러",
+              f"80% 구간 {lo_x:,.0f} ~ {hi_x:,.0f}", delta_color="off")
+    f2.metric(f"{next_year}년 수입 예측", f"{forecast.mean[1, 0]:,.1f} 십억 달러")
+    f3.metric(f"{next_year}년 무역수지 예측", f"{forecast.mean[2, 0]:+,.1f} 십억 달러",
+              f"80% 구간 {lo_b:+,.0f} ~ {hi_b:+,.0f}", delta_color="off")
+    st_chart(trade_charts.forecast_fan, forecast.chart_data(), tags=(SERIES_TAG,))
+
+st.markdown("---")
+st.caption(f"Data Source: KITA K-stat 수출입 무역통계 (자료 v{feed.version}, "
+           f"{pd.Timestamp(feed.updated, unit='s', tz='Asia/Seoul'):%Y-%m-%d %H:%M} 반영) | Powered by Python & Streamlit")
+
+profiling.st_report()  # 프로파일 모드일 때만 사이드바에 시간표
@@ -0,0 +1,64 @@
+from math import pi
+
+from chart_render import create_figure
+
+# ==============================================================================
+# [AI.py 차트] 데이터 → Figure 를 돌려주는 함수만 모아 둔 곳
+# ------------------------------------------------------------------------------
+# 화면(Streamlit) 코드와 분리해 두어야 그림 캐시(figure_cache)가 입력 데이터로 키를 만들고,
+# 서버 없이도 같은 차트를 그릴 수 있다.
+# 배경이 우주 GIF 라서 두 차트 모두 바탕을 투명하게 그린다.
+# ==============================================================================
+
+STYLE = "darkgrid"
+
+
+def valuation(df_finance):
+    # 1. 머니 게임: 기업가치(Valuation) 비교
+    fig_m, ax_m = create_figure("ai.valuation", (10, 6), STYLE)
+    fig_m.patch.set_alpha(0.0)
+    ax_m.set_facecolor('none')
+
+    bars = ax_m.barh(df_finance['AI Model'], df_finance['Valuation ($B)'],
+                     color=['#10A37F', '#4285F4', '#FFFFFF', '#D97757'])
+
+    for bar in bars:
+        width = bar.get_width()
+        ax_m.text(width + 5, bar.get_y() + bar.get_height()/2,
+                  f'${int(width)}B', va='center', color='white', fontweight='bold', fontsize=12)
+
+    ax_m.spines['top'].set_visible(False)
+    ax_m.spines['right'].set_visible(False)
+    ax_m.spines['bottom'].set_color('white')
+    ax_m.spines['left'].set_color('white')
+    ax_m.tick_params(colors='white')
+    return fig_m
+
+
+def radar(models, categories, colors):
+    # 2. 스펙 레이더: 4대 천왕 능력치
+    fig, ax = create_figure("ai.radar", (9, 9), STYLE, subplot_kw=dict(polar=True))
+    fig.patch.set_alpha(0.0)
+    ax.set_facecolor('none')
+    ax.grid(color='#555', linestyle=':', linewidth=1)
+    ax.spines['polar'].set_color('#888')
+
+    N = len(categories)
+    angles = [n / float(N) * 2 * pi for n in range(N)]
+    angles += angles[:1]
+
+    # 풀에서 꺼낸 Figure 는 pyplot 의 '현재 Figure'가 아닐 수 있으므로 plt.xticks 대신 ax 에 직접 설정
+    ax.set_xticks(angles[:-1], categories, color='#00C9FF', size=14, fontweight='bold')
+    ax.set_yticks([2,4,6,8,10], [], color="#333")
+    ax.set_ylim(0, 10.5)
+
+    for model, values in models.items():
+        values = values + values[:1]  # 원본 리스트를 건드리지 않도록 새 리스트로 닫는다.
+        ax.plot(angles, values, linewidth=3, label=model, color=colors[model])
+        ax.fill(angles, values, color=colors[model], alpha=0.1)
+
+    legend = ax.legend(loc='upper right', bbox_to_anchor=(1.3, 1.1),
+                       facecolor=(0,0,0,0.7), edgecolor='#555')
+    for text in legend.get_texts():
+        text.set_color('white')
+    return fig
@@ -0,0 +1,59 @@
+import os
+import threading
+
+import streamlit as st
+
+# ==============================================================================
+# [통합 실행기] 네 대시보드를 한 프로세스 · 한 포트에서 띄운다
+# ------------------------------------------------------------------------------
+# 예전에는 streamlit run share.py / Trade.py / blackwhite.py / AI.py 를 따로 띄워서
+# 프로세스마다 pandas · matplotlib · 글꼴 · 데이터 캐시를 각자 들고 있었다 (메모리 4배, 캐시도 4번 데움).
+#   streamlit run app.py
+# 로 띄우면 사이드바에서 대시보드를 고르고, 모듈 · 데이터 로더 · 그림 캐시를 모두 같이 쓴다.
+# 각 스크립트는 그대로 두었으므로 따로 실행해도 예전처럼 동작한다.
+#
+# 서버가 뜨면 뒤에서(스레드 하나) 데이터와 기본 화면의 그림을 미리 만들어 둔다.
+# 처음 들어온 사용자가 다른 대시보드로 넘어가도 기다리지 않도록.
+# DASHBOARD_WARMUP=0 이면 미리 데우지 않는다.
+# ==============================================================================
+
+WARMUP = os.environ.get("DASHBOARD_WARMUP", "1") not in ("", "0")
+
+PAGES = [
+    st.Page("Trade.py", title="무역 전략 리포트", icon="📊", default=True),
+    st.Page("share.py", title="근로소득 분석기", icon="💸"),
+    st.Page("blackwhite.py", title="흑백요리사 분석", icon="🍳"),
+    st.Page("AI.py", title="4대 AI 비교", icon="🤖"),
+]
+
+
+def _warm():
+    # render_reports.py 의 차트 목록 = 각 대시보드가 처음 열릴 때 그리는 그림 (같은 데이터 · 같은 인자)
+    # 그대로 figure_cache 에 넣어 두면 페이지에서는 캐시에서 바로 꺼낸다.
+    from figure_cache import cached_chart
+    from render_reports import DASHBOARDS, report_jobs
+
+    for dashboard in DASHBOARDS:
+        try:
+            jobs = report_jobs(dashboard)  # 데이터 로더 캐시도 여기서 채워진다
+        except Exception:
+            continue  # 데이터 파일이 없으면 페이지에서 오류를 보여주므로 여기선 건너뜀
+        for job in jobs.values():
+            try:
+                cached_chart(job.build, *job.args, font=job.font, tags=job.tags)
+            except Exception:
+                pass
+
+
+@st.cache_resource(show_spinner=False)
+def warm_caches():
+    # 프로세스당 한 번만: 첫 세션을 막지 않도록 뒤에서 데운다.
+    thread = threading.Thread(target=_warm, name="dashboard-warmup", daemon=True)
+    thread.start()
+    return thread
+
+
+if WARMUP:
+    warm_caches()
+
+st.navigation(PAGES).run()
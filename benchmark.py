@@ -0,0 +1,188 @@
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import resource
+import statistics
+import subprocess
+
+# ==============================================================================
+# [벤치마크] 네 대시보드의 실행 시간 · 메모리를 재고 기준값(baseline)과 비교
+# ------------------------------------------------------------------------------
+# Streamlit 의 테스트 도구(AppTest)로 스크립트를 서버 없이 실행한다.
+#   cold   : 새 프로세스에서 처음 실행 (import · 글꼴 · 데이터 로더 · 그림 캐시가 모두 비어 있음)
+#   warm   : 같은 세션에서 다시 실행 (rerun)
+#   widget : 위젯 하나를 바꾸고 다시 실행 (예: share.py 항목 선택)
+#   peak_rss_mb : 그 프로세스의 최대 메모리
+# 측정마다 새 프로세스를 띄우므로 앞선 측정의 캐시가 섞이지 않는다.
+# (디스크 캐시 .cache/ 는 그대로 쓴다. 처음 한 번 변환하는 시간은 cold 에 들어가지 않음)
+#
+#   python benchmark.py                       → 재고 benchmarks/baseline.json 과 비교 (느려졌으면 종료 코드 1)
+#   python benchmark.py --save                → 잰 값을 새 기준값으로 저장
+#   python benchmark.py share.py --threshold 0.3 --cold-runs 5
+#
+# AppTest 는 fragment 만 다시 실행하는 기능을 흉내 내지 못해서 widget 도 전체 rerun 시간이다.
+# ==============================================================================
+
+SCRIPTS = ("share.py", "Trade.py", "blackwhite.py", "AI.py")
+BASELINE = os.path.join("benchmarks", "baseline.json")
+DEFAULT_THRESHOLD = 0.2   # 기준값보다 20% 넘게 느려지면 회귀로 본다
+MIN_DELTA_MS = 20         # 이보다 작은 차이는 잡음으로 본다 (몇 ms 짜리 측정의 20% 는 의미 없음)
+
+
+# ------------------------------------------------------------------------------
+# 위젯 시나리오: 스크립트마다 (이름, AppTest 를 조작하는 함수)
+# ------------------------------------------------------------------------------
+def _share_column(at):
+    box = at.selectbox[0]
+    box.select(box.options[(box.options.index(box.value) + 1) % len(box.options)])
+
+
+def _share_bins(at):
+    at.slider[0].set_value(50 if at.slider[0].value != 50 else 30)
+
+
+def _share_income(at):
+    at.number_input[0].set_value(at.number_input[0].value + 1000)
+
+
+def _share_rate(at):
+    rate = at.slider[1]
+    rate.set_value(rate.value + 0.5 if rate.value < 60 else rate.value - 0.5)
+
+
+WIDGETS = {
+    "share.py": [("column", _share_column), ("bins", _share_bins),
+                 ("income", _share_income), ("tax_rate", _share_rate)],
+    "Trade.py": [],
+    "blackwhite.py": [],
+    "AI.py": [],
+}
+
+
+# ------------------------------------------------------------------------------
+# 한 프로세스 안에서 재기 (--worker)
+# ------------------------------------------------------------------------------
+def _run(at, timeout):
+    start = time.perf_counter()
+    at.run(timeout=timeout)
+    seconds = time.perf_counter() - start
+    if at.exception:
+        raise RuntimeError(f"스크립트 오류: {at.exception[0].value}")
+    return seconds * 1000
+
+
+def measure(script, warm_runs=5, timeout=120):
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(os.path.abspath(script), default_timeout=timeout)
+    result = {"cold_ms": _run(at, timeout)}
+    result["warm_ms"] = statistics.median(_run(at, timeout) for _ in range(warm_runs))
+    for name, action in WIDGETS.get(script, []):
+        times = []
+        for _ in range(warm_runs):
+            action(at)
+            times.append(_run(at, timeout))
+        result[f"widget_{name}_ms"] = statistics.median(times)
+    result["peak_rss_mb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # 리눅스: KB
+    return result
+
+
+# ------------------------------------------------------------------------------
+# 여러 프로세스로 모으기 · 기준값과 비교
+# ------------------------------------------------------------------------------
+def run_script(script, cold_runs=3, warm_runs=5):
+    # 새 프로세스에서 cold_runs 번 재고 항목별 중앙값을 쓴다.
+    env = dict(os.environ, MPLBACKEND="Agg", RENDER_WORKERS="0", DASHBOARD_PROFILE="0")
+    samples = []
+    for _ in range(cold_runs):
+        out = subprocess.run([sys.executable, os.path.abspath(__file__), "--worker", script,
+                              "--warm-runs", str(warm_runs)],
+                             capture_output=True, text=True, env=env, check=True)
+        samples.append(json.loads(out.stdout.strip().splitlines()[-1]))
+    return {key: round(statistics.median(sample[key] for sample in samples), 1) for key in samples[0]}
+
+
+def machine():
+    import streamlit
+    return {
+        "python": platform.python_version(),
+        "streamlit": streamlit.__version__,
+        "cpus": os.cpu_count(),
+        "platform": platform.platform(),
+    }
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    # [(스크립트, 항목, 기준값, 지금 값, 변화율)] 중 threshold 를 넘게 나빠진 것
+    regressions = []
+    for script, metrics in results.items():
+        for key, value in metrics.items():
+            base = baseline.get("results", {}).get(script, {}).get(key)
+            if not base:
+                continue
+            change = value / base - 1
+            noise = MIN_DELTA_MS if key.endswith("_ms") else 0
+            if change > threshold and value - base > noise:
+                regressions.append((script, key, base, value, change))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="대시보드 실행 시간 · 메모리 벤치마크 (AppTest 기반)")
+    parser.add_argument("scripts", nargs="*", help=f"잴 스크립트 (기본: {', '.join(SCRIPTS)})")
+    parser.add_argument("--baseline", default=BASELINE, help=f"기준값 JSON (기본: {BASELINE})")
+    parser.add_argument("--save", action="store_true", help="잰 값을 기준값으로 저장")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="회귀로 볼 증가율 (기본: 0.2 = 20%%)")
+    parser.add_argument("--cold-runs", type=int, default=3, help="스크립트마다 띄울 프로세스 수 (기본: 3)")
+    parser.add_argument("--warm-runs", type=int, default=5, help="warm / 위젯 측정 반복 횟수 (기본: 5)")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        print(json.dumps(measure(args.worker, args.warm_runs)))
+        return 0
+
+    unknown = set(args.scripts) - set(SCRIPTS)
+    if unknown:
+        parser.error(f"없는 스크립트: {', '.join(sorted(unknown))}")
+
+    results = {}
+    for script in args.scripts or SCRIPTS:
+        results[script] = run_script(script, args.cold_runs, args.warm_runs)
+        print(f"[측정] {script}: " + ", ".join(f"{k}={v:,}" for k, v in results[script].items()))
+
+    if args.save:
+        baseline = {"machine": machine(), "time": time.strftime("%Y-%m-%d %H:%M:%S"), "results": {}}
+        if os.path.exists(args.baseline):
+            with open(args.baseline, encoding="utf-8") as f:
+                baseline["results"] = json.load(f).get("results", {})
+        baseline["results"].update(results)
+        os.makedirs(os.path.dirname(args.baseline) or ".", exist_ok=True)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, ensure_ascii=False, indent=2)
+        print(f"기준값 저장: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"기준값이 없습니다 ({args.baseline}). --save 로 먼저 저장하세요.")
+        return 0
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    if baseline.get("machine") != machine():
+        print(f"[주의] 기준값을 잰 환경이 다릅니다: {baseline.get('machine')}")
+
+    regressions = compare(results, baseline, args.threshold)
+    for script, key, base, value, change in regressions:
+        print(f"[회귀] {script} {key}: {base:,} → {value:,} ({change:+.0%})")
+    if regressions:
+        return 1
+    print(f"회귀 없음 (기준 {args.threshold:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
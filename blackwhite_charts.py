@@ -0,0 +1,94 @@
+import numpy as np
+from matplotlib.ticker import FuncFormatter
+
+from chart_render import create_figure
+from profiling import lazy_import
+
+sns = lazy_import("seaborn")  # 팔레트 하나만 쓰므로 처음 그릴 때 불러온다.
+
+# ==============================================================================
+# [blackwhite.py 차트] 데이터 → Figure 를 돌려주는 함수만 모아 둔 곳
+# ------------------------------------------------------------------------------
+# 화면(Streamlit) 코드와 분리해 두어야 그림 캐시(figure_cache)가 입력 데이터로 키를 만들고,
+# 서버 없이도 같은 차트를 그릴 수 있다.
+# ==============================================================================
+
+STYLE = "whitegrid"
+
+
+def viral_trend(df_netflix):
+    # Chart 1. 넷플릭스 글로벌 흥행 성적
+    fig1, ax1 = create_figure("blackwhite.viral_trend", (10, 5), STYLE)
+
+    # 넷플릭스 레드 컬러 적용
+    ax1.plot(df_netflix['Week'], df_netflix['Hours_Viewed'], marker='o', color='#E50914', linewidth=3, label='주간 시청 시간')
+
+    # 영역 채우기
+    ax1.fill_between(df_netflix['Week'], df_netflix['Hours_Viewed'], color='#E50914', alpha=0.1)
+
+    # 최고점 주석
+    max_val = df_netflix['Hours_Viewed'].max()
+    max_idx = df_netflix['Hours_Viewed'].idxmax()
+    ax1.annotate(f'Global Peak\n(570만 시간)', xy=(max_idx, max_val), xytext=(0, 20),
+                 textcoords='offset points', ha='center', fontsize=11, fontweight='bold',
+                 arrowprops=dict(arrowstyle='->', color='black'))
+
+    ax1.set_title("주차별 글로벌 시청 시간 추이 (비영어권 TV)", fontsize=16, fontweight='bold', pad=20)
+    ax1.set_ylabel("시청 시간 (시간)", fontsize=12)
+    ax1.grid(True, linestyle='--', alpha=0.5)
+
+    # Y축 포맷 (천단위 콤마)
+    ax1.yaxis.set_major_formatter(FuncFormatter(lambda x, p: format(int(x), ',')))
+    return fig1
+
+
+def survival(df_survival):
+    # Chart 2. 흑수저 vs 백수저 생존 경쟁
+    fig2, ax2 = create_figure("blackwhite.survival", (10, 5), STYLE)
+
+    # 스택 바 차트 데이터 준비
+    r = np.arange(len(df_survival['Round']))
+    width = 0.5
+
+    # 흑수저(Dark Grey) vs 백수저(Light Grey/Silver)
+    p1 = ax2.bar(r, df_survival['Black_Spoon'], width, label='흑수저 (Black)', color='#333333', alpha=0.9)
+    p2 = ax2.bar(r, df_survival['White_Spoon'], width, bottom=df_survival['Black_Spoon'], label='백수저 (White)', color='#dcdcdc', edgecolor='black', alpha=0.9)
+
+    ax2.set_title("라운드별 흑/백 생존자 비율 변화", fontsize=16, fontweight='bold', pad=20)
+    ax2.set_xticks(r)
+    ax2.set_xticklabels(df_survival['Round'], fontweight='bold')
+    ax2.set_ylabel("생존 인원 (명)")
+    ax2.legend(loc='upper right', fontsize=12)
+
+    # 데이터 라벨 추가
+    ax2.bar_label(p1, label_type='center', color='white', fontweight='bold')
+    ax2.bar_label(p2, label_type='center', color='black', fontweight='bold')
+    return fig2
+
+
+def economic_impact(df_impact):
+    # Chart 3. 경제적 파급 효과 (식당 예약)
+    fig3, ax3 = create_figure("blackwhite.economic_impact", (8, 6), STYLE)
+
+    # 수평 막대 그래프
+    chefs = df_impact['Chef']
+    y_pos = np.arange(len(chefs))
+    performance = df_impact['Increase_Rate']
+
+    # 그라데이션 느낌의 컬러 팔레트
+    colors = sns.color_palette("Reds_r", len(chefs))
+
+    bars = ax3.barh(y_pos, performance, align='center', color=colors)
+    ax3.set_yticks(y_pos)
+    ax3.set_yticklabels(chefs, fontsize=12, fontweight='bold')
+    ax3.invert_yaxis()  # 1위가 맨 위로 오게
+    ax3.set_xlabel('예약/검색 증가율 (%)', fontsize=12)
+    ax3.set_title("방송 후 식당 예약 증가율 TOP 5", fontsize=16, fontweight='bold', pad=15)
+
+    # 수치 텍스트 추가
+    for i, v in enumerate(performance):
+        ax3.text(v + 100, i, f"+{v:,}%", color='black', va='center', fontweight='bold')
+
+    ax3.spines['right'].set_visible(False)
+    ax3.spines['top'].set_visible(False)
+    return fig3
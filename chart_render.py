@@ -0,0 +1,216 @@
+import os
+import io
+import threading
+import warnings
+import weakref
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+import matplotlib
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from fonts import DEFAULT_FONT, font_rc
+
+# ==============================================================================
+# [차트 렌더링 도우미] Figure 를 만들고, 그리고, 치우는 일을 한 곳에서 맡는다.
+# ------------------------------------------------------------------------------
+# 예전 스크립트들은 plt.subplots 로 만든 Figure 를 한 번도 닫지 않아서,
+# 며칠씩 떠 있는 Streamlit 서버에서는 pyplot 이 Figure 를 계속 쌓아 두고 메모리가 늘어났다.
+#   - create_figure() : Figure/Axes 생성 (+ 차트 종류별 스타일)
+#   - release()       : 다 쓴 Figure 정리. 풀(pool)을 켜면 비워서 같은 종류 차트에 재사용
+#   - render()        : 만들기 → 이미지 바이트로 저장 → 정리 를 한 번에
+#   - figure_stats()  : 살아 있는 Figure 수와 대략의 메모리. 누수 감시용
+# 풀 크기는 FIGURE_POOL_SIZE (차트 종류당, 기본 0 = 재사용 안 함)
+#
+# [스레드 안전] Streamlit 은 세션마다 스크립트를 다른 스레드에서 돌린다.
+# pyplot(plt.*) 은 '현재 Figure' 같은 전역 상태를 쓰므로 여기서는 pyplot 을 전혀 쓰지 않고
+# Figure + FigureCanvasAgg 로 직접 그린다. 스타일(rcParams)은 여전히 전역이라
+# 한 프로세스 안에서는 _render_lock 으로 '스타일 · 글꼴 적용 → Figure 만들기(build)' 만 묶는다.
+# 글꼴 · 스타일은 글자 · 눈금 객체가 만들어질 때 복사되므로, 만든 뒤의 그리기 · 저장(savefig)은
+# 잠금 밖에서 세션마다 동시에 돈다. (matplotlib 은 FreeType 글꼴 객체를 스레드마다 따로 둔다)
+#   - 그리기 도중에 처음 만들어지는 눈금은 첫 눈금을 복사하므로, build 직후 잠금 안에서 눈금을 미리 만들어 둔다.
+#   - 그리기 때 직접 읽히는 설정(DRAW_RC, 눈금 숫자의 마이너스 기호)은 모든 차트가 같은 값이라 전역으로 둔다.
+# 여러 프로세스로 나누고 싶으면 RENDER_WORKERS=N 으로 렌더링 전용 프로세스 풀을 켠다.
+# ==============================================================================
+
+POOL_SIZE = int(os.environ.get("FIGURE_POOL_SIZE", "0"))
+LEAK_WARN_FIGURES = int(os.environ.get("FIGURE_LEAK_WARN", "50"))
+RENDER_WORKERS = int(os.environ.get("RENDER_WORKERS", "0"))
+
+# st.pyplot 과 같은 기본값 (선명하고, 여백은 잘라냄)
+SAVEFIG_DEFAULTS = {"dpi": 200, "bbox_inches": "tight"}
+# 화면용 PNG 최대 폭(px). st.image 는 본문 최대 폭(1460px)보다 넓은 그림을 rerun 마다 풀어서 줄이고 다시 인코딩한다
+# (10인치 차트 한 장에 100ms 안팎). 처음 그릴 때 dpi 를 낮춰 이 폭 안에 맞춰 두면 그대로 보낸다. 0 이면 끔.
+# 화면에 보여주는 경로(figure_cache.cached_chart / st_chart)만 max_width 로 넘긴다.
+# render_local · 보고서(render_reports --dpi)는 부른 쪽이 준 dpi 그대로 저장한다.
+MAX_PNG_WIDTH = int(os.environ.get("CHART_MAX_WIDTH", "1460"))
+
+# 그리기 · 저장 때 읽히는 설정. 잠금 밖에서 그리므로 차트마다 바꾸지 않고 전역으로 한 번 정한다 (font_rc 와 같은 값).
+DRAW_RC = {"axes.unicode_minus": False}
+matplotlib.rcParams.update(DRAW_RC)
+
+_lock = threading.Lock()
+_render_lock = threading.RLock()  # rcParams 를 건드리는 구간 (스타일 · 글꼴 적용 ~ Figure 만들기)
+_pools = defaultdict(list)      # 차트 종류 → 비워 둔 Figure 목록
+_kinds = weakref.WeakKeyDictionary()  # Figure → 차트 종류 (풀에 돌려줄 곳)
+_live = weakref.WeakSet()       # 아직 살아 있는 Figure (누수 감시용)
+_counters = {"created": 0, "reused": 0, "released": 0, "pooled": 0}
+_executor = None
+
+
+def chart_style(style):
+    # sns.axes_style 은 font.family 를 'sans-serif' 로 덮어써서 한글이 깨진다.
+    # 지금 적용 중인 (한글) 글꼴은 그대로 두고 나머지 스타일만 적용한다.
+    import seaborn as sns
+    return sns.axes_style(style, rc={"font.family": matplotlib.rcParams["font.family"]})
+
+
+def _take_pooled(kind):
+    with _lock:
+        pool = _pools.get(kind)
+        if pool:
+            _counters["reused"] += 1
+            return pool.pop()
+    return None
+
+
+def create_figure(kind, figsize, style=None, nrows=1, ncols=1, **subplots_kw):
+    # kind: 차트 종류 이름 (풀을 나누는 기준). 나머지는 plt.subplots 와 같다.
+    # pyplot 에 등록되지 않는 Figure 라서 plt.close 없이도 참조가 없어지면 메모리가 풀린다.
+    fig = _take_pooled(kind) if POOL_SIZE > 0 else None
+    if fig is None:
+        fig = Figure(figsize=figsize)
+        FigureCanvasAgg(fig)
+        with _lock:
+            _counters["created"] += 1
+    else:
+        fig.set_size_inches(figsize)
+
+    # 스타일은 Axes 를 만드는 순간의 rcParams 로 정해지므로 잠근 채로 적용한다.
+    with _render_lock:
+        if style is not None:
+            with chart_style(style):
+                axes = fig.subplots(nrows, ncols, **subplots_kw)
+        else:
+            axes = fig.subplots(nrows, ncols, **subplots_kw)
+
+    with _lock:
+        _kinds[fig] = kind
+        _live.add(fig)
+        live = len(_live)
+    if live > LEAK_WARN_FIGURES:
+        warnings.warn(f"살아 있는 matplotlib Figure 가 {live}개입니다. release() 누락을 확인하세요.")
+    return fig, axes
+
+
+def release(fig):
+    # 다 쓴 Figure 정리: 풀에 자리가 있으면 비워서 보관, 아니면 비우고 놓아준다.
+    fig.clear()
+    with _lock:
+        kind = _kinds.pop(fig, None)
+        _live.discard(fig)
+        pool = _pools[kind] if kind is not None and POOL_SIZE > 0 else None
+        if pool is not None and len(pool) < POOL_SIZE:
+            fig.patch.set_alpha(1.0)
+            pool.append(fig)
+            _counters["pooled"] += 1
+        else:
+            _counters["released"] += 1
+
+
+def _fit_dpi(fig, options, max_width):
+    # bbox_inches="tight" 로 잘린 뒤의 폭(인치)을 구해서 max_width 를 넘지 않는 dpi
+    width = fig.get_figwidth()
+    if options.get("bbox_inches") == "tight":
+        pad = options.get("pad_inches", matplotlib.rcParams["savefig.pad_inches"])
+        width = fig.get_tightbbox(fig.canvas.get_renderer()).width + 2 * (pad if isinstance(pad, float) else 0.1)
+    return min(options["dpi"], (max_width - 8) / width)  # 반올림 · 여백으로 몇 px 늘어나는 것까지
+
+
+def render_figure(fig, fmt="png", max_width=0, **savefig_kw):
+    # max_width > 0 이면 PNG 폭이 그 안에 들도록 dpi 를 낮춘다 (화면용). 0 이면 savefig 옵션 그대로.
+    options = dict(SAVEFIG_DEFAULTS, **savefig_kw)
+    if fmt == "png" and max_width > 0:
+        options["dpi"] = _fit_dpi(fig, options, max_width)
+    buf = io.BytesIO()
+    fig.savefig(buf, format=fmt, **options)
+    return buf.getvalue()
+
+
+def _make_ticks(fig):
+    # 눈금 객체를 지금(글꼴 · 스타일이 적용된 채로) 만들어 둔다. 그리기 때 더 필요한 눈금은 이것을 복사한다.
+    for ax in fig.axes:
+        for axis in (ax.xaxis, ax.yaxis):
+            axis.get_major_ticks()
+            axis.get_minor_ticks()
+
+
+def _render_local(build, args, params, fmt, savefig_kw, font, max_width=0):
+    # build(*args, **params) 로 Figure 를 만들고 이미지 바이트로 바꾼 뒤 반드시 정리한다.
+    # 글꼴은 전역으로 바꾸지 않고, 이 그림을 만드는 동안에만 적용한다. 그리기 · 저장은 잠금 밖에서.
+    with _render_lock, matplotlib.rc_context(font_rc(font)):
+        fig = build(*args, **params)
+        try:
+            _make_ticks(fig)
+        except Exception:
+            release(fig)
+            raise
+    try:
+        return render_figure(fig, fmt, max_width, **(savefig_kw or {}))
+    finally:
+        release(fig)
+
+
+def _get_executor():
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(max_workers=RENDER_WORKERS)
+        return _executor
+
+
+def render_local(build, *args, fmt="png", savefig_kw=None, font=DEFAULT_FONT, **params):
+    # 렌더링 풀 설정과 상관없이 지금 프로세스에서 그린다 (이미 작업 프로세스 안일 때).
+    return _render_local(build, args, params, fmt, savefig_kw, font)
+
+
+def render(build, *args, fmt="png", savefig_kw=None, font=DEFAULT_FONT, max_width=0, **params):
+    # RENDER_WORKERS 가 0 이면 지금 스레드에서(잠금 아래) 그리고,
+    # 1 이상이면 렌더링 프로세스 풀로 보낸다. build 는 모듈 최상위 함수여야 한다(pickle).
+    # 렌더링 프로세스도 fonts 모듈로 같은 나눔고딕을 (디스크 캐시에서) 등록해서 쓴다.
+    if RENDER_WORKERS <= 0:
+        return _render_local(build, args, params, fmt, savefig_kw, font, max_width)
+    future = _get_executor().submit(_render_local, build, args, params, fmt, savefig_kw, font, max_width)
+    return future.result()
+
+
+def _figure_bytes(fig):
+    # RGBA 캔버스 기준 대략의 크기 (가로 x 세로 x 4바이트)
+    width, height = fig.get_size_inches() * fig.dpi
+    return int(width * height * 4)
+
+
+def _process_rss():
+    # 리눅스에서만: 현재 프로세스의 RSS (바이트). 다른 OS 는 None
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def figure_stats():
+    # 누수 감시용 숫자. live_figures 가 계속 오르면 어딘가 release() 가 빠진 것.
+    # (렌더링 프로세스 풀을 쓰면 그 프로세스들의 Figure 는 여기 잡히지 않는다)
+    with _lock:
+        figures = list(_live)
+        pooled = sum(len(pool) for pool in _pools.values())
+        stats = dict(_counters)
+    stats.update({
+        "live_figures": len(figures),
+        "pooled_figures": pooled,
+        "live_figure_bytes": sum(_figure_bytes(fig) for fig in figures),
+        "process_rss": _process_rss(),
+    })
+    return stats
@@ -0,0 +1,72 @@
+import pandas as pd
+
+# ==============================================================================
+# [대시보드 고정 데이터] 스크립트 안에 직접 적어 두던 표들
+# ------------------------------------------------------------------------------
+# blackwhite.py / AI.py / Trade.py 에 흩어져 있던 손으로 만든 데이터를 한 곳에 모았다.
+# Streamlit 없이 차트를 다시 그리는 render_reports.py 도 같은 데이터를 써야 하기 때문.
+# (pandas 만 쓰므로 불러와도 matplotlib 이 따라오지 않는다)
+# ==============================================================================
+
+
+# ------------------------------------------------------------------------------
+# 흑백요리사 (blackwhite.py) — 실제 통계 기반 재구성
+# ------------------------------------------------------------------------------
+def blackwhite_frames():
+    # 1. 넷플릭스 글로벌 시청 추이 (9월~10월)
+    df_netflix = pd.DataFrame({
+        'Week': ['9월 3주', '9월 4주', '10월 1주', '10월 2주', '10월 3주'],
+        'Hours_Viewed': [3800000, 4900000, 5700000, 4400000, 3100000], # 단위: 시간
+        'Rank': [1, 1, 1, 2, 3] # 글로벌 비영어권 TV 순위
+    })
+
+    # 2. 흑수저 vs 백수저 생존 경쟁 (라운드별 생존자 수)
+    # 1R(20vs20) -> 2R(11vs9 등) -> Top8(4vs4) -> Final(1vs1)
+    df_survival = pd.DataFrame({
+        'Round': ['2R(1:1대결)', '3R(팀전)', '4R(레스토랑)', '세미파이널(Top8)', '파이널(Top2)'],
+        'Black_Spoon': [11, 8, 4, 4, 1], # 흑수저 생존자
+        'White_Spoon': [9, 7, 4, 4, 1]   # 백수저 생존자
+    })
+
+    # 3. 파급력: 캐치테이블 식당 예약 증가율 (주요 출연자)
+    # 방송 후 예약/검색 증가폭 (보도자료 기반 가중치)
+    df_impact = pd.DataFrame({
+        'Chef': ['나폴리 맛피아', '철가방 요리사', '트리플 스타', '요리하는 돌아이', '이모카세 1호'],
+        'Increase_Rate': [4934, 2800, 2400, 1900, 1600], # 단위: %
+        'Spoon': ['Black', 'Black', 'Black', 'Black', 'Black'] # 화제성은 흑수저가 압도적
+    })
+    return df_netflix, df_survival, df_impact
+
+
+# ------------------------------------------------------------------------------
+# 4대 AI (AI.py)
+# ------------------------------------------------------------------------------
+AI_MODELS = {
+    'Gemini 2.0 (Google)': [9.9, 9.7, 10.0, 9.9, 9.0, 9.5],
+    'GPT-5 (OpenAI)':      [9.8, 9.9, 9.0, 9.6, 8.8, 8.5],
+    'Grok 4 (xAI)':        [9.2, 9.4, 8.5, 9.0, 10.0, 8.0],
+    'Claude 4 (Anthropic)':[9.9, 9.8, 9.2, 8.5, 8.5, 9.0]
+}
+AI_CATEGORIES = ['코딩', '추론', '문맥', '멀티모달', '속도', '에이전트']
+AI_COLORS = {'Gemini 2.0 (Google)': '#4285F4', 'GPT-5 (OpenAI)': '#10A37F',
+             'Grok 4 (xAI)': '#FFFFFF', 'Claude 4 (Anthropic)': '#D97757'}
+
+# 투자 정보
+AI_FINANCE = {
+    'AI Model': ['GPT-5 (OpenAI)', 'Gemini (DeepMind)', 'Grok (xAI)', 'Claude (Anthropic)'],
+    'Valuation ($B)': [250, 200, 80, 60],
+    'Backer': ['Microsoft', 'Alphabet', 'Elon Musk', 'Amazon'],
+    'Investment Focus': ['초지능(AGI) / B2B', '모바일 / 에이전트', '로봇 / 물리AI', 'AI 안전 / 코딩']
+}
+
+
+def ai_finance_frame():
+    return pd.DataFrame(AI_FINANCE)
+
+
+# ------------------------------------------------------------------------------
+# 무역 (Trade.py) — 권역별 수출 비중 목표치 (도넛 차트)
+# ------------------------------------------------------------------------------
+TRADE_REGIONS = ['중국', '미국', '아세안', 'EU', '중동', '기타']
+TRADE_REGION_SHARES = [26.5, 27.2, 18.0, 11.0, 7.3, 10.0]
+TRADE_REGION_EXPLODE = (0, 0.05, 0, 0, 0, 0) # 미국만 살짝 띄우기 강조
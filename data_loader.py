@@ -0,0 +1,190 @@
+import os
+import hashlib
+import threading
+import weakref
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+except ImportError:  # pyarrow 가 없으면 디스크 캐시 없이 CSV만 읽는다.
+    pa = None
+    feather = None
+
+# ==============================================================================
+# [데이터 로더] 원본 CSV는 한 번만 해석하고, 이후에는 열 단위(Arrow IPC) 사본을 쓴다.
+# ------------------------------------------------------------------------------
+# - 메모리 캐시 키 : (절대경로, 수정시각, 파일크기)  → 파일이 바뀌면 자동으로 다시 읽음
+# - 디스크 캐시    : .cache/tables/<키 해시>.arrow   → 새 프로세스는 memory-map 으로 바로 붙음
+# - 공유 데이터셋  : dataset_service.py 가 같은 원본을 공유 메모리에 올려 두었으면 복사 없이 그걸 씀
+#                    (DATASET_SHARED=0 이면 끔)
+# ==============================================================================
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_ROOT = os.path.join(BASE_DIR, ".cache")
+
+NTS_FILE = os.path.join(BASE_DIR, "국세청_근로소득 백분위(천분위) 자료_20241231.csv")
+
+TRADE_FILE = os.path.join(BASE_DIR, "trade_data.csv")
+
+# 국세청 천분위 파일의 열 타입 (구분만 문자열, 나머지는 전부 정수)
+NTS_LABEL_COLUMN = "구분"
+NTS_NUMERIC_COLUMNS = ["인원", "총급여", "근로소득금액", "소득공제액", "과세표준", "결정세액"]
+
+# K-stat 수출입 총괄표 (순번, 년도, 수출 금액/증감률, 수입 금액/증감률, 수지)
+# 저장 과정에서 헤더 한글이 깨져 있어서 헤더는 버리고 이름을 직접 붙인다.
+# 금액 단위는 천 달러, 증감률은 %.
+TRADE_COLUMNS = ["No", "Year", "Exports", "Export_Growth", "Imports", "Import_Growth", "Trade_Balance"]
+TRADE_DTYPES = {
+    "No": "int64", "Year": "string",
+    "Exports": "int64", "Export_Growth": "float64",
+    "Imports": "int64", "Import_Growth": "float64",
+    "Trade_Balance": "int64",
+}
+
+SHARED_DATASETS = os.environ.get("DATASET_SHARED", "1") not in ("", "0")
+
+_memory_cache = {}
+_derived_cache = {}
+_lock = threading.RLock()  # derived() 의 build 가 다시 derived() 를 부를 수 있음
+
+
+def cache_dir(name):
+    # .cache 아래에 용도별 폴더를 만들어서 돌려준다. (tables, figures, fonts ...)
+    path = os.path.join(CACHE_ROOT, name)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def file_signature(path):
+    # 경로 + 수정시각 + 크기. 내용이 바뀌면 이 값이 바뀐다.
+    stat = os.stat(path)
+    return (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+
+
+def parse_trade_csv(source, skiprows=1):
+    # "709,406,808" 같은 천 단위 쉼표는 C 파서가 thousands=',' 로 바로 숫자로 읽는다.
+    # source 는 경로 또는 파일 객체 (trade_refresh.py 가 새로 붙은 줄만 BytesIO 로 넘길 때는 skiprows=0)
+    df = pd.read_csv(source, encoding="cp949", encoding_errors="replace", header=None, skiprows=skiprows,
+                     names=TRADE_COLUMNS, dtype=TRADE_DTYPES, thousands=",")
+    return normalize_trade_frame(df)
+
+
+def normalize_trade_frame(df):
+    # '2025년' → 2025.  문자열 열 전체를 한 번에 잘라서 정수로 바꾼다. (셀마다 파이썬 처리 X)
+    df["Year"] = df["Year"].str.slice(0, 4).astype("int64")
+    # 월별 표면 연 · 월 순서로. 안정 정렬이라 같은 달의 줄(국가 · 품목)은 원본 순서를 지킨다
+    # (trade_refresh 가 예전 표와 앞부분을 비교하므로 순서가 실행마다 같아야 한다).
+    keys = ["Year", "Month"] if "Month" in df.columns else ["Year"]
+    return df.sort_values(keys, kind="stable", ignore_index=True)
+
+
+def _columnar_path(signature, kind):
+    digest = hashlib.sha1(repr((kind,) + signature).encode("utf-8")).hexdigest()[:16]
+    return os.path.join(cache_dir("tables"), f"{kind}-{digest}.arrow")
+
+
+def _parse_nts_csv(path):
+    dtypes = {col: "int64" for col in NTS_NUMERIC_COLUMNS}
+    dtypes[NTS_LABEL_COLUMN] = "string"
+    df = pd.read_csv(path, encoding="cp949", dtype=dtypes)
+    # ' 상위 2% ' 처럼 앞뒤 공백이 섞여 있어서 정리해 둔다.
+    df[NTS_LABEL_COLUMN] = df[NTS_LABEL_COLUMN].str.strip()
+    return df
+
+
+def _load_columnar(path, signature, kind, parse):
+    arrow_path = _columnar_path(signature, kind)
+
+    if feather is not None and os.path.exists(arrow_path):
+        # 콜드 스타트: 텍스트 해석 없이 Arrow 파일을 메모리 매핑해서 읽는다.
+        table = feather.read_table(arrow_path, memory_map=True)
+        return table.to_pandas()
+
+    df = parse(path)
+
+    if feather is not None:
+        # 다른 프로세스와 충돌하지 않도록 임시 파일에 쓴 뒤 이름을 바꾼다.
+        tmp_path = f"{arrow_path}.{os.getpid()}.tmp"
+        feather.write_feather(df, tmp_path, compression="uncompressed")
+        os.replace(tmp_path, arrow_path)
+    return df
+
+
+def _attach_shared(kind, signature):
+    # dataset_service.py 가 올린 같은 버전의 표 (없으면 None → 직접 읽음)
+    if not SHARED_DATASETS:
+        return None
+    import dataset_service
+    return dataset_service.attach(kind, signature)
+
+
+def load_table(path, kind, parse, columnar=True):
+    # 같은 파일(같은 서명)이면 프로세스 안에서는 딱 한 번만 읽는다.
+    # 파일이 바뀌면 (종류, 경로) 자리의 예전 표를 새 표로 덮어쓴다.
+    # 원본이 이미 열 단위 파일(Parquet 등)이면 columnar=False 로 Arrow 사본을 만들지 않는다.
+    signature = file_signature(path)
+    key = (kind, signature[0])
+
+    with _lock:
+        cached = _memory_cache.get(key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        df = _attach_shared(kind, signature)
+        if df is None:
+            df = _load_columnar(path, signature, kind, parse) if columnar else parse(path)
+        _memory_cache[key] = (signature, df)
+    return df
+
+
+def replace_table(path, kind, signature, df):
+    # 파일을 다시 읽지 않고 새 표를 넣어 둔다 (trade_refresh.py 가 붙은 줄만 읽어 이어 붙였을 때).
+    # 서명이 지금 파일과 같아야 다음 load_table 이 이 표를 돌려준다.
+    with _lock:
+        _memory_cache[(kind, signature[0])] = (signature, df)
+
+
+def load_nts_table(path=NTS_FILE):
+    # 국세청 근로소득 천분위 표. 모든 세션이 같은 DataFrame을 공유하므로 읽기 전용으로 쓴다.
+    return load_table(path, "nts", _parse_nts_csv)
+
+
+def load_trade_table(path=TRADE_FILE):
+    # 연도별 수출입 총괄표 (오래된 해 → 최근 해 순서, 금액 단위 천 달러)
+    return load_table(path, "trade", parse_trade_csv)
+
+
+def _trade_series(raw):
+    return pd.DataFrame({
+        "Date": pd.to_datetime(raw["Year"].astype("string"), format="%Y"),
+        "Exports": raw["Exports"].to_numpy() / 1e6,
+        "Imports": raw["Imports"].to_numpy() / 1e6,
+        "Trade_Balance": raw["Trade_Balance"].to_numpy() / 1e6,
+    })
+
+
+def trade_series(raw):
+    # 대시보드용 모양: 날짜 + 10억 달러 단위 금액. 원본 표마다 한 번만 만든다.
+    return derived(raw, "trade_series", _trade_series)
+
+
+def load_trade_series(path=TRADE_FILE):
+    # Trade.py 차트에 바로 넣는 표 (CSV 원본)
+    return trade_series(load_trade_table(path))
+
+
+def derived(df, name, build):
+    # 같은 DataFrame에서 파생된 객체(히스토그램 엔진, 백분위 인덱스 등)를 한 번만 만든다.
+    # DataFrame은 해시가 안 되므로 id로 찾고, 원본이 사라지면 파생 객체도 같이 지운다.
+    # build 결과가 df를 직접 붙잡고 있으면 영영 안 지워지므로 필요한 배열만 뽑아 둘 것.
+    key = id(df)
+    with _lock:
+        entry = _derived_cache.get(key)
+        if entry is None:
+            entry = {}
+            _derived_cache[key] = entry
+            weakref.finalize(df, _derived_cache.pop, key, None)
+        if name not in entry:
+            entry[name] = build(df)
+        return entry[name]
@@ -0,0 +1,196 @@
+import os
+import sys
+import json
+import time
+import glob
+import fcntl
+import hashlib
+import argparse
+import threading
+
+try:
+    import pyarrow as pa
+except ImportError:  # pyarrow 가 없으면 공유 없이 프로세스마다 읽는다 (attach 가 항상 None).
+    pa = None
+
+from data_loader import cache_dir
+
+# ==============================================================================
+# [공유 데이터셋] 한 컴퓨터의 여러 Streamlit 프로세스가 표 하나를 같은 메모리로 쓴다
+# ------------------------------------------------------------------------------
+# 대시보드를 여러 개(복제본) 띄우면 프로세스마다 국세청 천분위 표 · K-stat 표를 따로 들고 있었다.
+# 이 서비스가 표를 한 번만 읽어서 /dev/shm(메모리 위의 파일 시스템)에 Arrow IPC 파일로 올려 두면,
+# 각 프로세스는 그 파일을 memory-map 해서 복사 없이 DataFrame 으로 쓴다.
+# (숫자 열은 공유 메모리를 그대로 가리키는 읽기 전용 배열, 문자열 열은 Arrow 문자열)
+# → 프로세스를 늘려도 표가 차지하는 메모리는 한 벌.
+#
+#   python dataset_service.py                 → 지금 파일을 올리고 끝
+#   python dataset_service.py --watch         → 원본 파일이 바뀔 때마다 새 버전으로 바꿔 올림
+#   python dataset_service.py --status        → 올라가 있는 버전 보기
+#
+# - manifest.json : {종류: 버전 · 원본 서명 · 파일 이름}. 새 버전은 파일을 다 쓴 뒤 manifest 를
+#                   os.replace 로 한 번에 바꾼다. 읽는 쪽은 항상 완성된 버전만 본다.
+# - data_loader.load_table 이 원본 서명이 같은 버전이 있으면 여기서 붙고, 없으면 예전처럼 직접 읽는다.
+#   (서비스를 안 띄웠거나, 원본이 방금 바뀌어 아직 새 버전이 안 올라왔을 때)
+# - 이전 버전 파일은 하나만 남기고 지운다. 이미 붙어 있는 프로세스는 지워져도 계속 읽을 수 있다(리눅스 mmap).
+# ==============================================================================
+
+SHM_ROOT = "/dev/shm"
+SHM_DIR = os.environ.get("DATASET_SHM_DIR") or (
+    os.path.join(SHM_ROOT, f"dashboard-datasets-{os.getuid()}") if os.path.isdir(SHM_ROOT) else None)
+MANIFEST_NAME = "manifest.json"
+KEEP_VERSIONS = 2          # 지금 버전 + 바로 전 버전
+WATCH_INTERVAL = 5         # --watch 때 원본을 확인하는 간격(초)
+
+_attached = {}             # 종류 → (버전, DataFrame). 새 버전이 붙으면 예전 버전은 놓는다 (memory-map 해제).
+_lock = threading.Lock()
+
+
+def shared_dir():
+    # /dev/shm 이 없는 환경(맥 등)에서는 .cache/shm 에 둔다. 디스크 파일이어도 OS 페이지 캐시는 공유된다.
+    path = SHM_DIR or cache_dir("shm")
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def _manifest_path():
+    return os.path.join(shared_dir(), MANIFEST_NAME)
+
+
+def read_manifest():
+    try:
+        with open(_manifest_path(), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+# ------------------------------------------------------------------------------
+# 읽는 쪽 (대시보드 프로세스)
+# ------------------------------------------------------------------------------
+def attach(kind, signature):
+    # 원본 서명이 같은 버전이 올라가 있으면 복사 없이 DataFrame 으로 돌려준다. 없으면 None.
+    if pa is None:
+        return None
+    entry = read_manifest().get(kind)
+    if entry is None or tuple(entry["signature"]) != tuple(signature):
+        return None
+    with _lock:
+        version, df = _attached.get(kind, (None, None))
+        if version != entry["version"]:
+            try:
+                source = pa.memory_map(os.path.join(shared_dir(), entry["file"]))
+                table = pa.ipc.open_file(source).read_all()
+            except (OSError, pa.ArrowInvalid):
+                return None  # 막 지워진 옛 버전 등: 직접 읽게 한다
+            # split_blocks: 열끼리 하나의 2차원 블록으로 합치지 않아야 숫자 열이 복사 없이 붙는다.
+            df = table.to_pandas(split_blocks=True)
+            # 예전 버전 표는 여기서 놓는다. 아직 그 표를 쓰는 세션이 있으면 그 세션이 끝날 때 풀린다.
+            _attached[kind] = (entry["version"], df)
+    return df
+
+
+# ------------------------------------------------------------------------------
+# 올리는 쪽 (서비스)
+# ------------------------------------------------------------------------------
+def _nts():
+    from data_loader import NTS_FILE, file_signature, load_nts_table
+    return file_signature(NTS_FILE), load_nts_table()
+
+
+def _kstat():
+    from data_loader import file_signature
+    from kstat_import import import_workbook, load_kstat_table
+    return file_signature(import_workbook()), load_kstat_table()
+
+
+# 종류 이름은 data_loader.load_table(kind=...) 과 같아야 한다.
+DATASETS = {
+    "nts": _nts,
+    "kstat": _kstat,
+}
+
+
+def publish(kind, signature, df):
+    # 표를 새 버전으로 올린다. 같은 서명이 이미 올라가 있으면 그대로 둔다. 돌려주는 값: manifest 항목
+    directory = shared_dir()
+    with open(os.path.join(directory, ".lock"), "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)  # 서비스가 둘 떠도 manifest 를 번갈아 쓰도록
+        manifest = read_manifest()
+        entry = manifest.get(kind)
+        if entry is not None and tuple(entry["signature"]) == tuple(signature):
+            return entry
+
+        version = entry["version"] + 1 if entry else 1
+        digest = hashlib.sha1(repr(tuple(signature)).encode("utf-8")).hexdigest()[:12]
+        name = f"{kind}-v{version}-{digest}.arrow"
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        tmp = os.path.join(directory, f".{name}.{os.getpid()}.tmp")
+        with pa.OSFile(tmp, "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+        os.replace(tmp, os.path.join(directory, name))
+
+        manifest[kind] = dict(version=version, signature=list(signature), file=name,
+                              rows=table.num_rows, bytes=table.nbytes, published=time.time())
+        tmp = f"{_manifest_path()}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=1)
+        os.replace(tmp, _manifest_path())
+        _remove_old_versions(kind, version)
+        return manifest[kind]
+
+
+def _remove_old_versions(kind, version):
+    for path in glob.glob(os.path.join(shared_dir(), f"{kind}-v*-*.arrow")):
+        old = os.path.basename(path)[len(kind) + 2:].split("-", 1)[0]
+        if old.isdigit() and int(old) <= version - KEEP_VERSIONS:
+            os.remove(path)
+
+
+def publish_all(kinds=None):
+    # 원본을 (직접) 읽어서 올린다. 서비스 자신은 공유본에 붙지 않는다.
+    import data_loader
+    data_loader.SHARED_DATASETS = False
+
+    results = {}
+    for kind in kinds or DATASETS:
+        signature, df = DATASETS[kind]()
+        results[kind] = publish(kind, signature, df)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="대시보드 표를 공유 메모리(/dev/shm)에 올려 여러 프로세스가 같이 쓰게 합니다.")
+    parser.add_argument("kinds", nargs="*", help=f"올릴 표: {', '.join(DATASETS)} (기본: 전부)")
+    parser.add_argument("--watch", action="store_true", help="원본이 바뀔 때마다 새 버전으로 다시 올림")
+    parser.add_argument("--interval", type=float, default=WATCH_INTERVAL, help="--watch 확인 간격(초)")
+    parser.add_argument("--status", action="store_true", help="올라가 있는 버전만 출력")
+    args = parser.parse_args(argv)
+
+    if pa is None:
+        print("pyarrow 가 없어서 공유할 수 없습니다.")
+        return 1
+    unknown = set(args.kinds) - set(DATASETS)
+    if unknown:
+        parser.error(f"없는 표: {', '.join(sorted(unknown))}")
+
+    if not args.status:
+        versions = {}
+        while True:
+            for kind, entry in publish_all(args.kinds or None).items():
+                if versions.get(kind) != entry["version"]:
+                    versions[kind] = entry["version"]
+                    print(f"[올림] {kind} v{entry['version']}  {entry['rows']:,}행  "
+                          f"{entry['bytes'] / 1024:,.0f}KB  → {entry['file']}", flush=True)
+            if not args.watch:
+                break
+            time.sleep(args.interval)
+
+    print(f"공유 폴더: {shared_dir()}")
+    for kind, entry in read_manifest().items():
+        print(f"  {kind}: v{entry['version']} {entry['file']} (원본 {os.path.basename(entry['signature'][0])})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,174 @@
+import os
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from data_loader import derived
+from profiling import lazy_import, section
+
+# matplotlib 을 불러오는 두 모듈은 첫 화면이 아니라 첫 차트를 보여줄 때 불러온다.
+chart_render = lazy_import("chart_render")
+fonts = lazy_import("fonts")
+
+# ==============================================================================
+# [그림 캐시] 다 그려진 차트(PNG/SVG 바이트)를 세션끼리 나눠 쓴다.
+# ------------------------------------------------------------------------------
+# 대부분의 차트는 고정된 데이터로 그려지는데도, 매 세션 · 매 rerun 마다 matplotlib 이
+# 처음부터 다시 그렸다(st.pyplot). 여기서는
+#   키 = (차트 함수 이름, 입력 데이터 해시, 그리기 옵션, 형식)
+# 으로 렌더링 결과 바이트를 기억해 두고 st.image 로 보여준다.
+# 같은 차트를 다시 열면 딕셔너리 조회 한 번이면 끝난다.
+# - 메모리 상한(FIGURE_CACHE_MB, 기본 64MB)을 넘으면 가장 오래 안 쓴 그림부터 버린다(LRU).
+# - 모듈 전역 객체라서 한 프로세스 안의 모든 세션이 같은 캐시를 쓴다.
+# - 그림에 꼬리표(tags, 예: "trade:series")를 달아 두면, 데이터가 바뀌었을 때 invalidate(꼬리표)로
+#   그 데이터에 기대는 그림만 골라 버릴 수 있다 (trade_refresh.py). 나머지 그림은 그대로 남는다.
+# ==============================================================================
+
+DEFAULT_MAX_BYTES = int(float(os.environ.get("FIGURE_CACHE_MB", "64")) * 1024 * 1024)
+
+class FigureCache:
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._tags = {}  # 꼬리표 → 키 집합
+        self._key_tags = {}  # 키 → 꼬리표 집합 (LRU 로 버릴 때 꼬리표 쪽에서도 지우려고)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            data = self._entries.get(key)
+            if data is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return data
+
+    def _drop(self, key):
+        # 그림 하나를 꼬리표 색인까지 같이 지운다 (잠근 채로 부를 것). 있었으면 True
+        data = self._entries.pop(key, None)
+        if data is not None:
+            self._bytes -= len(data)
+        for tag in self._key_tags.pop(key, ()):
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+        return data is not None
+
+    def put(self, key, data, tags=()):
+        with self._lock:
+            self._drop(key)
+            if len(data) > self.max_bytes:
+                return  # 상한보다 큰 그림은 캐시하지 않는다.
+            self._entries[key] = data
+            self._bytes += len(data)
+            if tags:
+                self._key_tags[key] = set(tags)
+                for tag in tags:
+                    self._tags.setdefault(tag, set()).add(key)
+            while self._bytes > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+
+    def invalidate(self, *tags):
+        # 꼬리표가 붙은 그림을 모두 버린다. 돌려주는 값: 버린 개수
+        removed = 0
+        with self._lock:
+            for tag in tags:
+                for key in list(self._tags.get(tag, ())):
+                    removed += self._drop(key)
+        return removed
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._tags.clear()
+            self._key_tags.clear()
+            self._bytes = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "tags": {tag: len(keys) for tag, keys in self._tags.items()},
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+figure_cache = FigureCache()
+
+
+def _frame_hash(df):
+    values = pd.util.hash_pandas_object(df, index=True).to_numpy()
+    digest = hashlib.sha1(values.tobytes())
+    digest.update(repr(list(df.columns)).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _feed(digest, value):
+    # 입력값을 종류별로 해시에 넣는다. DataFrame 해시는 표마다 한 번만 계산해서 기억한다.
+    if isinstance(value, pd.DataFrame):
+        digest.update(derived(value, "content_hash", _frame_hash).encode("ascii"))
+    elif isinstance(value, pd.Series):
+        digest.update(_frame_hash(value.to_frame()).encode("ascii"))
+    elif isinstance(value, np.ndarray):
+        digest.update(repr((value.dtype.str, value.shape)).encode("utf-8"))
+        digest.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, dict):
+        for k in sorted(value, key=repr):
+            digest.update(repr(k).encode("utf-8"))
+            _feed(digest, value[k])
+    elif isinstance(value, (list, tuple)):
+        digest.update(f"{type(value).__name__}{len(value)}".encode("ascii"))
+        for item in value:
+            _feed(digest, item)
+    else:
+        digest.update(repr(value).encode("utf-8"))
+
+
+def data_key(*parts):
+    digest = hashlib.sha1()
+    for part in parts:
+        _feed(digest, part)
+    return digest.hexdigest()
+
+
+def cached_chart(build, *args, fmt="png", savefig_kw=None, font=None, tags=(), **params):
+    # build(*args, **params) 는 matplotlib Figure 를 돌려주는 함수.
+    # 같은 함수 + 같은 입력 + 같은 옵션이면 다시 그리지 않고 저장된 바이트를 돌려준다.
+    # tags 는 키에 들어가지 않고, 나중에 figure_cache.invalidate(꼬리표) 로 지울 때만 쓴다.
+    # 화면용이라 PNG 는 본문 폭(chart_render.MAX_PNG_WIDTH) 안에 들도록 그린다.
+    savefig_kw = savefig_kw or {}
+    font = font or fonts.DEFAULT_FONT
+    # 글꼴이 다른 그림끼리 섞이지 않도록 실제로 적용될 글꼴 설정도 키에 넣는다.
+    key = (build.__module__, build.__qualname__, fmt,
+           data_key(args, params, savefig_kw, fonts.font_rc(font), chart_render.MAX_PNG_WIDTH))
+    data = figure_cache.get(key)
+    if data is None:
+        # 그린 Figure 는 chart_render 가 바로 정리한다 (장기 실행 서버의 메모리 누수 방지).
+        data = chart_render.render(build, *args, fmt=fmt, savefig_kw=savefig_kw, font=font,
+                                   max_width=chart_render.MAX_PNG_WIDTH, **params)
+        figure_cache.put(key, data, tags)
+    return data
+
+
+def st_chart(build, *args, fmt="png", savefig_kw=None, font=None, tags=(), **params):
+    # st.pyplot(fig) 대신 쓰는 함수: 캐시된 그림을 st.image 로 보여준다.
+    # 프로파일 모드에서는 '그리기'(캐시에 없으면 matplotlib 렌더링)와 '보내기'(st.image 직렬화)를 따로 잰다.
+    import streamlit as st
+    with section(f"{build.__name__} 그리기"):
+        data = cached_chart(build, *args, fmt=fmt, savefig_kw=savefig_kw, font=font, tags=tags, **params)
+    with section(f"{build.__name__} 보내기"):
+        if fmt == "svg":
+            return st.image(data.decode("utf-8"), width="stretch")
+        return st.image(data, width="stretch")
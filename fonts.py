@@ -0,0 +1,168 @@
+import os
+import json
+import threading
+import dataclasses
+
+import matplotlib
+from matplotlib import font_manager as fm
+
+from data_loader import BASE_DIR, cache_dir, file_signature
+
+# ==============================================================================
+# [한글 폰트] 네 대시보드가 같이 쓰는 글꼴 준비 모듈
+# ------------------------------------------------------------------------------
+# 예전에는 스크립트마다 폰트 설정 함수를 따로 갖고 있었다.
+#   - 파일이 없으면 GitHub 에서 (타임아웃 없이) 내려받느라 첫 화면이 멈췄고,
+#   - 새 프로세스가 뜰 때마다 TTF 를 열어 fontManager 에 등록하고 rcParams 를 전역으로 바꿨다.
+#   - share.py 는 맥/윈도우 글꼴만 찾아서 리눅스 서버에서는 한글이 네모(□)로 나왔다.
+# 이제는
+#   1) 저장소에 들어 있는 나눔고딕 TTF 를 먼저 쓰고 (네트워크 안 씀),
+#   2) TTF 에서 읽은 글꼴 정보(FontEntry)를 .cache/fonts/font_entries.json 에 저장해 두었다가
+#      다음 프로세스부터는 TTF 를 열지 않고 그대로 등록하며,
+#   3) 전역 rcParams 대신 font_rc() 가 돌려주는 설정을 그림 하나하나에 적용한다(chart_render).
+# 파일이 없을 때만 백그라운드 스레드에서 내려받고, 그동안은 시스템 한글 글꼴로 버틴다.
+# ==============================================================================
+
+FONT_URL = "https://github.com/google/fonts/raw/main/ofl/nanumgothic/"
+FONT_FILES = {
+    # 이름: (저장소 파일, 내려받을 파일)
+    "regular": ("NanumGothic.ttf", "NanumGothic-Regular.ttf"),
+    "bold": ("NanumGothic-Bold.ttf", "NanumGothic-Bold.ttf"),
+    "extrabold": ("NanumGothic-ExtraBold.ttf", "NanumGothic-ExtraBold.ttf"),
+}
+# 글꼴 이름 → 본문 글자 굵기 (세 파일 모두 family 이름은 'NanumGothic', 굵기만 다르다)
+FONT_WEIGHTS = {"regular": 400, "bold": 700, "extrabold": 800}
+DEFAULT_FONT = "regular"
+
+# 나눔고딕이 없을 때 차례로 찾아볼 시스템 한글 글꼴
+FALLBACK_FAMILIES = ["NanumGothic", "Noto Sans CJK KR", "Noto Sans KR", "AppleGothic", "Malgun Gothic"]
+DOWNLOAD_TIMEOUT = 10  # 초
+
+ENTRY_CACHE = "font_entries.json"
+
+_lock = threading.Lock()
+_family = None          # 등록이 끝난 뒤의 한글 글꼴 family 이름 (없으면 "")
+_downloading = set()
+
+
+def font_path(name):
+    return os.path.join(BASE_DIR, FONT_FILES[name][0])
+
+
+def _cache_file():
+    return os.path.join(cache_dir("fonts"), ENTRY_CACHE)
+
+
+def _load_entry_cache():
+    try:
+        with open(_cache_file(), encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if cached.get("matplotlib") != matplotlib.__version__:
+        return {}  # FontEntry 모양이 바뀌었을 수 있으므로 버전이 다르면 새로 만든다.
+    return cached.get("fonts", {})
+
+
+def _save_entry_cache(fonts):
+    path = _cache_file()
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({"matplotlib": matplotlib.__version__, "fonts": fonts}, f, ensure_ascii=False)
+    os.replace(tmp, path)
+
+
+def _read_entries(path):
+    # TTF 를 직접 열어 FontEntry 목록을 만든다 (fontManager.addfont 와 같은 결과).
+    before = len(fm.fontManager.ttflist)
+    fm.fontManager.addfont(path)
+    return [dataclasses.asdict(entry) for entry in fm.fontManager.ttflist[before:]]
+
+
+def _register_files(paths):
+    # 캐시(JSON)에 있는 파일은 TTF 를 열지 않고 FontEntry 만 되살려 등록한다.
+    cached = _load_entry_cache()
+    known = {entry.fname for entry in fm.fontManager.ttflist}
+    updated = {}
+    changed = False
+    for path in paths:
+        signature = list(file_signature(path))
+        hit = cached.get(path)
+        if hit is not None and hit["signature"] == signature:
+            entries = hit["entries"]
+            if path not in known:
+                fm.fontManager.ttflist.extend(fm.FontEntry(**entry) for entry in entries)
+        else:
+            entries = _read_entries(path) if path not in known else [
+                dataclasses.asdict(entry) for entry in fm.fontManager.ttflist if entry.fname == path]
+            changed = True
+        updated[path] = {"signature": signature, "entries": entries}
+    # 글꼴 목록이 바뀌었으니 findfont 결과 캐시를 비운다 (addfont 가 하는 것과 같음).
+    fm.fontManager._findfont_cached.cache_clear()
+    if changed:
+        try:
+            _save_entry_cache(dict(cached, **updated))
+        except OSError:
+            pass  # 읽기 전용 디스크여도 그림은 그려야 한다.
+    return updated
+
+
+def _download(name):
+    # 저장소에 TTF 가 없을 때만: 백그라운드에서 내려받고, 끝나면 다음 그림부터 나눔고딕을 쓴다.
+    global _family
+    try:
+        import requests
+        response = requests.get(FONT_URL + FONT_FILES[name][1], timeout=DOWNLOAD_TIMEOUT)
+        response.raise_for_status()
+        path = font_path(name)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(response.content)
+        os.replace(tmp, path)
+        with _lock:
+            _register_files([path])
+            _family = None  # 다음 font_family() 호출 때 다시 고른다.
+    except Exception:
+        pass  # 오프라인이면 시스템 글꼴로 계속 간다.
+    finally:
+        with _lock:
+            _downloading.discard(name)
+
+
+def _pick_family():
+    available = {entry.name for entry in fm.fontManager.ttflist}
+    for family in FALLBACK_FAMILIES:
+        if family in available:
+            return family
+    return ""
+
+
+def register_fonts():
+    # 프로세스마다 한 번: 저장소 나눔고딕 등록 → 쓸 한글 글꼴 이름을 정한다.
+    global _family
+    with _lock:
+        if _family is not None:
+            return _family
+        present = [font_path(name) for name in FONT_FILES if os.path.exists(font_path(name))]
+        if present:
+            _register_files(present)
+        for name in FONT_FILES:
+            if not os.path.exists(font_path(name)) and name not in _downloading:
+                _downloading.add(name)
+                threading.Thread(target=_download, args=(name,), daemon=True).start()
+        _family = _pick_family()
+        return _family
+
+
+def font_family():
+    return register_fonts()
+
+
+def font_rc(name=DEFAULT_FONT):
+    # 그림 하나를 그릴 때 적용할 글꼴 설정 (matplotlib.rc_context 에 그대로 넣는다).
+    family = font_family()
+    return {
+        "font.family": [family] if family else ["DejaVu Sans"],  # 한글 글꼴이 하나도 없으면 기본 글꼴
+        "font.weight": FONT_WEIGHTS[name],
+        "axes.unicode_minus": False,  # 마이너스(-) 기호 깨짐 방지
+    }
@@ -0,0 +1,93 @@
+import numpy as np
+
+from data_loader import derived, load_nts_table
+from percentile_index import bracket_order
+
+# ==============================================================================
+# [불평등 지표] 로렌츠 곡선 · 지니계수 · 상위 1%/10% 점유율
+# ------------------------------------------------------------------------------
+# 국세청 천분위 표의 구간별 인원과 금액 합계만 있으면 된다.
+# 측정 항목(총급여 · 과세표준 · 결정세액)과 연도를 각각 배열의 축으로 쌓아서
+#   누적합 한 번 → 로렌츠 곡선
+#   사다리꼴 면적 한 번 → 지니계수
+#   보간 한 번 → 상위 p% 점유율
+# 로 모든 연도 · 모든 항목을 반복문 없이 한꺼번에 계산한다.
+# ==============================================================================
+
+MEASURES = {
+    "총급여": "소득 (총급여)",
+    "과세표준": "과세표준",
+    "결정세액": "세금 (결정세액)",
+}
+TOP_SHARES = (0.01, 0.10)
+
+
+class InequalityResult:
+    # 모든 배열의 첫 축은 연도(표), 마지막 축은 측정 항목(MEASURES 순서)
+    def __init__(self, measures, lorenz_x, lorenz_y, gini, top_share):
+        self.measures = measures    # ['총급여', '과세표준', '결정세액']
+        self.lorenz_x = lorenz_x    # (연도, 구간+1)       누적 인원 비율 (0 → 1)
+        self.lorenz_y = lorenz_y    # (연도, 구간+1, 항목) 누적 금액 비율 (0 → 1)
+        self.gini = gini            # (연도, 항목)
+        self.top_share = top_share  # {0.01: (연도, 항목), 0.10: (연도, 항목)}
+
+    def summary(self, year=0):
+        # 한 해치 결과를 표로 (항목별 지니계수 / 상위 1% / 상위 10% 점유율)
+        import pandas as pd
+        data = {"지니계수": self.gini[year]}
+        for p, share in self.top_share.items():
+            data[f"상위 {p * 100:g}% 점유율"] = share[year]
+        return pd.DataFrame(data, index=[MEASURES[m] for m in self.measures])
+
+
+def _stack(frames, measures):
+    # 같은 구간 구조의 표들을 (연도, 구간) / (연도, 구간, 항목) 배열로 쌓는다.
+    people, values = [], []
+    for df in frames:
+        # 구간 정렬 순서는 표마다 한 번만 구해 둔다. (문자열 해석이 제일 비싸다)
+        order, _ = derived(df, "bracket_order", bracket_order)
+        people.append(df["인원"].to_numpy(dtype=np.float64)[order])
+        values.append(df[measures].to_numpy(dtype=np.float64)[order])
+    return np.stack(people), np.stack(values)
+
+
+def _top_share(lorenz_x, lorenz_y, p):
+    # 상위 p 점유율 = 1 - L(1 - p).  연도마다 x 격자가 달라도 되도록 직접 선형 보간한다.
+    q = 1.0 - p
+    hi = (lorenz_x < q).sum(axis=1).clip(1, lorenz_x.shape[1] - 1)  # (연도,)
+    lo = hi - 1
+    x0 = np.take_along_axis(lorenz_x, lo[:, None], axis=1)
+    x1 = np.take_along_axis(lorenz_x, hi[:, None], axis=1)
+    y0 = np.take_along_axis(lorenz_y, lo[:, None, None], axis=1)[:, 0]
+    y1 = np.take_along_axis(lorenz_y, hi[:, None, None], axis=1)[:, 0]
+    t = (q - x0) / np.where(x1 > x0, x1 - x0, 1.0)
+    return 1.0 - (y0 + t * (y1 - y0))
+
+
+def inequality_many(frames, measures=tuple(MEASURES)):
+    # 여러 해의 표를 한 번에 계산한다. 구간 수가 다른 표가 섞여 있으면 나눠서 부를 것.
+    measures = list(measures)
+    people, values = _stack(frames, measures)
+
+    zeros = np.zeros((people.shape[0], 1))
+    cum_people = np.cumsum(people, axis=1)
+    lorenz_x = np.concatenate([zeros, cum_people / cum_people[:, -1:]], axis=1)
+
+    cum_values = np.cumsum(values, axis=1)
+    totals = cum_values[:, -1:, :]
+    lorenz_y = np.concatenate([np.zeros((values.shape[0], 1, values.shape[2])),
+                               cum_values / np.where(totals > 0, totals, 1.0)], axis=1)
+
+    # 지니 = 1 - Σ (x_k - x_{k-1}) (y_k + y_{k-1})
+    dx = np.diff(lorenz_x, axis=1)[:, :, None]
+    gini = 1.0 - (dx * (lorenz_y[:, 1:] + lorenz_y[:, :-1])).sum(axis=1)
+
+    top_share = {p: _top_share(lorenz_x, lorenz_y, p) for p in TOP_SHARES}
+    return InequalityResult(measures, lorenz_x, lorenz_y, gini, top_share)
+
+
+def inequality(df=None):
+    # 한 해치 표. 같은 표에 대해서는 한 번만 계산한다.
+    if df is None:
+        df = load_nts_table()
+    return derived(df, "inequality", lambda frame: inequality_many([frame]))
@@ -0,0 +1,234 @@
+import os
+import sys
+import json
+import glob
+import hashlib
+import argparse
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from data_loader import BASE_DIR, cache_dir, load_table, normalize_trade_frame
+
+# ==============================================================================
+# [K-stat 가져오기] 옛날 엑셀(.xls, OLE2) 내보내기 파일을 Parquet 으로 한 번만 바꿔 둔다.
+# ------------------------------------------------------------------------------
+# - .xls 해석은 느리므로 처음 보는 파일만 변환하고, 내용 해시(sha256)가 같으면 건너뛴다.
+# - 변환 결과는 .cache/kstat/<해시>-p<PARSE_VERSION>.parquet  (내용이 같은 파일은 한 번만 저장됨)
+#   해석 방법(열 이름 · 거르는 줄 · 정렬)을 바꾸면 PARSE_VERSION 을 올려서 예전 변환 결과를 쓰지 않게 한다.
+# - 폴더 하나를 통째로 넣으면 프로세스 풀로 여러 파일을 동시에 변환한다.
+#     python kstat_import.py ./downloads --workers 8
+# - Trade.py 는 엑셀을 직접 읽지 않고 변환된 Parquet 만 읽는다.
+# ==============================================================================
+
+KSTAT_FILE = os.path.join(BASE_DIR, "한국무역통계 총괄 - K-stat 수출입 무역통계.xls")
+MANIFEST_NAME = "manifest.json"
+PARSE_VERSION = 2
+
+# 두 줄짜리 헤더를 "위 아래" 로 합친 이름 → 표준 열 이름 (금액 단위: 천 달러)
+KSTAT_COLUMNS = {
+    "순번": "No",
+    "년도": "Year",
+    "년월": "Period",
+    "국가명": "Region",
+    "대륙명": "Continent",     # 국가명과 같이 있는 내보내기도 있어서 따로 둔다
+    "품목명": "Item",
+    "HS코드": "Item_Code",
+    "수출 금액": "Exports",
+    "수출 증감률": "Export_Growth",
+    "수입 금액": "Imports",
+    "수입 증감률": "Import_Growth",
+    "수지": "Trade_Balance",
+}
+AMOUNT_COLUMNS = ["Exports", "Imports", "Trade_Balance"]
+GROWTH_COLUMNS = ["Export_Growth", "Import_Growth"]
+
+_manifest_lock = threading.Lock()
+
+
+def content_hash(path, chunk_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _flatten_header(top, bottom):
+    # ('수출', '금액') → '수출 금액',  ('수지', '수지') → '수지'
+    top, bottom = str(top).strip(), str(bottom).strip()
+    if not bottom or bottom == top:
+        return top
+    return f"{top} {bottom}"
+
+
+def _to_number(col):
+    # 엑셀에 숫자로 들어 있으면 그대로, "1,234" 같은 문자열이면 열 전체를 한 번에 변환
+    if pd.api.types.is_numeric_dtype(col):
+        return col
+    return pd.to_numeric(col.astype("string").str.replace(",", "", regex=False), errors="coerce")
+
+
+def parse_workbook(path):
+    raw = pd.read_excel(path, header=None, dtype=object, engine="xlrd")
+
+    # 제목/조건 줄 다음에 '순번' 으로 시작하는 헤더가 한 줄 또는 두 줄 있다.
+    first_col = raw.iloc[:, 0].astype("string").str.strip()
+    header_row = int(first_col[first_col == "순번"].index[0])
+    two_rows = header_row + 1 < len(raw) and first_col.iloc[header_row + 1] == "순번"
+
+    top = raw.iloc[header_row]
+    bottom = raw.iloc[header_row + 1] if two_rows else top
+    names = [_flatten_header(t, b) for t, b in zip(top, bottom)]
+    df = raw.iloc[header_row + (2 if two_rows else 1):].reset_index(drop=True)
+    df.columns = [KSTAT_COLUMNS.get(name, name) for name in names]
+
+    # 연도별 표는 '2025년' 처럼 연도로 시작하는 줄, 월별 표는 '2025.01' 모양의 줄만 데이터
+    # (합계 줄, 월별 표 안의 '2025년' 연 소계 줄 등은 버림)
+    monthly = "Period" in df.columns
+    period = (df["Period"] if monthly else df["Year"]).astype("string").str.strip()
+    is_data = period.str.match(r"\d{4}\.\d{1,2}(?!\d)" if monthly else r"\d{4}").fillna(False).to_numpy(dtype=bool)
+    df = df[is_data].reset_index(drop=True)
+    period = period[is_data].reset_index(drop=True)
+
+    if monthly:
+        df["Period"] = period
+        df["Year"] = period
+        df["Month"] = period.str.extract(r"^\d{4}\.(\d{1,2})", expand=False).astype("int64")
+    else:
+        df["Year"] = period
+
+    # 금액 칸이 비었거나 '-' 이면 (올해처럼 아직 집계 전인 칸) 0 으로 본다.
+    for col in AMOUNT_COLUMNS:
+        if col in df.columns:
+            df[col] = _to_number(df[col]).fillna(0).astype("int64")
+    for col in GROWTH_COLUMNS:
+        if col in df.columns:
+            df[col] = _to_number(df[col]).astype("float64")
+    if "No" in df.columns:
+        df["No"] = _to_number(df["No"]).fillna(0).astype("int64")
+    for col in ("Region", "Continent", "Item", "Item_Code"):
+        if col in df.columns:
+            df[col] = df[col].astype("string").str.strip()
+
+    return normalize_trade_frame(df)
+
+
+def _manifest_path():
+    return os.path.join(cache_dir("kstat"), MANIFEST_NAME)
+
+
+def load_manifest():
+    path = _manifest_path()
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _save_manifest(manifest):
+    path = _manifest_path()
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=1)
+    os.replace(tmp_path, path)
+
+
+def _parquet_name(digest):
+    return f"{digest[:24]}-p{PARSE_VERSION}.parquet"
+
+
+def _convert_if_changed(path, known):
+    # 프로세스 풀에서 도는 부분: 해시를 구하고, 바뀐 파일만 Parquet 으로 변환한다.
+    # known: 매니페스트에 적혀 있던 정보 (처음 보는 파일이면 빈 dict)
+    stat = os.stat(path)
+    if (known.get("mtime_ns") == stat.st_mtime_ns and known.get("size") == stat.st_size
+            and known.get("parquet") == _parquet_name(known.get("sha256", ""))):
+        # 수정시각/크기가 그대로면 해시 계산도 건너뛴다. (화면을 다시 그릴 때마다 불리므로)
+        parquet_path = os.path.join(cache_dir("kstat"), known["parquet"])
+        if os.path.exists(parquet_path):
+            return path, known, parquet_path, False
+
+    digest = content_hash(path)
+    parquet_path = os.path.join(cache_dir("kstat"), _parquet_name(digest))
+    entry = {
+        "sha256": digest,
+        "parquet": os.path.basename(parquet_path),
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+    }
+    if not os.path.exists(parquet_path):
+        df = parse_workbook(path)
+        tmp_path = f"{parquet_path}.{os.getpid()}.tmp"
+        df.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, parquet_path)
+        return path, entry, parquet_path, True
+    # 내용이 같은 파일을 다시 받은 경우: 변환 없이 매니페스트만 고친다.
+    return path, entry, parquet_path, False
+
+
+def _record(manifest, results):
+    for path, entry, _, _ in results:
+        manifest[os.path.abspath(path)] = entry
+
+
+def import_paths(paths, workers=None):
+    # 엑셀 여러 개를 변환한다. 돌려주는 값: [(엑셀 경로, Parquet 경로, 이번에 변환했는지)]
+    paths = [os.path.abspath(p) for p in paths]
+    if not paths:
+        return []
+
+    with _manifest_lock:
+        manifest = load_manifest()
+        known = [manifest.get(p, {}) for p in paths]
+
+        if len(paths) == 1 or workers == 1:
+            results = [_convert_if_changed(p, k) for p, k in zip(paths, known)]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(_convert_if_changed, paths, known))
+
+        changed = [r for r, k in zip(results, known) if r[1] != k]
+        if changed:
+            _record(manifest, changed)
+            _save_manifest(manifest)
+    return [(path, parquet_path, converted) for path, _, parquet_path, converted in results]
+
+
+def import_directory(directory, workers=None, pattern="*.xls"):
+    # 폴더 안의 K-stat 엑셀을 모두 (프로세스 풀로 동시에) 변환한다.
+    return import_paths(sorted(glob.glob(os.path.join(directory, pattern))), workers)
+
+
+def import_workbook(path=KSTAT_FILE):
+    # 엑셀 한 개 → 변환된 Parquet 경로 (바뀌지 않았으면 변환 없이 바로 돌려줌)
+    return import_paths([path])[0][1]
+
+
+def load_kstat_table(path=KSTAT_FILE):
+    # Trade.py 가 쓰는 입구: 엑셀은 (필요할 때만) 변환하고, 읽는 건 항상 Parquet
+    parquet_path = import_workbook(path)
+    return load_table(parquet_path, "kstat", lambda p: pd.read_parquet(p, memory_map=True),
+                      columnar=False)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="K-stat .xls 내보내기 파일을 Parquet 으로 변환합니다.")
+    parser.add_argument("paths", nargs="*", default=[BASE_DIR], help="엑셀 파일 또는 폴더 (기본: 저장소 폴더)")
+    parser.add_argument("--workers", type=int, default=None, help="동시에 변환할 프로세스 수 (기본: CPU 수)")
+    args = parser.parse_args(argv)
+
+    for target in args.paths:
+        if os.path.isdir(target):
+            results = import_directory(target, workers=args.workers)
+        else:
+            results = import_paths([target])
+        for path, parquet_path, converted in results:
+            state = "변환" if converted else "건너뜀"
+            print(f"[{state}] {os.path.basename(path)} → {parquet_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
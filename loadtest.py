@@ -0,0 +1,290 @@
+import os
+import sys
+import json
+import time
+import random
+import socket
+import asyncio
+import argparse
+import subprocess
+import urllib.request
+
+import numpy as np
+
+# ==============================================================================
+# [부하 테스트] 대시보드 하나를 띄우고 가짜 브라우저 N개로 동시에 두드린다
+# ------------------------------------------------------------------------------
+# 브라우저와 똑같이 Streamlit 웹소켓(/_stcore/stream)에 붙어서 protobuf(BackMsg)를 보낸다.
+#   - 세션마다: rerun 요청 → script_finished 를 받을 때까지의 시간을 잰다
+#   - 화면에 나온 위젯(selectbox · slider · number_input)을 골라 값을 바꿔서 보낸다
+#     (위젯이 fragment 안에 있으면 브라우저처럼 그 fragment 만 다시 실행해 달라고 보냄)
+#   - 서버 프로세스의 메모리(RSS)를 주기적으로 기록한다
+# 끝나면 p50/p95/p99 지연, 초당 처리량, RSS 변화를 출력한다. 외부 서비스는 필요 없다.
+#
+#   python loadtest.py share.py --sessions 20 --duration 60
+#   python loadtest.py Trade.py --sessions 50 --env RENDER_WORKERS=2 --json out.json
+#   python loadtest.py share.py --url ws://127.0.0.1:8501   → 이미 떠 있는 서버에 붙기
+#
+# 부하를 만드는 쪽도 같은 컴퓨터의 CPU 를 쓰므로, 절대값보다 설정끼리 비교하는 데 쓴다.
+# ==============================================================================
+
+WIDGET_TYPES = ("selectbox", "slider", "number_input")
+FINISHED = {"FINISHED_SUCCESSFULLY", "FINISHED_FRAGMENT_RUN_SUCCESSFULLY", "FINISHED_WITH_COMPILE_ERROR"}
+
+
+# ------------------------------------------------------------------------------
+# 서버 띄우기 · 메모리 재기
+# ------------------------------------------------------------------------------
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(script, port, env_overrides, timeout=90):
+    env = dict(os.environ, **env_overrides)
+    cmd = [sys.executable, "-m", "streamlit", "run", script,
+           "--server.headless", "true", "--server.port", str(port), "--server.address", "127.0.0.1",
+           "--server.fileWatcherType", "none", "--browser.gatherUsageStats", "false"]
+    proc = subprocess.Popen(cmd, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"서버가 바로 종료되었습니다 (코드 {proc.returncode})")
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1) as r:
+                if r.status == 200:
+                    return proc
+        except OSError:
+            time.sleep(0.3)
+    proc.terminate()
+    raise RuntimeError("서버가 제시간에 뜨지 않았습니다")
+
+
+def _children(pid):
+    try:
+        with open(f"/proc/{pid}/task/{pid}/children") as f:
+            return [int(child) for child in f.read().split()]
+    except OSError:
+        return []
+
+
+def rss_mb(pid):
+    # 서버와 그 자식 프로세스(렌더링 풀 등)의 RSS 합
+    total = 0
+    for p in [pid] + _children(pid):
+        try:
+            with open(f"/proc/{p}/status") as f:
+                for line in f:
+                    if line.startswith("VmRSS:"):
+                        total += int(line.split()[1])
+        except OSError:
+            pass
+    return total / 1024
+
+
+async def sample_rss(pid, samples, start, interval=0.5):
+    while True:
+        samples.append((round(time.perf_counter() - start, 2), round(rss_mb(pid), 1)))
+        await asyncio.sleep(interval)
+
+
+# ------------------------------------------------------------------------------
+# 가짜 브라우저 세션
+# ------------------------------------------------------------------------------
+def _widget_state(element, rng):
+    # 위젯 값을 임의로 하나 골라 WidgetState 로 만든다 (프런트엔드가 보내는 것과 같은 모양).
+    from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+    kind = element.WhichOneof("type")
+    proto = getattr(element, kind)
+    state = WidgetState(id=proto.id)
+    if kind == "selectbox":
+        if not proto.options:
+            return None
+        state.string_value = rng.choice(list(proto.options))
+    elif kind == "slider":
+        if proto.options or len(proto.default) != 1:
+            return None  # select_slider · 범위 슬라이더는 건너뜀
+        steps = int((proto.max - proto.min) / proto.step) if proto.step else 0
+        state.double_array_value.data[:] = [proto.min + rng.randint(0, steps) * proto.step]
+    else:  # number_input
+        low = proto.min if proto.has_min else 0
+        high = proto.max if proto.has_max else max(low + 100 * (proto.step or 1), proto.default * 2)
+        step = proto.step or 1
+        state.double_value = low + rng.randint(0, int((high - low) / step)) * step
+    return state
+
+
+class Session:
+    def __init__(self, url, rng):
+        self.url = url
+        self.rng = rng
+        self.widgets = {}          # 위젯 id → (Element, fragment_id)
+        self.states = {}           # 지금까지 바꾼 위젯 값
+        self.page_script_hash = ""
+        self.ws = None
+
+    async def connect(self):
+        from websockets.asyncio.client import connect
+
+        self.ws = await connect(self.url, subprotocols=["streamlit"], max_size=None,
+                                open_timeout=30, ping_interval=None)
+
+    async def rerun(self, fragment_id=""):
+        from streamlit.proto.BackMsg_pb2 import BackMsg
+        from streamlit.proto.ClientState_pb2 import ClientState
+        from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+        state = ClientState(query_string="", page_script_hash=self.page_script_hash, fragment_id=fragment_id)
+        state.widget_states.widgets.extend(self.states.values())
+        start = time.perf_counter()
+        failed = False  # 스크립트가 예외를 내도 Streamlit 은 FINISHED_SUCCESSFULLY 로 끝내고 예외 요소만 보낸다
+        await self.ws.send(BackMsg(rerun_script=state).SerializeToString())
+        while True:
+            msg = ForwardMsg()
+            msg.ParseFromString(await self.ws.recv())
+            kind = msg.WhichOneof("type")
+            if kind == "new_session":
+                self.page_script_hash = msg.new_session.page_script_hash
+            elif kind == "delta" and msg.delta.WhichOneof("type") == "new_element":
+                element = msg.delta.new_element
+                if element.WhichOneof("type") == "exception":
+                    failed = True
+                elif element.WhichOneof("type") in WIDGET_TYPES:
+                    proto = getattr(element, element.WhichOneof("type"))
+                    self.widgets[proto.id] = (element, msg.delta.fragment_id)
+            elif kind == "script_finished":
+                status = ForwardMsg.ScriptFinishedStatus.Name(msg.script_finished)
+                if status in FINISHED:
+                    return time.perf_counter() - start, status != "FINISHED_WITH_COMPILE_ERROR" and not failed
+
+    async def change_widget(self):
+        # 화면의 위젯 하나를 골라 값을 바꾸고 다시 실행. 위젯이 없으면 그냥 rerun.
+        candidates = list(self.widgets.values())
+        self.rng.shuffle(candidates)
+        for element, fragment_id in candidates:
+            state = _widget_state(element, self.rng)
+            if state is not None:
+                self.states[state.id] = state
+                return await self.rerun(fragment_id)
+        return await self.rerun()
+
+    async def close(self):
+        if self.ws is not None:
+            await self.ws.close()
+
+
+async def run_session(index, url, deadline, results, widget_ratio, think, ramp):
+    rng = random.Random(index)
+    await asyncio.sleep(ramp * index)
+    session = Session(url, rng)
+    try:
+        await session.connect()
+        seconds, ok = await session.rerun()
+        results.append(dict(session=index, kind="first", seconds=seconds, ok=ok, time=time.time()))
+        while time.perf_counter() < deadline:
+            await asyncio.sleep(rng.uniform(0, 2 * think) if think else 0)
+            if rng.random() < widget_ratio:
+                kind, (seconds, ok) = "widget", await session.change_widget()
+            else:
+                kind, (seconds, ok) = "rerun", await session.rerun()
+            results.append(dict(session=index, kind=kind, seconds=seconds, ok=ok, time=time.time()))
+    except Exception as e:
+        results.append(dict(session=index, kind="error", seconds=0.0, ok=False, time=time.time(), error=repr(e)))
+    finally:
+        await session.close()
+
+
+# ------------------------------------------------------------------------------
+# 모으기 · 출력
+# ------------------------------------------------------------------------------
+def summarize(results, elapsed):
+    summary = {}
+    for kind in ("first", "rerun", "widget", "all"):
+        rows = [r for r in results if r["ok"] and (kind == "all" and r["kind"] != "error" or r["kind"] == kind)]
+        if not rows:
+            continue
+        ms = np.array([r["seconds"] for r in rows]) * 1000
+        p50, p95, p99 = np.percentile(ms, [50, 95, 99])
+        summary[kind] = dict(count=len(rows), p50_ms=round(p50, 1), p95_ms=round(p95, 1),
+                             p99_ms=round(p99, 1), max_ms=round(ms.max(), 1))
+    done = sum(1 for r in results if r["ok"])
+    summary["throughput_per_s"] = round(done / elapsed, 2) if elapsed else 0
+    summary["errors"] = sum(1 for r in results if not r["ok"])
+    return summary
+
+
+async def load(url, sessions, duration, widget_ratio, think, ramp, server_pid=None):
+    results, rss = [], []
+    start = time.perf_counter()
+    deadline = start + ramp * sessions + duration
+    sampler = asyncio.create_task(sample_rss(server_pid, rss, start)) if server_pid else None
+    await asyncio.gather(*(run_session(i, url, deadline, results, widget_ratio, think, ramp)
+                           for i in range(sessions)))
+    if sampler is not None:
+        sampler.cancel()
+    return results, rss, time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Streamlit 대시보드 동시 접속 부하 테스트 (웹소켓 프로토콜 직접 사용)")
+    parser.add_argument("script", help="띄울 스크립트 (예: share.py)")
+    parser.add_argument("--sessions", type=int, default=10, help="동시 세션 수 (기본: 10)")
+    parser.add_argument("--duration", type=float, default=30, help="모든 세션이 붙은 뒤 두드릴 시간(초) (기본: 30)")
+    parser.add_argument("--widget-ratio", type=float, default=0.5, help="위젯 변경 비율, 나머지는 rerun (기본: 0.5)")
+    parser.add_argument("--think", type=float, default=0.5, help="요청 사이 평균 대기(초) (기본: 0.5)")
+    parser.add_argument("--ramp", type=float, default=0.1, help="세션을 하나씩 붙이는 간격(초) (기본: 0.1)")
+    parser.add_argument("--env", action="append", default=[], metavar="KEY=VALUE",
+                        help="서버 환경 변수 (여러 번 가능, 예: --env RENDER_WORKERS=2)")
+    parser.add_argument("--url", help="이미 떠 있는 서버 주소 (예: ws://127.0.0.1:8501) — 이때는 서버를 띄우지 않음")
+    parser.add_argument("--json", help="결과(요약 · 요청별 기록 · RSS)를 저장할 JSON 경로")
+    args = parser.parse_args(argv)
+
+    env = {}
+    for item in args.env:
+        key, sep, value = item.partition("=")
+        if not sep:
+            parser.error(f"--env 는 KEY=VALUE 형식이어야 합니다: {item}")
+        env[key] = value
+
+    server = None
+    if args.url:
+        url = args.url.rstrip("/") + "/_stcore/stream"
+    else:
+        port = free_port()
+        print(f"[서버] streamlit run {args.script} (포트 {port}) ...")
+        server = start_server(args.script, port, env)
+        url = f"ws://127.0.0.1:{port}/_stcore/stream"
+    try:
+        print(f"[부하] 세션 {args.sessions}개, {args.duration:.0f}초")
+        results, rss, elapsed = asyncio.run(load(url, args.sessions, args.duration, args.widget_ratio,
+                                                 args.think, args.ramp, server.pid if server else None))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=30)
+
+    summary = summarize(results, elapsed)
+    print(f"{'종류':8}{'횟수':>8}{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}  (ms)")
+    for kind in ("first", "rerun", "widget", "all"):
+        if kind in summary:
+            s = summary[kind]
+            print(f"{kind:8}{s['count']:>8}{s['p50_ms']:>10,.0f}{s['p95_ms']:>10,.0f}{s['p99_ms']:>10,.0f}{s['max_ms']:>10,.0f}")
+    print(f"처리량 {summary['throughput_per_s']}/초, 오류 {summary['errors']}건")
+    if rss:
+        print(f"서버 RSS: 시작 {rss[0][1]:,.0f}MB → 최고 {max(r for _, r in rss):,.0f}MB → 끝 {rss[-1][1]:,.0f}MB")
+    errors = [r["error"] for r in results if r["kind"] == "error"]
+    if errors:
+        print(f"첫 오류: {errors[0]}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(dict(script=args.script, sessions=args.sessions, duration=args.duration, env=env,
+                           summary=summary, rss=rss, requests=results), f, ensure_ascii=False, indent=1)
+        print(f"저장: {args.json}")
+    return 1 if summary["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
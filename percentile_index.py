@@ -0,0 +1,105 @@
+import numpy as np
+
+from data_loader import NTS_LABEL_COLUMN, derived, load_nts_table
+
+# ==============================================================================
+# [백분위 조회 인덱스] "총급여 N 만원이면 상위 몇 %? 평균 세금은?" 을 한 번에 답한다.
+# ------------------------------------------------------------------------------
+# 국세청 표는 소득이 높은 구간부터 (상위 0.1% → 상위 100%) 정리되어 있고,
+# 각 행에는 구간 전체의 인원과 금액 합계(억 원)가 들어 있다.
+#   1) 행을 소득 오름차순으로 뒤집어 1인당 평균 총급여/결정세액을 만든다.
+#   2) 이웃한 구간 평균의 중간값을 구간 경계로 삼고, 경계마다 "상위 몇 %" 를 누적 인원으로 구한다.
+#   3) 조회는 np.searchsorted(구간 찾기) + np.interp(연속 추정) 한 번씩이라 수천 건도 마이크로초 단위.
+# ==============================================================================
+
+WON_PER_EOK = 1e8     # 표의 금액 단위: 억 원
+WON_PER_MANWON = 1e4  # 조회 단위: 만 원
+
+
+class PercentileLookup:
+    # 조회 결과 (입력한 소득 개수만큼의 배열)
+    def __init__(self, income, label, bracket_top, top_share, avg_income, avg_tax, tax_rate):
+        self.income = income            # 조회한 총급여 (만 원)
+        self.label = label              # 속한 구간 이름 (예: '상위 0.3%')
+        self.bracket_top = bracket_top  # 속한 구간의 상한 (상위 %, 예: 0.3)
+        self.top_share = top_share      # 누적 인원으로 보간한 연속 추정치 (상위 %)
+        self.avg_income = avg_income    # 그 구간의 1인당 평균 총급여 (만 원)
+        self.avg_tax = avg_tax          # 그 구간의 1인당 평균 결정세액 (만 원)
+        self.tax_rate = tax_rate        # 그 구간의 실효세율 (결정세액 / 총급여)
+
+    def to_frame(self):
+        import pandas as pd
+        return pd.DataFrame({
+            "총급여(만원)": self.income,
+            "구분": self.label,
+            "추정 상위(%)": self.top_share,
+            "구간 평균 총급여(만원)": self.avg_income,
+            "구간 평균 결정세액(만원)": self.avg_tax,
+            "실효세율": self.tax_rate,
+        })
+
+
+def bracket_order(df):
+    # '상위 0.3%' → 0.3  (구간이 덮는 상위 비율의 끝)
+    # 소득 오름차순(= 상위 비율 내림차순)으로 행을 늘어놓는 순서와 그 상위 % 를 돌려준다.
+    tops = df[NTS_LABEL_COLUMN].str.extract(r"([\d.]+)")[0].astype(float).to_numpy()
+    order = np.argsort(-tops, kind="stable")
+    return order, tops
+
+
+class PercentileIndex:
+    def __init__(self, df):
+        people = df["인원"].to_numpy(dtype=np.float64)
+
+        # 소득 오름차순(= 상위 비율 내림차순)으로 정렬해 둔다.
+        order, tops = bracket_order(df)
+        self.labels = df[NTS_LABEL_COLUMN].to_numpy(dtype=object)[order]
+        self.bracket_tops = tops[order]
+        people = people[order]
+
+        self.avg_income = df["총급여"].to_numpy(dtype=np.float64)[order] * (WON_PER_EOK / WON_PER_MANWON) / people
+        self.avg_tax = df["결정세액"].to_numpy(dtype=np.float64)[order] * (WON_PER_EOK / WON_PER_MANWON) / people
+        self.tax_rate = np.divide(self.avg_tax, self.avg_income,
+                                  out=np.zeros_like(self.avg_tax), where=self.avg_income > 0)
+
+        # 이웃 구간 평균의 중간값을 경계로 쓴다. (구간 i 와 i+1 사이 = boundaries[i])
+        self.boundaries = (self.avg_income[:-1] + self.avg_income[1:]) / 2
+
+        # 경계 위쪽(더 잘 버는 쪽)에 있는 인원 비율 = 그 경계의 "상위 %"
+        above = np.cumsum(people[::-1])[::-1]
+        self.boundary_top = above[1:] / people.sum() * 100
+
+    def __len__(self):
+        return self.labels.size
+
+    def bracket(self, incomes):
+        # 각 소득이 속한 구간 번호 (오름차순 기준)
+        return np.searchsorted(self.boundaries, incomes, side="right")
+
+    def lookup(self, incomes):
+        # incomes: 총급여(만 원) 한 개 또는 배열
+        incomes = np.atleast_1d(np.asarray(incomes, dtype=np.float64))
+        idx = self.bracket(incomes)
+        # 경계 바깥은 맨 끝 구간의 상위 % 로 고정된다. (0 이나 100 으로 튀지 않게)
+        top_share = np.interp(incomes, self.boundaries, self.boundary_top)
+        return PercentileLookup(
+            income=incomes,
+            label=self.labels[idx],
+            bracket_top=self.bracket_tops[idx],
+            top_share=top_share,
+            avg_income=self.avg_income[idx],
+            avg_tax=self.avg_tax[idx],
+            tax_rate=self.tax_rate[idx],
+        )
+
+
+def percentile_index(df=None):
+    # 같은 표에 대해서는 인덱스를 한 번만 만든다.
+    if df is None:
+        df = load_nts_table()
+    return derived(df, "percentile_index", PercentileIndex)
+
+
+def lookup_income(incomes, df=None):
+    # 파이썬에서 바로 쓰는 조회 함수: lookup_income([3500, 8000, 15000]).to_frame()
+    return percentile_index(df).lookup(incomes)
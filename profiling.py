@@ -0,0 +1,451 @@
+import os
+import sys
+import html
+import json
+import time
+import atexit
+import argparse
+import importlib
+import threading
+import itertools
+import tracemalloc
+import types
+import functools
+from collections import deque
+from contextlib import contextmanager
+
+# ==============================================================================
+# [프로파일링] 대시보드가 어디서 시간을 쓰는지 재는 도구 + 무거운 모듈 늦게 불러오기
+# ------------------------------------------------------------------------------
+# DASHBOARD_PROFILE=1 로 실행하면 켜진다 (꺼져 있으면 아무것도 기록하지 않음).
+#   - import 시간 : 처음 import 되는 최상위 패키지마다 걸린 시간 (하위 모듈 포함 누적)
+#   - 구간 시간   : with section("Chart 1"): ... 로 감싼 부분의 시간. 프로세스에서 처음인지(first)도 기록
+#   - 첫 화면     : begin() 부터 first_paint() 까지 = 세션이 열리고 첫 내용이 보이기까지
+#   구간마다 벽시계 시간(seconds)과 그 스레드의 CPU 시간(cpu_seconds)을 같이 남긴다.
+#   DASHBOARD_TRACEMALLOC=1 이면 구간에서 늘어난 메모리(alloc_bytes)와 최고치(peak_bytes)도 잰다.
+#   (tracemalloc 은 느리고 프로세스 전체를 보므로, 세션이 여럿 동시에 돌면 서로 섞인다)
+# 결과는 사이드바(st_report)에서 보고, 프로세스가 끝날 때 .cache/profile/ 에 JSON 으로 남는다.
+# 메모리에는 최근 DASHBOARD_PROFILE_RECORDS 줄(기본 20,000)만 둔다 (오래 떠 있는 서버에서도 늘지 않게).
+#   DASHBOARD_OVERLAY=1                       → 기록을 켜고 화면 구석에 이번 실행의 구간표를 띄움
+#   주소 뒤 ?debug=1                          → 프로파일이 꺼져 있어도 그 실행만 기록해서 구간표를 띄움
+#   DASHBOARD_METRICS_JSONL=경로              → 기록할 때마다 한 줄씩 JSON 으로 덧붙임
+#   python profiling.py                       → 남은 JSON 들을 모아 표로 출력
+#   python profiling.py --format prom         → Prometheus 텍스트 형식으로 출력 (jsonl 도 가능)
+#
+# @fragment("분포 그래프") 는 st.fragment 와 같다. 그 안의 위젯을 바꾸면 그 부분만 다시 실행되고,
+# 실행마다 걸린 시간을 (전체 실행인지 그 부분만 다시 돈 것인지와 함께) 기록한다.
+#
+# lazy_import("seaborn") 은 모듈 대신 '대리 객체'를 돌려주고, 속성을 처음 쓸 때 진짜로 import 한다.
+# 팔레트 하나 쓰려고 seaborn 을, 차트를 그리기도 전에 matplotlib 을 불러오던 시간을 첫 화면 뒤로 미룬다.
+# (여러 세션 스레드가 동시에 건드려도 한 번만 import 되도록 잠금을 건다.)
+# DASHBOARD_LAZY=0 이면 바로 import 한다 (비교용).
+# ==============================================================================
+
+OVERLAY = os.environ.get("DASHBOARD_OVERLAY", "0") not in ("", "0")
+ENABLED = os.environ.get("DASHBOARD_PROFILE", "0") not in ("", "0") or OVERLAY  # 구간표를 띄우려면 기록해야 함
+LAZY = os.environ.get("DASHBOARD_LAZY", "1") not in ("", "0")
+TRACE_MEMORY = ENABLED and os.environ.get("DASHBOARD_TRACEMALLOC", "0") not in ("", "0")
+METRICS_JSONL = os.environ.get("DASHBOARD_METRICS_JSONL", "") if ENABLED else ""
+MAX_RECORDS = int(os.environ.get("DASHBOARD_PROFILE_RECORDS", "20000"))
+
+_lock = threading.RLock()
+_local = threading.local()      # 세션 스레드마다 지금 실행 중인 스크립트 정보
+_records = deque(maxlen=MAX_RECORDS)  # 넘치면 가장 오래된 줄부터 버린다
+_seen = set()                   # (script, kind, name) — 프로세스에서 처음 재는 구간인지 판단용
+_started = time.perf_counter()
+_run_ids = itertools.count(1)
+
+if TRACE_MEMORY and not tracemalloc.is_tracing():
+    tracemalloc.start()
+
+
+def _active():
+    # 기록할지: 프로파일이 켜져 있거나, 이번 실행이 ?debug=1 로 열렸을 때
+    run = getattr(_local, "run", None)
+    return ENABLED or bool(run and run["debug"])
+
+
+def _record(kind, name, seconds, script=None, **extra):
+    if not _active():
+        return
+    if script is None:
+        run = getattr(_local, "run", None)
+        script = run["script"] if run else ""
+    run = getattr(_local, "run", None)
+    with _lock:
+        first = (script, kind, name) not in _seen
+        _seen.add((script, kind, name))
+        row = dict(script=script, kind=kind, name=name, seconds=seconds, first=first,
+                   run=run["id"] if run else 0, pid=os.getpid(), time=time.time(), **extra)
+        _records.append(row)
+        if METRICS_JSONL:
+            with open(METRICS_JSONL, "a", encoding="utf-8") as f:
+                f.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+
+# ------------------------------------------------------------------------------
+# import 시간 재기 (최상위 패키지 단위)
+# ------------------------------------------------------------------------------
+class _TimedLoader:
+    def __init__(self, loader, name):
+        self._loader = loader
+        self._name = name
+
+    def __getattr__(self, attr):
+        return getattr(self._loader, attr)
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        start = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            _record("import", self._name, time.perf_counter() - start, script="")
+
+
+class _ImportTimer:
+    # sys.meta_path 맨 앞에 끼워서, 처음 import 되는 최상위 모듈의 실행 시간을 잰다.
+    def __init__(self):
+        self._busy = threading.local()
+
+    def find_spec(self, fullname, path=None, target=None):
+        if "." in fullname or getattr(self._busy, "on", False):
+            return None
+        self._busy.on = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    break
+            else:
+                return None
+        finally:
+            self._busy.on = False
+        if spec.loader is None or not hasattr(spec.loader, "exec_module"):
+            return spec
+        spec.loader = _TimedLoader(spec.loader, fullname)
+        return spec
+
+
+if ENABLED and not any(isinstance(finder, _ImportTimer) for finder in sys.meta_path):
+    sys.meta_path.insert(0, _ImportTimer())
+
+
+# ------------------------------------------------------------------------------
+# 늦게 불러오기
+# ------------------------------------------------------------------------------
+class _LazyModule(types.ModuleType):
+    def __init__(self, name):
+        super().__init__(name)
+        self.__dict__["_lazy_module"] = None
+
+    def _load(self):
+        module = self.__dict__["_lazy_module"]
+        if module is None:
+            with _lock:
+                module = self.__dict__["_lazy_module"]
+                if module is None:
+                    start = time.perf_counter()
+                    module = importlib.import_module(self.__name__)
+                    _record("lazy_import", self.__name__, time.perf_counter() - start)
+                    self.__dict__["_lazy_module"] = module
+        return module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+
+def lazy_import(name):
+    # 이미 불러온 모듈이거나 DASHBOARD_LAZY=0 이면 진짜 모듈을 바로 돌려준다.
+    if name in sys.modules or not LAZY:
+        return importlib.import_module(name)
+    return _LazyModule(name)
+
+
+# ------------------------------------------------------------------------------
+# 스크립트 실행 · 구간 시간
+# ------------------------------------------------------------------------------
+def _debug_requested():
+    # 주소 뒤 ?debug=1 인지. Streamlit 실행 밖(벤치마크 등)에서는 False.
+    try:
+        import streamlit as st
+        return st.query_params.get("debug") == "1"
+    except Exception:
+        return False
+
+
+def _start_run(script, painted=False):
+    _local.run = {"script": script, "start": time.perf_counter(), "painted": painted, "id": next(_run_ids),
+                  "debug": _debug_requested()}
+
+
+def begin(script):
+    # 스크립트 맨 위에서: 이번 실행(rerun)의 시작 시각을 기억한다.
+    _start_run(script)
+    _record("run", "process_uptime", time.perf_counter() - _started, script=script)
+
+
+def first_paint():
+    # 첫 내용(제목 등)을 화면에 보낸 직후 한 번 호출: begin() 부터 걸린 시간
+    run = getattr(_local, "run", None)
+    if run is None or run["painted"]:
+        return
+    run["painted"] = True
+    _record("run", "first_paint", time.perf_counter() - run["start"])
+
+
+def end():
+    run = getattr(_local, "run", None)
+    if run is not None:
+        _record("run", "total", time.perf_counter() - run["start"])
+
+
+@contextmanager
+def _measure():
+    # 벽시계 · CPU 시간과 (켜져 있으면) 메모리를 잰다. 끝나면 dict 에 결과가 채워진다.
+    # tracemalloc 의 최고치는 프로세스에 하나뿐이라, 구간이 겹치면 안쪽 구간이 재설정한다.
+    # 그래서 안쪽 구간의 최고치를 바깥 구간에 넘겨 준다 (스레드별 스택).
+    stats = {}
+    stack = _local.__dict__.setdefault("peaks", [])
+    tracing = tracemalloc.is_tracing()
+    if tracing:
+        base = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        stack.append(base)
+    wall, cpu = time.perf_counter(), time.thread_time()
+    try:
+        yield stats
+    finally:
+        stats["seconds"] = time.perf_counter() - wall
+        stats["cpu_seconds"] = time.thread_time() - cpu
+        if tracing:
+            current, peak = tracemalloc.get_traced_memory()
+            peak = max(peak, stack.pop())  # 스택에는 시작값 대신 안쪽 구간들의 최고치가 쌓여 있다
+            stats["alloc_bytes"] = current - base
+            stats["peak_bytes"] = peak - base
+            if stack:
+                stack[-1] = max(stack[-1], peak)
+
+
+@contextmanager
+def section(name):
+    if not _active():
+        yield
+        return
+    stats = {}
+    try:
+        with _measure() as stats:
+            yield
+    finally:
+        _record("section", name, script=None, **stats)
+
+
+def _partial_rerun():
+    # 지금 실행이 fragment 만 다시 도는 중인지 (위젯 하나를 바꿨을 때)
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    ctx = get_script_run_ctx()
+    return bool(ctx is not None and ctx.fragment_ids_this_run)
+
+
+def fragment(name, **fragment_kw):
+    # st.fragment 로 감싸고, 실행 시간을 kind="fragment" 로 기록한다.
+    # 프로파일 모드에서는 구간 아래에 이번에 다시 그리는 데 걸린 시간을 작게 적어 준다.
+    import streamlit as st
+
+    def wrap(func):
+        run = getattr(_local, "run", None)
+        script = run["script"] if run else ""  # fragment 만 다시 돌 때는 begin() 이 불리지 않으므로 미리 기억
+
+        @functools.wraps(func)
+        def timed(*args, **kwargs):
+            partial = _partial_rerun()
+            if partial:
+                # fragment 만 다시 도는 실행은 begin() 을 거치지 않으므로, 이 스레드에 남은 예전 실행 대신
+                # 새 실행 번호를 열어서 그 안의 구간들이 이 실행으로 기록되게 한다 (?debug=1 도 다시 확인).
+                _start_run(script, painted=True)
+            if not _active():
+                return func(*args, **kwargs)
+            with _measure() as stats:
+                result = func(*args, **kwargs)
+            _record("fragment", name, script=script, partial=partial, **stats)
+            st.caption(f"⏱️ {name}: {stats['seconds'] * 1000:,.0f}ms "
+                       f"(CPU {stats['cpu_seconds'] * 1000:,.0f}ms, {'이 부분만' if partial else '전체 실행'})")
+            return result
+
+        return st.fragment(timed, **fragment_kw)
+
+    return wrap
+
+
+def records():
+    with _lock:
+        return list(_records)
+
+
+def report(rows=None):
+    # (스크립트, 종류, 이름)별 요약: 처음 잰 시간과 이후 평균
+    import pandas as pd
+
+    df = pd.DataFrame(rows if rows is not None else records())
+    if df.empty:
+        return df
+    df["ms"] = df["seconds"] * 1000
+    columns = dict(
+        count=("ms", "size"),
+        first_ms=("ms", "first"),
+        last_ms=("ms", "last"),
+        mean_ms=("ms", "mean"),
+    )
+    if "cpu_seconds" in df:
+        df["cpu_ms"] = df["cpu_seconds"] * 1000
+        columns["mean_cpu_ms"] = ("cpu_ms", "mean")
+    if "alloc_bytes" in df:
+        columns["mean_alloc_kb"] = ("alloc_bytes", lambda b: b.mean() / 1024)
+        columns["max_peak_kb"] = ("peak_bytes", lambda b: b.max() / 1024)
+    summary = df.groupby(["script", "kind", "name"], sort=False).agg(**columns)
+    return summary.reset_index()
+
+
+# ------------------------------------------------------------------------------
+# 내보내기 (Prometheus 텍스트 · JSON lines)
+# ------------------------------------------------------------------------------
+PROMETHEUS_METRICS = [
+    # (지표 이름, 기록의 값, 설명)
+    ("dashboard_section_runs_total", None, "구간이 실행된 횟수"),
+    ("dashboard_section_seconds_total", "seconds", "구간의 벽시계 시간 합"),
+    ("dashboard_section_cpu_seconds_total", "cpu_seconds", "구간의 CPU 시간 합 (그 스레드)"),
+    ("dashboard_section_alloc_bytes_total", "alloc_bytes", "구간에서 늘어난 메모리 합 (tracemalloc)"),
+]
+
+
+def _label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def prometheus_text(rows=None):
+    # 누적 카운터로 내보낸다: 스크래핑하는 쪽에서 rate() 를 쓰면 구간별 평균 시간이 나온다.
+    rows = records() if rows is None else rows
+    totals = {}
+    for row in rows:
+        if row["kind"] not in ("section", "fragment", "run") or row["name"] == "process_uptime":
+            continue
+        key = (row["script"], row["kind"], row["name"])
+        total = totals.setdefault(key, dict.fromkeys(("runs", "seconds", "cpu_seconds", "alloc_bytes"), 0))
+        total["runs"] += 1
+        for field in ("seconds", "cpu_seconds", "alloc_bytes"):
+            total[field] += row.get(field) or 0
+
+    lines = []
+    for metric, field, help_text in PROMETHEUS_METRICS:
+        lines.append(f"# HELP {metric} {help_text}")
+        lines.append(f"# TYPE {metric} counter")
+        for (script, kind, name), total in totals.items():
+            labels = f'script="{_label(script)}",kind="{_label(kind)}",name="{_label(name)}"'
+            lines.append(f"{metric}{{{labels}}} {total[field or 'runs']}")
+    return "\n".join(lines) + "\n"
+
+
+def jsonl_text(rows=None):
+    rows = records() if rows is None else rows
+    return "".join(json.dumps(row, ensure_ascii=False) + "\n" for row in rows)
+
+
+def dump_json(path=None):
+    rows = records()
+    if not rows:
+        return None
+    if path is None:
+        from data_loader import cache_dir
+        path = os.path.join(cache_dir("profile"), f"profile-{os.getpid()}.json")
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(rows, f, ensure_ascii=False, indent=1)
+    os.replace(tmp, path)
+    return path
+
+
+if ENABLED:
+    atexit.register(dump_json)
+
+
+def _overlay_html(rows):
+    # 이번 실행의 구간표를 화면 오른쪽 아래에 띄우는 HTML
+    cells = []
+    for row in rows:
+        if row["kind"] not in ("section", "fragment", "run") or row["name"] == "process_uptime":
+            continue
+        cpu = f"{row['cpu_seconds'] * 1000:,.0f}" if "cpu_seconds" in row else "-"
+        alloc = f"{row['alloc_bytes'] / 1024:,.0f}KB" if "alloc_bytes" in row else "-"
+        cells.append(f"<tr><td>{html.escape(str(row['name']))}</td><td>{row['seconds'] * 1000:,.0f}</td>"
+                     f"<td>{cpu}</td><td>{alloc}</td></tr>")
+    return ('<div style="position: fixed; right: 1rem; bottom: 1rem; z-index: 999999; '
+            'background: rgba(0, 0, 0, 0.78); color: #fff; padding: 8px 10px; border-radius: 6px; '
+            'font: 12px monospace; pointer-events: none;">'
+            '<table style="color: #fff; border-collapse: collapse;">'
+            '<tr><th align="left">구간</th><th>ms</th><th>CPU ms</th><th>메모리</th></tr>'
+            + "".join(cells) + "</table></div>")
+
+
+def st_report():
+    # 스크립트 맨 끝에서: 기록 중일 때만 (구석 구간표와) 사이드바에 표를 보여준다.
+    if not _active():
+        return
+    import streamlit as st
+
+    end()
+    run = getattr(_local, "run", None)
+    if OVERLAY or (run and run["debug"]):
+        current = [row for row in records() if run and row["run"] == run["id"]]
+        st.markdown(_overlay_html(current), unsafe_allow_html=True)
+
+    with st.sidebar.expander("⏱️ 프로파일 (DASHBOARD_PROFILE)", expanded=False):
+        summary = report()
+        if not summary.empty:
+            st.dataframe(summary.round(2), hide_index=True)
+        st.download_button("JSON 내려받기", json.dumps(records(), ensure_ascii=False),
+                           file_name=f"profile-{os.getpid()}.json", mime="application/json")
+        st.download_button("Prometheus 텍스트", prometheus_text(),
+                           file_name=f"profile-{os.getpid()}.prom", mime="text/plain")
+
+
+EXPORTS = {
+    "table": lambda rows: report(rows).round(2).to_string(index=False),
+    "prom": prometheus_text,
+    "jsonl": jsonl_text,
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="DASHBOARD_PROFILE=1 로 남긴 프로파일 JSON 을 모아 보여줍니다.")
+    parser.add_argument("paths", nargs="*", help="JSON 파일 (기본: .cache/profile/*.json)")
+    parser.add_argument("--format", choices=list(EXPORTS), default="table",
+                        help="출력 형식: table(요약표) / prom(Prometheus) / jsonl (기본: table)")
+    args = parser.parse_args(argv)
+
+    import glob
+    import pandas as pd
+    from data_loader import cache_dir
+
+    paths = args.paths or sorted(glob.glob(os.path.join(cache_dir("profile"), "*.json")))
+    rows = []
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            rows.extend(json.load(f))
+    if not rows:
+        print("기록이 없습니다. DASHBOARD_PROFILE=1 로 대시보드를 실행해 보세요.")
+        return 1
+    with pd.option_context("display.width", 160, "display.max_rows", 200):
+        print(EXPORTS[args.format](rows).rstrip("\n"))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
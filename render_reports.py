@@ -0,0 +1,163 @@
+import os
+import sys
+import time
+import argparse
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# 화면 없이 그린다.
+os.environ.setdefault("MPLBACKEND", "Agg")
+
+# ==============================================================================
+# [리포트 이미지 일괄 생성] Streamlit 서버 없이 네 대시보드의 차트를 전부 파일로 저장
+# ------------------------------------------------------------------------------
+# 예전에는 앱을 띄우고 화면을 캡처해서 korea_trade_analysis_pro.png 같은 이미지를 만들었다.
+# 차트 함수(*_charts.py)와 데이터(data_loader, dashboard_data)는 Streamlit 과 분리되어 있으므로
+# 여기서 그대로 불러와 Agg 로 그리고, 차트 × 형식 조합을 프로세스 풀에 나눠 맡긴다.
+#   python render_reports.py                          → reports/ 에 png · svg · pdf
+#   python render_reports.py -o out -f png --dpi 300 trade share
+# ==============================================================================
+
+FORMATS = ("png", "svg", "pdf")
+DEFAULT_OUT = "reports"
+
+# tags: 화면에서 같은 그림을 그릴 때 st_chart 에 주는 꼬리표 (app.py 가 미리 데울 때 그대로 붙인다)
+ReportJob = namedtuple("ReportJob", ["dashboard", "name", "build", "args", "font", "tags"], defaults=[()])
+
+
+def _trade_jobs():
+    import trade_charts
+    from trade_cube import kstat_cube, region_donut_args
+
+    from trade_forecast import trade_forecast
+    from trade_scenarios import history_params, run
+    from trade_refresh import REGIONS_TAG, SERIES_TAG
+
+    cube = kstat_cube()
+    df = cube.series("year")
+    scenarios = run(history_params(df)).chart_data()  # Trade.py 슬라이더 기본값과 같은 조건
+    forecast = trade_forecast(df).chart_data()
+    return [
+        ReportJob("trade", "macro_trend", trade_charts.macro_trend, (df,), None, (SERIES_TAG,)),
+        ReportJob("trade", "trade_balance", trade_charts.trade_balance, (df,), None, (SERIES_TAG,)),
+        ReportJob("trade", "region_donut", trade_charts.region_donut, region_donut_args(cube), None, (REGIONS_TAG,)),
+        ReportJob("trade", "oil_scenario", trade_charts.scenario_fan, (scenarios,), None, (SERIES_TAG,)),
+        ReportJob("trade", "forecast", trade_charts.forecast_fan, (forecast,), None, (SERIES_TAG,)),
+    ]
+
+
+def _blackwhite_jobs():
+    import blackwhite_charts
+    from dashboard_data import blackwhite_frames
+
+    df_netflix, df_survival, df_impact = blackwhite_frames()
+    return [
+        ReportJob("blackwhite", "viral_trend", blackwhite_charts.viral_trend, (df_netflix,), None),
+        ReportJob("blackwhite", "survival", blackwhite_charts.survival, (df_survival,), None),
+        ReportJob("blackwhite", "economic_impact", blackwhite_charts.economic_impact, (df_impact,), None),
+    ]
+
+
+def _ai_jobs():
+    import ai_charts
+    from dashboard_data import AI_CATEGORIES, AI_COLORS, AI_MODELS, ai_finance_frame
+
+    return [
+        ReportJob("ai", "valuation", ai_charts.valuation, (ai_finance_frame(),), "extrabold"),
+        ReportJob("ai", "radar", ai_charts.radar, (AI_MODELS, AI_CATEGORIES, AI_COLORS), "extrabold"),
+    ]
+
+
+def _share_jobs():
+    import share_charts
+    from data_loader import load_nts_table
+    from tax_simulator import CURRENT_RATES
+
+    df = load_nts_table()
+    jobs = [ReportJob("share", f"distribution-{column}", share_charts.distribution, (df, column, 30), None)
+            for column in df.select_dtypes("number").columns]
+    jobs.append(ReportJob("share", "lorenz", share_charts.lorenz, (df,), None))
+    jobs.append(ReportJob("share", "reform", share_charts.reform, (df, tuple(CURRENT_RATES)), None))
+    return jobs
+
+
+DASHBOARDS = {
+    "trade": _trade_jobs,
+    "blackwhite": _blackwhite_jobs,
+    "ai": _ai_jobs,
+    "share": _share_jobs,
+}
+
+_jobs = {}  # 프로세스마다 한 번만 만든다 (데이터 로더도 프로세스 캐시를 씀)
+
+
+def report_jobs(dashboard):
+    if dashboard not in _jobs:
+        _jobs[dashboard] = {job.name: job for job in DASHBOARDS[dashboard]()}
+    return _jobs[dashboard]
+
+
+def render_job(dashboard, name, fmt, out_dir, dpi):
+    # 작업 프로세스 안에서: 차트 하나를 한 형식으로 그려 파일로 저장한다.
+    # 이 도구가 곧 프로세스 풀이므로 chart_render 의 렌더링 풀(RENDER_WORKERS)은 거치지 않는다.
+    from chart_render import render_local
+    from fonts import DEFAULT_FONT
+
+    job = report_jobs(dashboard)[name]
+    start = time.perf_counter()
+    data = render_local(job.build, *job.args, fmt=fmt, savefig_kw={"dpi": dpi},
+                        font=job.font or DEFAULT_FONT)
+    path = os.path.join(out_dir, f"{dashboard}-{name}.{fmt}")
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+    return path, len(data), time.perf_counter() - start
+
+
+def render_reports(dashboards=None, formats=FORMATS, out_dir=DEFAULT_OUT, dpi=200, workers=None):
+    # 모든 (차트, 형식) 조합을 그려서 저장하고 [(경로, 바이트, 초)] 를 돌려준다.
+    dashboards = list(dashboards or DASHBOARDS)
+    os.makedirs(out_dir, exist_ok=True)
+    tasks = [(dashboard, name, fmt)
+             for dashboard in dashboards
+             for name in report_jobs(dashboard)
+             for fmt in formats]
+
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1:
+        return [render_job(dashboard, name, fmt, out_dir, dpi) for dashboard, name, fmt in tasks]
+    with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+        futures = [pool.submit(render_job, dashboard, name, fmt, out_dir, dpi)
+                   for dashboard, name, fmt in tasks]
+        return [future.result() for future in as_completed(futures)]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="대시보드 차트를 Streamlit 없이 이미지 파일로 일괄 저장합니다.")
+    parser.add_argument("dashboards", nargs="*",
+                        help=f"그릴 대시보드: {', '.join(DASHBOARDS)} (기본: 전부)")
+    parser.add_argument("-o", "--out", default=DEFAULT_OUT, help=f"저장 폴더 (기본: {DEFAULT_OUT})")
+    parser.add_argument("-f", "--formats", default=",".join(FORMATS), help="형식 목록 (기본: png,svg,pdf)")
+    parser.add_argument("--dpi", type=int, default=200, help="PNG 해상도 (기본: 200)")
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본: CPU 수)")
+    args = parser.parse_args(argv)
+
+    unknown = set(args.dashboards) - set(DASHBOARDS)
+    if unknown:
+        parser.error(f"없는 대시보드: {', '.join(sorted(unknown))}")
+    formats = [fmt.strip() for fmt in args.formats.split(",") if fmt.strip()]
+    unknown = set(formats) - set(FORMATS)
+    if unknown:
+        parser.error(f"지원하지 않는 형식: {', '.join(sorted(unknown))}")
+
+    start = time.perf_counter()
+    results = render_reports(args.dashboards or None, formats, args.out, args.dpi, args.workers)
+    for path, size, seconds in sorted(results):
+        print(f"[저장] {path}  {size / 1024:,.0f}KB  {seconds * 1000:,.0f}ms")
+    print(f"차트 {len(results)}개, {time.perf_counter() - start:.1f}초")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,21 +1,86 @@
+import profiling # DASHBOARD_PROFILE=1 이면 import/구간 시간을 잰다 (맨 먼저 import)
+profiling.begin("share.py")
+
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt 
-import seaborn as sns
 import numpy as np 
 import os # 파일 경로 확인용
-import platform # 운영체제 확인용 (폰트 설정)
+from data_loader import load_nts_table # CSV는 한 번만 읽고 이후엔 캐시(Arrow)에서 가져옴
+from percentile_index import percentile_index # 총급여 → 상위 몇 % 조회용 인덱스
+from inequality import inequality # 로렌츠 곡선 / 지니계수 / 상위 점유율
+from tax_simulator import CURRENT_RATES, CURRENT_THRESHOLDS, simulate # 세율 개편 시뮬레이터
+from figure_cache import st_chart # 같은 입력이면 이미 그려 둔 그림을 재사용
+share_charts = profiling.lazy_import("share_charts") # 차트 그리는 함수 모음 (첫 그래프 때 불러옴)
 
 # -----------------------------------------------------------------------------
 # [한글 폰트 설정] 그래프 깨짐 방지용 코드
-if platform.system() == 'Darwin': # 맥
-    plt.rc('font', family='AppleGothic') 
-elif platform.system() == 'Windows': # 윈도우
-    plt.rc('font', family='Malgun Gothic') 
-plt.rcParams['axes.unicode_minus'] = False 
+# 운영체제와 상관없이 저장소의 나눔고딕을 쓴다 (리눅스 서버에서도 한글이 나옴). 그래프마다 적용됨.
+# 등록은 첫 그래프를 그릴 때 fonts.py 가 자동으로 한 번 한다.
 # -----------------------------------------------------------------------------
 
 st.title("💸💰국세청 근로소득 데이터 분석기")
+profiling.first_paint()
+
+# -----------------------------------------------------------------------------
+# [부분 다시 그리기] 위젯이 있는 구간은 fragment 로 나눈다
+# 항목 선택 · 급여 입력 · 세율 슬라이더를 바꾸면 그 구간만 다시 실행된다.
+# (예전에는 선택 하나에 파일 읽기 · 성공 메시지 · 미리 보기 표까지 전부 다시 그렸다)
+# 표(df)는 로더 캐시에서 받은 것을 그대로 넘기므로 구간이 다시 돌아도 파일을 읽지 않는다.
+# -----------------------------------------------------------------------------
+@profiling.fragment("항목별 분포")
+def distribution_section(df):
+    column_names = df.select_dtypes('number').columns.tolist()  # 숫자 열 이름만 리스트로 변환
+                                        # 맨 위 항목을 제목으로 이 열을 가져올게.
+    
+    selected_column = st.selectbox("분석할 항목을 선택하세요", column_names)
+    # 하향모양 버튼 눌르면 선택지가 좌르륵 펼쳐지고 하나 선택하는 라벨
+    bins = st.slider("막대(구간) 개수", min_value=5, max_value=100, value=30)
+
+    # 항목이 선택되었을 때만 그래프 그리기
+    if selected_column:
+        # [수정됨] sns.histplot(kde=True)는 그릴 때마다 KDE 를 새로 계산해서 느림.
+        # 열/구간 개수별로 미리 계산해 둔 막대 높이와 KDE 곡선만 꺼내서 그린다. (share_charts.py)
+        # 같은 열 · 같은 구간 개수면 이미 그려 둔 그림(캐시)을 바로 보여준다.
+        with profiling.section("분포 그래프"):
+            st_chart(share_charts.distribution, df, selected_column, bins)
+
+
+@profiling.fragment("상위 % 조회")
+def percentile_section(df):
+    income = st.number_input("연간 총급여를 입력하세요 (만원)", min_value=0, value=4000, step=100)
+
+    # 인덱스는 표마다 한 번만 만들어지고, 조회는 searchsorted 한 번이라 바로 나옴.
+    found = percentile_index(df).lookup(income)
+    c1, c2, c3 = st.columns(3)
+    c1.metric("속한 구간", found.label[0])
+    c2.metric("추정 순위", f"상위 {found.top_share[0]:.1f}%")
+    c3.metric("구간 평균 결정세액", f"{found.avg_tax[0]:,.0f} 만원",
+              f"실효세율 {found.tax_rate[0] * 100:.1f}%", delta_color="off")
+
+
+@profiling.fragment("세율 개편")
+def reform_section(df):
+    # 구간 이름 예: '1,400만~5,000만'
+    bounds = list(CURRENT_THRESHOLDS[1:]) + [None]
+    rates = []
+    rate_cols = st.columns(4)
+    for i, (lo, hi) in enumerate(zip(CURRENT_THRESHOLDS, bounds)):
+        name = f"{lo:,.0f}만~{hi:,.0f}만" if hi else f"{lo:,.0f}만 초과"
+        with rate_cols[i % 4]:
+            rate = st.slider(name, min_value=0.0, max_value=60.0,
+                             value=float(CURRENT_RATES[i] * 100), step=0.5, format="%.1f%%")
+        rates.append(rate / 100)
+
+    reform = simulate(rates, df=df)  # 반복문 없이 전 구간을 한 번에 계산
+
+    c6, c7, c8 = st.columns(3)
+    c6.metric("현재 세수", f"{reform.revenue_before / 1e4:,.1f} 조원")
+    c7.metric("개편 후 세수", f"{reform.revenue_after / 1e4:,.1f} 조원")
+    c8.metric("세수 변화", f"{reform.revenue_change / 1e4:+,.2f} 조원")
+
+    with profiling.section("세율 개편 그래프"):
+        st_chart(share_charts.reform, df, tuple(rates))
+
 
 # 다운로드 받은 데이터 불러오기 
 
@@ -38,12 +103,15 @@ try: # 오류가 없을 때 이걸 출력해.
     
     ########## 자료 읽기      #df로 파일 이름 가져오는 것임.
     # [수정됨] utf-8 오류 해결을 위해 cp949로 변경
-    df = pd.read_csv(file_path, encoding='cp949') # df 라는 변수를 잡아줘야 파일이 안날라다님.
+    # [수정됨] 매번 read_csv 하지 않고 로더가 캐시한 표를 씀 (파일이 바뀌면 자동으로 다시 읽음)
+    with profiling.section("데이터 불러오기"):
+        df = load_nts_table(file_path) # df 라는 변수를 잡아줘야 파일이 안날라다님.
     st.success("파일이 성공적으로 불러와졌습니다!")
 
     ########## 데이터 미리 보기
     st.subheader("😊데이터 미리 보기")  # 제목
-    st.dataframe(df.head())  # st.dataframe() : 스트림릿에서 데이터프레임을 보여주는 함수
+    with profiling.section("미리 보기"):
+        st.dataframe(df.head())  # st.dataframe() : 스트림릿에서 데이터프레임을 보여주는 함수
                              # 전체 데이터가 아니라 일부 데이터만 보여주는 .head() 메소드.
                              # 기본 5개 / 10개 넣고 싶으면 .head(10)
 
@@ -53,29 +121,27 @@ try: # 오류가 없을 때 이걸 출력해.
     ######### 분석하고 싶은 열 이름 선택
     # 예를 들어 급여나 인원 같은 숫자 데이터가 있는 열을 골라야 한다.
 
-    column_names = df.columns.tolist()  # 데이터프레임의 열 이름을 리스트로 변환
-                                        # 맨 위 항목을 제목으로 이 열을 가져올게.
-    
-    selected_column = st.selectbox("분석할 항목을 선택하세요", column_names)
-    # 하향모양 버튼 눌르면 선택지가 좌르륵 펼쳐지고 하나 선택하는 라벨
+    distribution_section(df)
 
-    # 항목이 선택되었을 때만 그래프 그리기
-    if selected_column:
-        # 그래프 그리기 seaborn 사용
-        fig, ax = plt.subplots(figsize=(10, 5))  # 새로운 그래프 그릴 준비
-                    # figsize는 그래프의 크기. 그래프 그릴 도화지 크기라고 생각하면 됨.
-                    # fig는 도화지, ax는 실제 그래프 그릴 부분.
+    ######### 내 연봉은 상위 몇 %?
+    st.subheader("🔎내 총급여는 상위 몇 %?")
+    percentile_section(df)
+
+    ######### 불평등 지표 (로렌츠 곡선, 지니계수, 상위 1%/10% 점유율)
+    st.subheader("⚖️소득 · 세금 불평등 지표")
+    ineq = inequality(df)  # 표마다 한 번만 계산됨
 
-        # matplotlib , seaborn 중 seaborn이 더 그래프 잘 그림. 엑셀이 가장 좋음.  / # 6문 뒤에 숫자는 투명도
-        # dropna()로 빈 값 제거 후 그림
-        sns.histplot(df[selected_column].dropna(), kde=True, ax=ax, color="#cc00ff50") # 막대 그래프
+    c4, c5 = st.columns([1.2, 1])
+    with c4:
+        with profiling.section("로렌츠 곡선"):
+            st_chart(share_charts.lorenz, df)
+    c5.dataframe(ineq.summary().style.format("{:.3f}"))
 
-        plt.title(f"[{selected_column}] 분포 확인") # 그래프 맨 위 제목
-        plt.xlabel(selected_column)  # x축 라벨 / 예: 급여액
-        plt.ylabel("빈도수")          # y축 라벨 / 예: 빈도수
+    ######### 세율 개편 시뮬레이터 (what-if)
+    st.subheader("🧮세율 개편 시뮬레이터")
+    st.caption("과세표준 구간별 세율을 바꾸면 천분위 전 구간의 세금이 한 번에 다시 계산됩니다.")
 
-        ###### 스트림릿에 그래프 출력
-        st.pyplot(fig) 
+    reform_section(df)
 
 except FileNotFoundError:
     st.error(f"🚨'{file_path}'파일을 찾을 수 없습니다. 파일명을 재확인 해주세요.")
@@ -84,3 +150,5 @@ except UnicodeDecodeError:
     st.error("🚨인코딩 오류가 발생했습니다. encoding='cp949' 로 설정되어 있는지 확인하세요.")
 except Exception as e:
     st.error(f"🚨파일을 불러오는 중 에러가 발생했습니다: {e}")
+
+profiling.st_report()  # 프로파일 모드일 때만 사이드바에 시간표
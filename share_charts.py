@@ -0,0 +1,66 @@
+import numpy as np
+
+from chart_render import create_figure
+from hist_engine import column_histogram
+from inequality import MEASURES, inequality
+from tax_simulator import simulate
+
+# ==============================================================================
+# [share.py 차트] 데이터 → Figure 를 돌려주는 함수만 모아 둔 곳
+# ------------------------------------------------------------------------------
+# 화면(Streamlit) 코드와 분리해 두어야 그림 캐시(figure_cache)가 입력 데이터로 키를 만들고,
+# 서버 없이도 같은 차트를 그릴 수 있다.
+# 무거운 계산(히스토그램/KDE, 로렌츠 곡선)은 각 엔진이 표마다 한 번만 해 두므로 여기서는 그리기만 한다.
+# ==============================================================================
+
+
+def distribution(df, column, bins=30):
+    # 항목별 분포: 미리 계산된 막대 높이 + KDE 곡선
+    fig, ax = create_figure("share.distribution", (10, 5))  # fig는 도화지, ax는 실제 그래프 그릴 부분.
+
+    hist = column_histogram(df, column, bins)
+    ax.bar(hist.edges[:-1], hist.counts, width=hist.widths, align='edge',
+           color="#cc00ff50", edgecolor="white") # 막대 그래프 / 색상 6문 뒤에 숫자는 투명도
+    ax.plot(hist.kde_x, hist.kde_y, color="#cc00ff") # KDE 곡선
+
+    ax.set_title(f"[{column}] 분포 확인") # 그래프 맨 위 제목
+    ax.set_xlabel(column)  # x축 라벨 / 예: 급여액
+    ax.set_ylabel("빈도수")  # y축 라벨 / 예: 빈도수
+    return fig
+
+
+def lorenz(df):
+    # 로렌츠 곡선 (총급여 · 과세표준 · 결정세액)
+    ineq = inequality(df)
+
+    fig, ax = create_figure("share.lorenz", (6, 6))
+    ax.plot([0, 1], [0, 1], color="gray", linestyle="--", label="완전 평등선")
+    for i, measure in enumerate(ineq.measures):
+        ax.plot(ineq.lorenz_x[0], ineq.lorenz_y[0, :, i],
+                label=f"{MEASURES[measure]} (지니 {ineq.gini[0, i]:.3f})")
+    ax.set_title("로렌츠 곡선")
+    ax.set_xlabel("누적 인원 비율 (소득 낮은 순)")
+    ax.set_ylabel("누적 금액 비율")
+    ax.legend(loc="upper left")
+    return fig
+
+
+def reform(df, rates):
+    # 세율 개편: 구간별 1인당 세금 변화 + 부담 비중 변화
+    result = simulate(rates, df=df)
+
+    fig, (ax1, ax2) = create_figure("share.reform", (10, 7), nrows=2, ncols=1, sharex=True)
+    x = np.arange(len(result.labels))  # 소득 낮은 구간 → 높은 구간
+    ax1.bar(x, result.change_per_person,
+            color=np.where(result.change_per_person > 0, "#d45087", "#004c70")) # 증세 분홍 / 감세 파랑
+    ax1.axhline(0, color="black", linewidth=1)
+    ax1.set_title("구간별 1인당 세금 변화")
+    ax1.set_ylabel("만원")
+    ax2.plot(x, result.burden_shift * 100, color="#cc00ff")
+    ax2.axhline(0, color="black", linewidth=1)
+    ax2.set_title("구간별 세금 부담 비중 변화")
+    ax2.set_ylabel("%p")
+    ticks = list(range(0, len(result.labels), 12)) + [len(result.labels) - 1]
+    ax2.set_xticks(ticks)
+    ax2.set_xticklabels(result.labels[ticks], rotation=45)
+    return fig
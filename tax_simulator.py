@@ -0,0 +1,106 @@
+import numpy as np
+
+from data_loader import derived, load_nts_table
+from percentile_index import WON_PER_EOK, WON_PER_MANWON, bracket_order
+
+# ==============================================================================
+# [세율 개편 시뮬레이터] 누진세율표를 바꾸면 세수와 부담이 어떻게 움직이나?
+# ------------------------------------------------------------------------------
+# - 세율표는 (과세표준 하한, 세율) 목록. 하한까지의 누적 세액표를 미리 만들어 두면
+#     세액 = 누적세액[k] + 세율[k] x (과세표준 - 하한[k]),  k = np.digitize(과세표준) - 1
+#   로 모든 구간(천분위 행)을 반복문 없이 한 번에 계산할 수 있다.
+# - 세율표를 여러 개 쌓아서 (세율표, 구간) 배열로 한 번에 돌릴 수도 있다. (수백 개 스윕용)
+# - 실제 결정세액에는 각종 세액공제가 반영되어 있으므로,
+#     새 결정세액 = max(실제 결정세액 + (새 세율표 산출세액 - 현행 세율표 산출세액), 0)
+#   으로 공제 효과는 그대로 두고 세율표 차이만 더한다.
+# - 행마다 1인당 평균 과세표준을 쓰므로 구간 안의 분포는 무시한다. (천분위라 충분히 촘촘함)
+# ==============================================================================
+
+# 현행 종합소득세 기본세율 (2023년 귀속 이후) — 과세표준 하한(만 원), 세율
+CURRENT_THRESHOLDS = np.array([0, 1400, 5000, 8800, 15000, 30000, 50000, 100000], dtype=np.float64)
+CURRENT_RATES = np.array([0.06, 0.15, 0.24, 0.35, 0.38, 0.40, 0.42, 0.45])
+
+
+def bracket_table(thresholds, rates):
+    # 각 구간 하한까지 쌓인 세액(누적 세액표). rates 가 (세율표, 구간) 이면 세율표마다 만든다.
+    thresholds = np.asarray(thresholds, dtype=np.float64)
+    rates = np.asarray(rates, dtype=np.float64)
+    widths = np.diff(thresholds)
+    steps = rates[..., :-1] * widths
+    zeros = np.zeros(rates.shape[:-1] + (1,))
+    return np.concatenate([zeros, np.cumsum(steps, axis=-1)], axis=-1)
+
+
+def statutory_tax(base, thresholds, rates):
+    # base: 과세표준 (구간,)  → 산출세액 (구간,) 또는 (세율표, 구간)
+    thresholds = np.asarray(thresholds, dtype=np.float64)
+    rates = np.asarray(rates, dtype=np.float64)
+    base = np.asarray(base, dtype=np.float64)
+
+    k = np.clip(np.digitize(base, thresholds) - 1, 0, thresholds.size - 1)
+    cumulative = bracket_table(thresholds, rates)
+    over = np.maximum(base - thresholds[k], 0.0)
+    if rates.ndim == 1:
+        return cumulative[k] + rates[k] * over
+    # 세율표가 여러 개면 구간 번호 k 는 그대로 두고 열만 골라낸다.
+    return cumulative[:, k] + rates[:, k] * over
+
+
+class TaxBase:
+    # 시뮬레이션에 필요한 배열만 뽑아 둔 것 (소득 오름차순, 1인당 만 원)
+    def __init__(self, df):
+        order, tops = bracket_order(df)
+        self.labels = df["구분"].to_numpy(dtype=object)[order]
+        self.bracket_tops = tops[order]
+        self.people = df["인원"].to_numpy(dtype=np.float64)[order]
+        scale = WON_PER_EOK / WON_PER_MANWON
+        self.base = df["과세표준"].to_numpy(dtype=np.float64)[order] * scale / self.people
+        self.actual_tax = df["결정세액"].to_numpy(dtype=np.float64)[order] * scale / self.people
+        self.current_tax = statutory_tax(self.base, CURRENT_THRESHOLDS, CURRENT_RATES)
+
+
+class ReformResult:
+    # 마지막 축은 항상 구간(천분위 행), 세율표를 여러 개 넣었으면 첫 축이 세율표
+    def __init__(self, tax_base, new_tax):
+        people = tax_base.people
+        self.labels = tax_base.labels
+        self.bracket_tops = tax_base.bracket_tops
+        self.tax_before = tax_base.actual_tax                 # 1인당 결정세액 (만 원)
+        self.tax_after = new_tax                              # 1인당 새 결정세액 (만 원)
+        self.change_per_person = new_tax - tax_base.actual_tax
+
+        to_eok = WON_PER_MANWON / WON_PER_EOK
+        self.revenue_before = (tax_base.actual_tax * people).sum() * to_eok   # 억 원
+        self.revenue_after = (new_tax * people).sum(axis=-1) * to_eok
+        self.revenue_change = self.revenue_after - self.revenue_before
+
+        # 구간별 세금 부담 비중이 얼마나 옮겨 갔는지 (새 비중 - 현재 비중)
+        share_before = tax_base.actual_tax * people / (tax_base.actual_tax * people).sum()
+        total_after = (new_tax * people).sum(axis=-1, keepdims=True)
+        share_after = new_tax * people / np.where(total_after > 0, total_after, 1.0)
+        self.burden_shift = share_after - share_before
+
+    def to_frame(self):
+        # 세율표 한 개짜리 결과를 표로
+        import pandas as pd
+        return pd.DataFrame({
+            "구분": self.labels,
+            "현재 1인당 결정세액(만원)": self.tax_before,
+            "개편 후 1인당 결정세액(만원)": self.tax_after,
+            "1인당 변화(만원)": self.change_per_person,
+            "부담 비중 변화(%p)": self.burden_shift * 100,
+        })
+
+
+def tax_base(df=None):
+    if df is None:
+        df = load_nts_table()
+    return derived(df, "tax_base", TaxBase)
+
+
+def simulate(rates, thresholds=CURRENT_THRESHOLDS, df=None):
+    # rates: (구간 수,) 세율표 한 개 또는 (세율표 수, 구간 수) 여러 개를 한꺼번에
+    base = tax_base(df)
+    new_statutory = statutory_tax(base.base, thresholds, rates)
+    new_tax = np.maximum(base.actual_tax + (new_statutory - base.current_tax), 0.0)
+    return ReformResult(base, new_tax)
@@ -0,0 +1,20 @@
+import pandas as pd
+
+from data_loader import normalize_trade_frame
+
+
+def test_monthly_rows_sort_by_year_then_month_keeping_row_order():
+    df = pd.DataFrame({
+        "Year": pd.array(["2025년", "2024년", "2025년", "2024년", "2025년"], dtype="string"),
+        "Month": [2, 12, 1, 3, 1],
+        "Region": ["a", "b", "c", "d", "e"],
+    })
+    out = normalize_trade_frame(df)
+    assert out["Year"].tolist() == [2024, 2024, 2025, 2025, 2025]
+    assert out["Month"].tolist() == [3, 12, 1, 1, 2]
+    assert out["Region"].tolist() == ["d", "b", "c", "e", "a"]
+
+
+def test_annual_rows_sort_by_year():
+    df = pd.DataFrame({"Year": pd.array(["2025년", "2023년", "2024년"], dtype="string"), "Exports": [3, 1, 2]})
+    assert normalize_trade_frame(df)["Exports"].tolist() == [1, 2, 3]
@@ -0,0 +1,27 @@
+import weakref
+
+import pandas as pd
+import pytest
+
+import dataset_service
+
+pytest.importorskip("pyarrow")
+
+
+def test_attaching_a_new_version_releases_the_old_one(tmp_path, monkeypatch):
+    monkeypatch.setattr(dataset_service, "SHM_DIR", str(tmp_path))
+    monkeypatch.setattr(dataset_service, "_attached", {})
+
+    dataset_service.publish("nts", ("a.csv", 1, 10), pd.DataFrame({"x": [1, 2, 3]}))
+    old = dataset_service.attach("nts", ("a.csv", 1, 10))
+    assert old["x"].tolist() == [1, 2, 3]
+    assert dataset_service.attach("nts", ("a.csv", 1, 10)) is old
+    old_ref = weakref.ref(old)
+    del old
+
+    dataset_service.publish("nts", ("a.csv", 2, 12), pd.DataFrame({"x": [4, 5]}))
+    new = dataset_service.attach("nts", ("a.csv", 2, 12))
+    assert new["x"].tolist() == [4, 5]
+    assert list(dataset_service._attached) == ["nts"]
+    assert dataset_service._attached["nts"][0] == 2
+    assert old_ref() is None
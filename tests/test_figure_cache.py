@@ -0,0 +1,21 @@
+from figure_cache import FigureCache
+
+
+def test_evicted_keys_leave_the_tag_index():
+    cache = FigureCache(max_bytes=100)
+    for i in range(50):
+        cache.put(i, b"x" * 30, tags=("trade:series", f"chart:{i}"))
+    assert len(cache._entries) == 3
+    assert cache._tags["trade:series"] == {47, 48, 49}
+    assert set(cache._tags) == {"trade:series", "chart:47", "chart:48", "chart:49"}
+
+
+def test_invalidate_drops_keys_from_every_tag():
+    cache = FigureCache()
+    cache.put("a", b"1", tags=("trade:series", "trade:regions"))
+    cache.put("b", b"2", tags=("trade:regions",))
+    cache.put("c", b"3")
+    assert cache.invalidate("trade:series") == 1
+    assert cache._tags == {"trade:regions": {"b"}}
+    assert cache.get("c") == b"3"
+    assert cache.stats()["bytes"] == 2
@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+
+from hist_engine import column_histogram, fft_kde, scott_bandwidth
+
+
+def _direct_kde(values, grid):
+    # 예전 방식: 격자점마다 모든 값에 대해 가우시안 커널을 더한다.
+    bw = scott_bandwidth(values)
+    z = (grid[:, None] - values[None, :]) / bw
+    return np.exp(-0.5 * z ** 2).sum(axis=1) / (values.size * bw * np.sqrt(2 * np.pi))
+
+
+def test_fft_kde_stays_close_to_direct_gaussian_kde():
+    rng = np.random.default_rng(0)
+    for values in (rng.normal(50, 10, 5_000), rng.lognormal(8, 0.7, 5_000)):
+        grid, density = fft_kde(values)
+        assert grid[0] >= values.min() and grid[-1] <= values.max()
+        expected = _direct_kde(values, grid)
+        assert np.abs(density - expected).max() <= 1e-3 * expected.max()
+
+
+def test_fft_kde_degenerate_inputs():
+    grid, density = fft_kde(np.array([]))
+    assert grid.size == 0 and density.size == 0
+    grid, density = fft_kde(np.full(10, 3.0))
+    assert (density == 0).all()
+
+
+def test_histogram_matches_numpy_and_scales_kde_to_counts():
+    rng = np.random.default_rng(1)
+    df = pd.DataFrame({"x": rng.normal(0, 1, 2_000)})
+    df.loc[::50, "x"] = np.nan
+    values = df["x"].dropna().to_numpy()
+
+    hist = column_histogram(df, "x", bins=20)
+    counts, edges = np.histogram(values, bins=20)
+    np.testing.assert_array_equal(hist.counts, counts)
+    np.testing.assert_allclose(hist.edges, edges)
+    expected = _direct_kde(values, hist.kde_x) * values.size * (edges[1] - edges[0])
+    assert np.abs(hist.kde_y - expected).max() <= 1e-3 * expected.max()
+    assert column_histogram(df, "x", bins=20) is hist
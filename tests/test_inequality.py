@@ -0,0 +1,49 @@
+import numpy as np
+
+from data_loader import load_nts_table
+from inequality import MEASURES, inequality
+
+
+def _ascending(df):
+    tops = df["구분"].str.extract(r"([\d.]+)")[0].astype(float)
+    return df.assign(_top=tops).sort_values("_top", ascending=False, kind="stable")
+
+
+def test_income_gini_matches_mean_absolute_difference():
+    df = load_nts_table()
+    result = inequality(df)
+
+    # 구간 안은 모두 평균 소득이라고 보면 지니 = Σ Σ p_i p_j |m_i - m_j| / (2 μ)
+    people = df["인원"].to_numpy(dtype=np.float64)
+    mean = df["총급여"].to_numpy(dtype=np.float64) / people
+    p = people / people.sum()
+    mu = (p * mean).sum()
+    gini = (p[:, None] * p[None, :] * np.abs(mean[:, None] - mean[None, :])).sum() / (2 * mu)
+
+    col = list(MEASURES).index("총급여")
+    assert np.isclose(result.gini[0, col], gini)
+
+
+def test_lorenz_curve_matches_running_totals():
+    df = load_nts_table()
+    result = inequality(df)
+    rows = _ascending(df)
+
+    for col, measure in enumerate(MEASURES):
+        x, y = [0.0], [0.0]
+        people = amount = 0.0
+        for n, v in zip(rows["인원"], rows[measure]):
+            people += n
+            amount += v
+            x.append(people)
+            y.append(amount)
+        np.testing.assert_allclose(result.lorenz_x[0], np.array(x) / people)
+        np.testing.assert_allclose(result.lorenz_y[0, :, col], np.array(y) / amount)
+
+
+def test_top_share_matches_interpolated_lorenz():
+    result = inequality(load_nts_table())
+    for p, share in result.top_share.items():
+        for col in range(len(MEASURES)):
+            expected = 1.0 - np.interp(1.0 - p, result.lorenz_x[0], result.lorenz_y[0, :, col])
+            assert np.isclose(share[0, col], expected)
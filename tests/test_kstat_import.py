@@ -0,0 +1,39 @@
+import numpy as np
+import pandas as pd
+
+import kstat_import
+
+
+def _workbook(monkeypatch, rows):
+    # 두 줄 헤더의 K-stat 내보내기 모양을 read_excel 대신 돌려준다.
+    header = [
+        ["순번", "년월", "국가명", "대륙명", "수출", "수출", "수입", "수입", "수지"],
+        ["순번", "년월", "국가명", "대륙명", "금액", "증감률", "금액", "증감률", "수지"],
+    ]
+    raw = pd.DataFrame([["K-stat 수출입 무역통계"] + [None] * 8] + header + rows, dtype=object)
+    monkeypatch.setattr(kstat_import.pd, "read_excel", lambda *args, **kwargs: raw)
+    return kstat_import.parse_workbook("dummy.xls")
+
+
+def test_blank_and_dash_amounts_become_zero(monkeypatch):
+    df = _workbook(monkeypatch, [
+        ["1", "2025.01", "미국", "북미", "1,000", "3.5", "400", "-1.0", "600"],
+        ["2", "2025.02", "미국", "북미", None, "", "-", "-", " "],
+    ])
+    assert df["Exports"].tolist() == [1000, 0]
+    assert df["Imports"].tolist() == [400, 0]
+    assert df["Trade_Balance"].tolist() == [600, 0]
+    assert df["Exports"].dtype == np.int64
+    assert np.isnan(df["Export_Growth"].iloc[1])
+
+
+def test_subtotal_rows_are_dropped_and_continent_kept(monkeypatch):
+    df = _workbook(monkeypatch, [
+        ["", "2024년", "미국", "북미", "9,999", "", "9,999", "", "0"],
+        ["1", "2024.12", "미국", "북미", "10", "", "5", "", "5"],
+        ["2", "2024.02", "일본", "아시아", "20", "", "30", "", "-10"],
+        ["", "합계", "", "", "30", "", "35", "", "-5"],
+    ])
+    assert df[["Year", "Month"]].values.tolist() == [[2024, 2], [2024, 12]]
+    assert df["Region"].tolist() == ["일본", "미국"]
+    assert df["Continent"].tolist() == ["아시아", "북미"]
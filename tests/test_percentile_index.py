@@ -0,0 +1,40 @@
+import numpy as np
+
+from data_loader import load_nts_table
+from percentile_index import WON_PER_EOK, WON_PER_MANWON, PercentileIndex
+
+
+def _reference_brackets(df):
+    # 예전 방식: 행을 소득 오름차순으로 정렬하고 경계를 하나씩 비교한다.
+    rows = []
+    for _, row in df.iterrows():
+        top = float(row["구분"].replace("상위", "").replace("%", ""))
+        rows.append((-top, row["구분"], row["총급여"] * WON_PER_EOK / WON_PER_MANWON / row["인원"],
+                     row["결정세액"] * WON_PER_EOK / WON_PER_MANWON / row["인원"]))
+    rows.sort(key=lambda r: r[0])
+    avg = [r[2] for r in rows]
+    boundaries = [(a + b) / 2 for a, b in zip(avg[:-1], avg[1:])]
+    return rows, boundaries
+
+
+def test_lookup_matches_searchsorted_and_row_scan():
+    df = load_nts_table()
+    index = PercentileIndex(df)
+    rows, boundaries = _reference_brackets(df)
+
+    rng = np.random.default_rng(0)
+    incomes = np.concatenate([rng.uniform(0, 30_000, 500), boundaries, [0.0, 1e6]])
+    result = index.lookup(incomes)
+
+    np.testing.assert_allclose(index.boundaries, boundaries)
+    np.testing.assert_array_equal(index.bracket(incomes), np.searchsorted(boundaries, incomes, side="right"))
+    for income, label, avg_tax in zip(incomes, result.label, result.avg_tax):
+        k = sum(1 for b in boundaries if b <= income)
+        assert label == rows[k][1]
+        assert np.isclose(avg_tax, rows[k][3])
+
+
+def test_top_share_is_monotone_and_bounded():
+    top = PercentileIndex(load_nts_table()).lookup(np.linspace(0, 50_000, 200)).top_share
+    assert (np.diff(top) <= 0).all()
+    assert (top >= 0).all() and (top <= 100).all()
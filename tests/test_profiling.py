@@ -0,0 +1,34 @@
+from collections import deque
+
+import streamlit as st
+
+import profiling
+
+
+def test_records_are_capped(monkeypatch):
+    monkeypatch.setattr(profiling, "ENABLED", True)
+    monkeypatch.setattr(profiling, "_records", deque(maxlen=3))
+    for i in range(10):
+        profiling._record("section", f"s{i}", 0.0, script="t.py")
+    assert [row["name"] for row in profiling.records()] == ["s7", "s8", "s9"]
+
+
+def test_fragment_rerun_records_against_a_new_run(monkeypatch):
+    monkeypatch.setattr(profiling, "ENABLED", True)
+    monkeypatch.setattr(profiling, "_records", deque(maxlen=100))
+    monkeypatch.setattr(st, "fragment", lambda func, **kwargs: func)
+    monkeypatch.setattr(st, "caption", lambda *args, **kwargs: None)
+
+    profiling.begin("t.py")
+    stale = profiling._local.run["id"]
+
+    @profiling.fragment("부분")
+    def part():
+        with profiling.section("안쪽"):
+            pass
+
+    monkeypatch.setattr(profiling, "_partial_rerun", lambda: True)
+    part()
+    rows = {row["name"]: row for row in profiling.records()}
+    assert rows["안쪽"]["run"] == rows["부분"]["run"] != stale
+    assert rows["부분"]["script"] == "t.py" and rows["부분"]["partial"]
@@ -0,0 +1,42 @@
+import numpy as np
+
+from data_loader import load_nts_table
+from tax_simulator import CURRENT_RATES, CURRENT_THRESHOLDS, simulate, statutory_tax, tax_base
+
+
+def _loop_tax(base, thresholds, rates):
+    # 예전 방식: 구간을 아래에서부터 하나씩 채워 가며 세액을 더한다.
+    tax = 0.0
+    for k, rate in enumerate(rates):
+        lo = thresholds[k]
+        hi = thresholds[k + 1] if k + 1 < len(thresholds) else np.inf
+        if base <= lo:
+            break
+        tax += rate * (min(base, hi) - lo)
+    return tax
+
+
+def test_statutory_tax_matches_per_row_loop():
+    base = tax_base(load_nts_table()).base
+    samples = np.concatenate([base, CURRENT_THRESHOLDS, [0.0, 123.4, 250_000.0]])
+    expected = [_loop_tax(b, CURRENT_THRESHOLDS, CURRENT_RATES) for b in samples]
+    np.testing.assert_allclose(statutory_tax(samples, CURRENT_THRESHOLDS, CURRENT_RATES), expected)
+
+
+def test_stacked_rate_tables_match_one_at_a_time():
+    df = load_nts_table()
+    base = tax_base(df)
+    tables = np.stack([CURRENT_RATES, CURRENT_RATES + 0.02, np.full(CURRENT_RATES.size, 0.2)])
+
+    stacked = simulate(tables, df=df)
+    for i, rates in enumerate(tables):
+        expected = [max(actual + _loop_tax(b, CURRENT_THRESHOLDS, rates) - _loop_tax(b, CURRENT_THRESHOLDS, CURRENT_RATES), 0.0)
+                    for b, actual in zip(base.base, base.actual_tax)]
+        np.testing.assert_allclose(stacked.tax_after[i], expected)
+        np.testing.assert_allclose(simulate(rates, df=df).tax_after, expected)
+
+
+def test_current_rates_leave_revenue_unchanged():
+    result = simulate(CURRENT_RATES, df=load_nts_table())
+    assert np.isclose(result.revenue_change, 0.0)
+    np.testing.assert_allclose(result.change_per_person, 0.0, atol=1e-9)
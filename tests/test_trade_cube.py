@@ -0,0 +1,90 @@
+import numpy as np
+import pandas as pd
+
+from trade_cube import ALL, MEASURES, TradeCube
+from trade_interactive import lttb_indices
+
+
+def _table(seed=0, rows=3_000):
+    # 지역 · 품목 조합 대부분이 비어 있는 K-stat 모양의 긴 표
+    rng = np.random.default_rng(seed)
+    exports = rng.integers(0, 10_000_000, rows).astype(np.float64)
+    imports = rng.integers(0, 10_000_000, rows).astype(np.float64)
+    return pd.DataFrame({
+        "Year": rng.integers(2019, 2025, rows),
+        "Month": rng.integers(1, 13, rows),
+        "Region": rng.choice(["중국", "미국", "베트남", "일본", "EU"], rows),
+        "Item": rng.choice([f"HS{i:02d}" for i in range(40)], rows),
+        "Exports": exports,
+        "Imports": imports,
+        "Trade_Balance": exports - imports,
+    })
+
+
+def _groupby_series(table, grain, region, item):
+    # 예전 방식: 고른 조각을 기간 단위로 group-by 해서 더한다. (10억 달러)
+    month = {"year": 1, "quarter": (table["Month"] - 1) // 3 * 3 + 1, "month": table["Month"]}[grain]
+    table = table.assign(Date=pd.to_datetime(pd.DataFrame({"year": table["Year"], "month": month, "day": 1})))
+    periods = np.sort(table["Date"].unique())
+    if region != ALL:
+        table = table[table["Region"] == region]
+    if item != ALL:
+        table = table[table["Item"] == item]
+    sums = table.groupby("Date")[list(MEASURES)].sum().reindex(periods, fill_value=0.0)
+    return sums / 1e6
+
+
+def test_save_load_round_trip_keeps_sparse_cells(tmp_path):
+    cube = TradeCube.from_table(_table())
+    directory = str(tmp_path / "cube")
+    cube.save(directory)
+    loaded = TradeCube.load(directory)
+
+    assert loaded.grains == cube.grains == ["month", "quarter", "year"]
+    assert loaded.regions == cube.regions and loaded.items == cube.items
+    for grain in cube.grains:
+        keys, values = cube.cells[grain]
+        loaded_keys, loaded_values = loaded.cells[grain]
+        assert isinstance(loaded_keys, np.memmap)
+        np.testing.assert_array_equal(loaded_keys, keys)
+        np.testing.assert_array_equal(loaded_values, values)
+        # 값이 있는 칸만 들고 있다
+        assert len(keys) < len(cube.dates[grain]) * cube.n_region * cube.n_item
+        assert (np.diff(keys) > 0).all()
+
+
+def test_series_matches_pandas_groupby():
+    table = _table(seed=1)
+    cube = TradeCube.from_table(table)
+    for grain in cube.grains:
+        for region, item in [(ALL, ALL), ("중국", ALL), (ALL, "HS07"), ("미국", "HS31")]:
+            expected = _groupby_series(table, grain, region, item)
+            got = cube.series(grain, region, item)
+            np.testing.assert_array_equal(got["Date"].to_numpy(), expected.index.to_numpy())
+            np.testing.assert_allclose(got[list(MEASURES)].to_numpy(), expected.to_numpy())
+
+
+def test_annual_table_without_region_or_item_builds_year_grain_only():
+    table = _table(seed=2).drop(columns=["Month", "Region", "Item"])
+    cube = TradeCube.from_table(table)
+    assert cube.grains == ["year"] and not cube.has_regions
+    expected = table.groupby("Year")[list(MEASURES)].sum() / 1e6
+    np.testing.assert_allclose(cube.series("year")[list(MEASURES)].to_numpy(), expected.to_numpy())
+
+
+def test_lttb_keeps_endpoints_and_returns_n_out_points():
+    rng = np.random.default_rng(3)
+    for n, n_out in [(10_000, 500), (1_000, 3), (100, 99), (5_001, 1_000)]:
+        x = np.arange(n, dtype=np.float64)
+        y = np.cumsum(rng.normal(size=n))
+        picked = lttb_indices(x, y, n_out)
+        assert len(picked) == n_out
+        assert picked[0] == 0 and picked[-1] == n - 1
+        assert (np.diff(picked) > 0).all()
+
+
+def test_lttb_keeps_a_lone_spike_and_passes_short_series_through():
+    y = np.zeros(2_000)
+    y[1_234] = 50.0
+    assert 1_234 in lttb_indices(np.arange(2_000), y, 100)
+    np.testing.assert_array_equal(lttb_indices(np.arange(50), np.ones(50), 80), np.arange(50))
@@ -0,0 +1,39 @@
+import numpy as np
+
+import trade_scenarios
+from trade_scenarios import QUANTILES, ScenarioParams, ScenarioResult, run
+
+
+def test_higher_start_oil_price_raises_deficit_probability():
+    base = ScenarioParams(paths=20_000)
+    low = run(base._replace(oil_start=50.0))
+    high = run(base._replace(oil_start=120.0))
+    assert high.p_any_deficit > low.p_any_deficit
+    assert (high.p_deficit >= low.p_deficit).all()
+    assert high.annual_balance_q[2] < low.annual_balance_q[2]
+
+
+def test_start_price_at_reference_leaves_imports_unscaled():
+    params = ScenarioParams(paths=1_000, oil_vol=0.0, shock_prob=0.0, import_vol=0.0, import_drift=0.0,
+                            oil_start=80.0, oil_reference=80.0, seasonal=[1.0] * 12)
+    _, imports, _, _ = trade_scenarios.simulate_chunk(params, 1_000, np.random.SeedSequence(0))
+    np.testing.assert_allclose(imports, params.import_base, rtol=1e-5)
+
+
+def test_seasonal_list_is_accepted():
+    params = ScenarioParams(paths=1_000, seasonal=list(np.linspace(0.9, 1.1, 12)))
+    assert run(params) is run(params._replace(seasonal=tuple(params.seasonal)))
+
+
+def test_merged_chunk_quantiles_match_pooled_paths():
+    params = ScenarioParams(paths=30_000)
+    sizes = [12_000, 12_000, 6_000]
+    seeds = np.random.SeedSequence(params.seed).spawn(len(sizes))
+    parts = [trade_scenarios._chunk_summary(params, n, s) for n, s in zip(sizes, seeds)]
+    balance = np.concatenate([trade_scenarios.simulate_chunk(params, n, s)[2] for n, s in zip(sizes, seeds)])
+
+    result = ScenarioResult(params, parts)
+    spread = np.percentile(balance, 95, axis=0) - np.percentile(balance, 5, axis=0)
+    error = np.abs(result.balance_q - np.percentile(balance, QUANTILES, axis=0))
+    assert (error <= 0.01 * spread).all()
+    assert np.allclose(result.p_deficit, (balance < 0).mean(axis=0))
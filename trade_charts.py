@@ -0,0 +1,134 @@
+import matplotlib.dates as mdates
+from matplotlib.patches import Circle
+
+from chart_render import create_figure
+from profiling import lazy_import
+
+sns = lazy_import("seaborn")  # 팔레트 하나만 쓰므로 처음 그릴 때 불러온다.
+
+# ==============================================================================
+# [Trade.py 차트] 데이터 → Figure 를 돌려주는 함수만 모아 둔 곳
+# ------------------------------------------------------------------------------
+# 화면(Streamlit) 코드와 분리해 두어야 그림 캐시(figure_cache)가 입력 데이터로 키를 만들고,
+# 서버 없이도 같은 차트를 그릴 수 있다.
+# ==============================================================================
+
+STYLE = "whitegrid"
+
+
+def macro_trend(df):
+    # Chart 1. 수출입 매크로 트렌드 (Line Chart)
+    fig1, ax1 = create_figure("trade.macro_trend", (10, 5), STYLE)
+
+    # 그래프 그리기
+    ax1.plot(df['Date'], df['Exports'], label='수출액 (Exports)', color='#004c70', linewidth=3, marker='o') # 짙은 파랑
+    ax1.plot(df['Date'], df['Imports'], label='수입액 (Imports)', color='#d45087', linewidth=3, marker='s', linestyle='--') # 짙은 분홍
+
+    # 골든크로스(흑자) 구간 색칠
+    ax1.fill_between(df['Date'], df['Exports'], df['Imports'],
+                     where=(df['Exports'] >= df['Imports']), interpolate=True, color='#004c70', alpha=0.1)
+
+    # 주석 달기 (최고점)
+    max_date = df['Date'][df['Exports'].idxmax()]
+    max_val = df['Exports'].max()
+    ax1.annotate(f'역대 최대 실적\n(${max_val:.1f}B)', xy=(max_date, max_val), xytext=(0, 20),
+                 textcoords='offset points', ha='center', fontsize=10, fontweight='bold',
+                 arrowprops=dict(arrowstyle='->', color='black'))
+
+    first_year, last_year = df['Date'].dt.year.iloc[0], df['Date'].dt.year.iloc[-1]
+    ax1.set_title(f"연도별 수출입 실적 추이 ({first_year}-{last_year})", fontsize=16, fontweight='bold', pad=20)
+    ax1.set_ylabel("금액 (10억 달러)", fontsize=12)
+    ax1.xaxis.set_major_formatter(mdates.DateFormatter('%Y'))
+    ax1.legend(loc='upper left', fontsize=12)
+    return fig1
+
+
+def trade_balance(df):
+    # Chart 2. 무역수지 리스크 관리 (Bar Chart)
+    fig2, ax2 = create_figure("trade.trade_balance", (10, 5), STYLE)
+
+    # 흑자(파랑) / 적자(빨강) 조건부 색상 지정
+    colors = ['#005eb8' if x >= 0 else '#e03a3e' for x in df['Trade_Balance']]
+    ax2.bar(df['Date'], df['Trade_Balance'], color=colors, alpha=0.8, width=250) # 폭 단위: 일(day)
+    ax2.axhline(0, color='black', linewidth=1) # 0점 기준선
+
+    ax2.set_title("연도별 무역수지 흑자/적자 변동폭", fontsize=16, fontweight='bold', pad=20)
+    ax2.set_ylabel("수지 (10억 달러)", fontsize=12)
+    ax2.xaxis.set_major_formatter(mdates.DateFormatter('%Y'))
+    ax2.grid(axis='y', linestyle='--', alpha=0.5)
+    return fig2
+
+
+def region_donut(regions, shares, explode):
+    # Chart 3. 글로벌 포트폴리오 (Donut Chart)
+    fig3, ax3 = create_figure("trade.region_donut", (6, 6), STYLE)
+
+    # 도넛 차트
+    wedges, texts, autotexts = ax3.pie(shares, labels=regions, autopct='%1.1f%%', startangle=140,
+                                       explode=explode, colors=sns.color_palette('pastel'), pctdistance=0.85,
+                                       textprops={'fontsize': 12, 'weight': 'bold'})
+
+    # 가운데 원으로 구멍 뚫기
+    centre_circle = Circle((0, 0), 0.70, fc='white')
+    ax3.add_artist(centre_circle)
+
+    ax3.set_title("권역별 수출 비중 목표치", fontsize=16, fontweight='bold')
+    return fig3
+
+
+def scenario_fan(data):
+    # Chart 4. 유가 충격 시나리오 (Monte Carlo 부채꼴 차트 + 월별 적자 확률)
+    fig4, ax4 = create_figure("trade.scenario_fan", (10, 5), STYLE)
+
+    x = range(len(data["labels"]))
+    q = dict(zip(data["quantiles"], data["balance_q"]))
+    ax4.fill_between(x, q[5], q[95], color='#004c70', alpha=0.15, label='90% 구간 (5~95%)')
+    ax4.fill_between(x, q[25], q[75], color='#004c70', alpha=0.30, label='50% 구간 (25~75%)')
+    ax4.plot(x, q[50], color='#004c70', linewidth=3, marker='o', label='중앙값')
+    ax4.axhline(0, color='black', linewidth=1)
+    ax4.set_xticks(list(x), data["labels"])
+    ax4.set_ylabel("월 무역수지 (10억 달러)", fontsize=12)
+    ax4.set_title(f"유가 충격 시나리오: 월 무역수지 분포 ({data['paths']:,}개 경로)",
+                  fontsize=16, fontweight='bold', pad=20)
+
+    # 오른쪽 축: 그 달 적자일 확률 (막대)
+    ax5 = ax4.twinx()
+    ax5.bar(x, data["p_deficit"] * 100, color='#e03a3e', alpha=0.25, width=0.5, label='적자 확률 (오른쪽 축)')
+    ax5.set_ylabel("적자 확률 (%)", fontsize=12, color='#e03a3e')
+    ax5.set_ylim(0, max(100 * float(data["p_deficit"].max()) * 1.5, 10))
+    ax5.grid(False)
+    ax4.set_zorder(ax5.get_zorder() + 1)
+    ax4.patch.set_visible(False)
+
+    lines, labels = ax4.get_legend_handles_labels()
+    bars, bar_labels = ax5.get_legend_handles_labels()
+    ax4.legend(lines + bars, labels + bar_labels, loc='upper left', fontsize=10)
+    return fig4
+
+
+def forecast_fan(data):
+    # Chart 5. 수출입 전망 (실적 + 추세 + Holt 예측과 80/95% 예측 구간)
+    fig5, ax5 = create_figure("trade.forecast_fan", (10, 5), STYLE)
+
+    colors = ['#004c70', '#d45087']
+    for i, (name, color) in enumerate(zip(data["names"], colors)):
+        label = {"Exports": "수출", "Imports": "수입", "Trade_Balance": "무역수지"}.get(name, name)
+        ax5.plot(data["dates"], data["values"][i], color=color, linewidth=2, marker='o', markersize=4,
+                 label=f'{label} 실적')
+        ax5.plot(data["dates"], data["trend"][i], color=color, linewidth=1, linestyle=':', alpha=0.8)
+
+        # 마지막 실적에서 예측 선 · 구간을 이어 준다
+        last = data["values"][i][-1]
+        dates = [data["dates"][-1], *data["future_dates"]]
+        for level, alpha in ((0.95, 0.10), (0.8, 0.20)):
+            ax5.fill_between(dates, [last, *data["lower"][level][i]], [last, *data["upper"][level][i]],
+                             color=color, alpha=alpha)
+        ax5.plot(dates, [last, *data["mean"][i]], color=color, linewidth=2.5, linestyle='--',
+                 marker='D', markersize=5, label=f'{label} 예측 (80/95% 구간)')
+
+    ax5.axvline(data["dates"][-1], color='gray', linewidth=1, linestyle='--')
+    ax5.set_title("수출입 추세와 전망 (Holt 지수평활, 점선: 이동평균 추세)", fontsize=16, fontweight='bold', pad=20)
+    ax5.set_ylabel("금액 (10억 달러)", fontsize=12)
+    ax5.xaxis.set_major_formatter(mdates.DateFormatter('%Y'))
+    ax5.legend(loc='upper left', fontsize=10)
+    return fig5
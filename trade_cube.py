@@ -0,0 +1,295 @@
+import os
+import sys
+import json
+import shutil
+import argparse
+import threading
+
+import numpy as np
+import pandas as pd
+
+from data_loader import cache_dir
+
+# ==============================================================================
+# [무역 큐브] 기간 단위 × 지역 × 품목으로 미리 다 더해 둔 표 (사전 집계)
+# ------------------------------------------------------------------------------
+# 국가별 · HS 코드별 K-stat 자료를 넣으면 차트 하나하나가 수십만 줄 group-by 가 된다.
+# 여기서는 한 번만 더해서 기간 단위(월 / 분기 / 연)마다 '값이 있는 칸'만 열 두 개로 들고 있는다.
+#   칸 번호 : (기간 × (지역 + 1) + 지역) × (품목 + 1) + 품목     정렬된 int64 배열
+#   값      : (칸, 측정값)  측정값 = 수출 · 수입 · 수지 (천 달러)
+#   마지막 지역 · 품목 번호는 '전체' (그 축으로 다 더한 값). 전체 × 전체 = 나라 전체 합계.
+#   '전체' 칸도 값이 있는 칸만 만든다. 그래서 메모리는 기간 × 지역 × 품목 전부가 아니라
+#   실제로 자료가 있는 칸 수에 비례한다 (국가 × HS 코드 월별 자료도 대부분의 조합은 비어 있음).
+# → 선 · 막대 차트는 (기간마다, 전체, 전체) 칸, 도넛은 (한 기간, 지역마다, 전체) 칸을 np.searchsorted 로 찾는다.
+#   찾는 비용은 결과 칸 수 × log(칸 수) (다시 더하지 않음). 없는 칸은 0.
+#
+# - 만들기 : 줄마다 칸 번호를 만들어 np.unique + np.bincount 로 같은 칸끼리 더하고,
+#            그 칸들을 '전체' 칸 번호로도 바꿔 한 번 더 더한다. 분기 · 연 단위도 같은 방법으로.
+#            월 자료가 없으면(연도별 총괄표) 연 단위만 만든다.
+# - 저장   : .cache/cubes/<원본 이름>.v<FORMAT>/  기간 단위별 칸 번호 · 값 .npy + index.json (축 이름표)
+#            다음 프로세스는 .npy 를 memory-map 해서 찾는 칸만 읽는다.
+#            원본 Parquet 이름이 내용 해시라서 원본이 바뀌면 다른 폴더가 된다.
+# - 지역 · 품목 열이 없는 표(지금 저장소의 총괄표)는 그 축에 '전체' 한 칸만 있다.
+#   Trade.py 는 지역 자료가 없으면 dashboard_data 의 권역 비중(고정값)으로 도넛을 그린다.
+#
+#   python trade_cube.py              → 지금 K-stat 표로 큐브를 만들고 크기 출력
+# ==============================================================================
+
+GRAINS = ("month", "quarter", "year")
+MEASURES = ("Exports", "Imports", "Trade_Balance")
+ALL = "전체"
+INDEX_NAME = "index.json"
+FORMAT = 2      # 저장 모양이 바뀌면 올린다 (1 = 밀집 배열). 폴더 이름에 붙어서 옛 캐시를 읽지 않는다.
+
+_cubes = {}
+_lock = threading.Lock()
+
+
+def _period_codes(table, grain):
+    # 줄마다 기간 번호와 그 기간의 시작 날짜
+    year = table["Year"].to_numpy(dtype=np.int64)
+    if grain == "year":
+        key = year
+        month = np.ones_like(year)
+    else:
+        month = table["Month"].to_numpy(dtype=np.int64)
+        if grain == "quarter":
+            month = (month - 1) // 3 * 3 + 1
+        key = year * 12 + month - 1
+    _, first, codes = np.unique(key, return_index=True, return_inverse=True)
+    start = pd.to_datetime(pd.DataFrame({"year": year[first], "month": month[first], "day": 1}))
+    return codes, start.to_numpy()
+
+
+def _axis_codes(table, column):
+    # 지역 · 품목 번호. 열이 없으면 그 축은 '전체' 한 칸뿐이라 모든 줄이 번호 0 (이름표 없음)
+    if column not in table.columns:
+        return np.zeros(len(table), dtype=np.int64), []
+    codes, uniques = pd.factorize(table[column], sort=True)
+    return codes, [str(u) for u in uniques]
+
+
+def _sum_cells(keys, values):
+    # 같은 칸 번호끼리 더한다 → 정렬된 칸 번호, (칸, 측정값) 합
+    cells, inverse = np.unique(keys, return_inverse=True)
+    sums = np.stack([np.bincount(inverse, weights=values[:, m], minlength=len(cells))
+                     for m in range(values.shape[1])], axis=-1)
+    return cells, sums
+
+
+def _add_totals(keys, values, n_region, n_item):
+    # 칸마다 '전체' 칸(지역 전체 · 품목 전체 · 둘 다)에도 더한다. 축에 이름표가 없으면(한 칸뿐) 그 축은 이미 전체.
+    period, rest = np.divmod(keys, n_region * n_item)
+    region, item = np.divmod(rest, n_item)
+    regions = [region] if n_region == 1 else [region, np.full_like(region, n_region - 1)]
+    items = [item] if n_item == 1 else [item, np.full_like(item, n_item - 1)]
+    parts = [(period * n_region + r) * n_item + i for r in regions for i in items]
+    return _sum_cells(np.concatenate(parts), np.concatenate([values] * len(parts)))
+
+
+def build_cells(table):
+    # K-stat 표 (긴 모양) → {기간 단위: (칸 번호, 값)}, 이름표
+    regions_codes, regions = _axis_codes(table, "Region")
+    items_codes, items = _axis_codes(table, "Item")
+    n_region, n_item = len(regions) + 1, len(items) + 1
+    measures = np.stack([table[m].to_numpy(dtype=np.float64) for m in MEASURES], axis=-1)
+
+    grains = [g for g in GRAINS if g == "year" or "Month" in table.columns]
+    cells, periods = {}, {}
+    for grain in grains:
+        time_codes, starts = _period_codes(table, grain)
+        keys = (time_codes * n_region + regions_codes) * n_item + items_codes
+        cells[grain] = _add_totals(*_sum_cells(keys, measures), n_region, n_item)
+        periods[grain] = [str(pd.Timestamp(s).date()) for s in starts]
+    index = {"format": FORMAT, "grains": grains, "periods": periods, "regions": regions, "items": items,
+             "measures": list(MEASURES)}
+    return cells, index
+
+
+def _merge_cells(old, new):
+    # 정렬된 두 칸 목록을 합친다. 이미 있는 칸은 값을 더하고, 없던 칸은 제자리에 끼운다.
+    keys, values = old
+    new_keys, new_values = new
+    values = np.array(values)  # memory-map 일 수 있어서 복사
+    pos = np.searchsorted(keys, new_keys)
+    hit = pos < len(keys)
+    hit[hit] = np.asarray(keys)[pos[hit]] == new_keys[hit]
+    values[pos[hit]] += new_values[hit]
+    return (np.insert(keys, pos[~hit], new_keys[~hit]),
+            np.insert(values, pos[~hit], new_values[~hit], axis=0))
+
+
+class TradeCube:
+    def __init__(self, cells, index):
+        self.cells = cells
+        self.index = index
+        self.grains = index["grains"]
+        self.regions = index["regions"]
+        self.items = index["items"]
+        self.n_region, self.n_item = len(self.regions) + 1, len(self.items) + 1
+        self.dates = {grain: pd.to_datetime(index["periods"][grain]).to_numpy() for grain in self.grains}
+        self._region_pos = {name: i for i, name in enumerate(self.regions)}
+        self._item_pos = {name: i for i, name in enumerate(self.items)}
+        self._series = {}
+        self._lock = threading.Lock()
+
+    @property
+    def has_regions(self):
+        return bool(self.regions)
+
+    def _pos(self, positions, name):
+        return len(positions) if name == ALL else positions[name]
+
+    def _lookup(self, grain, period, region, item):
+        # 칸 (기간, 지역, 품목) 번호들(방송됨)의 값 → (칸, 측정값). 없는 칸은 0.
+        keys, values = self.cells[grain]
+        wanted = np.ravel((np.asarray(period) * self.n_region + region) * self.n_item + item)
+        out = np.zeros((len(wanted), len(MEASURES)))
+        if len(keys):
+            pos = np.minimum(np.searchsorted(keys, wanted), len(keys) - 1)
+            hit = np.asarray(keys[pos]) == wanted
+            out[hit] = values[pos[hit]]
+        return out
+
+    def cell(self, grain, region=ALL, item=ALL):
+        # (기간, 측정값) 배열. 천 달러.
+        periods = np.arange(len(self.dates[grain]))
+        return self._lookup(grain, periods, self._pos(self._region_pos, region), self._pos(self._item_pos, item))
+
+    def series(self, grain="year", region=ALL, item=ALL):
+        # trade_series 와 같은 모양(Date + 10억 달러)의 표. 같은 조각은 같은 DataFrame 을 돌려준다
+        # (derived() 나 그림 캐시가 rerun 마다 다시 계산하지 않도록).
+        key = (grain, region, item)
+        with self._lock:
+            df = self._series.get(key)
+            if df is None:
+                values = self.cell(grain, region, item) / 1e6
+                df = pd.DataFrame({"Date": self.dates[grain],
+                                   **{m: values[:, i] for i, m in enumerate(MEASURES)}})
+                self._series[key] = df
+        return df
+
+    def shares(self, by="region", grain="year", period=-1, other=ALL, measure="Exports"):
+        # 한 기간의 지역별(또는 품목별) 비중(%). other 는 반대 축에서 고를 칸 (기본 전체)
+        m = MEASURES.index(measure)
+        period = period % len(self.dates[grain])
+        if by == "region":
+            labels = self.regions
+            values = self._lookup(grain, period, np.arange(len(labels)), self._pos(self._item_pos, other))[:, m]
+        else:
+            labels = self.items
+            values = self._lookup(grain, period, self._pos(self._region_pos, other), np.arange(len(labels)))[:, m]
+        total = values.sum()
+        return labels, (values / total * 100 if total else values)
+
+    def extended(self, rows):
+        # 새로 붙은 줄만 더한 새 큐브와 기간 단위별 '처음 바뀐 기간 번호'. (지금 큐브는 그대로: 읽는 세션이 있음)
+        # 새 줄만 작은 큐브로 만들어 칸 번호를 이 큐브 기준으로 바꾼 뒤 합친다. 처음 보는 지역 · 품목이 있거나
+        # 기존 기간 사이에 끼는 기간이 생기면 None → 부르는 쪽이 처음부터 다시 만든다.
+        cells, index = build_cells(rows)
+        if (index["grains"] != self.grains
+                or not set(index["regions"]) <= self._region_pos.keys()
+                or not set(index["items"]) <= self._item_pos.keys()
+                or (self.regions and not index["regions"]) or (self.items and not index["items"])):
+            return None
+        region_map = np.array([self._region_pos[name] for name in index["regions"]] + [len(self.regions)])
+        item_map = np.array([self._item_pos[name] for name in index["items"]] + [len(self.items)])
+        n_region, n_item = len(index["regions"]) + 1, len(index["items"]) + 1
+
+        grown, periods, first_changed = {}, {}, {}
+        for grain in self.grains:
+            old = self.index["periods"][grain]
+            positions = {label: i for i, label in enumerate(old)}
+            added = [label for label in index["periods"][grain] if label not in positions]
+            if added and old and added[0] < old[-1]:
+                return None
+            for label in added:
+                positions[label] = len(positions)
+            period_map = np.array([positions[label] for label in index["periods"][grain]])
+            keys, values = cells[grain]
+            period, rest = np.divmod(keys, n_region * n_item)
+            region, item = np.divmod(rest, n_item)
+            keys = (period_map[period] * self.n_region + region_map[region]) * self.n_item + item_map[item]
+            order = np.argsort(keys)
+            grown[grain] = _merge_cells(self.cells[grain], (keys[order], values[order]))
+            periods[grain], first_changed[grain] = old + added, int(period_map.min())
+        return TradeCube(grown, dict(self.index, periods=periods)), first_changed
+
+    # --------------------------------------------------------------------------
+    # 저장 / 읽기
+    # --------------------------------------------------------------------------
+    def save(self, directory):
+        # 임시 폴더에 다 쓴 뒤 이름을 바꾼다 (다른 프로세스가 반쯤 쓴 큐브를 읽지 않도록)
+        tmp = f"{directory}.{os.getpid()}.tmp"
+        os.makedirs(tmp, exist_ok=True)
+        for grain, (keys, values) in self.cells.items():
+            np.save(os.path.join(tmp, f"{grain}.keys.npy"), keys)
+            np.save(os.path.join(tmp, f"{grain}.values.npy"), values)
+        with open(os.path.join(tmp, INDEX_NAME), "w", encoding="utf-8") as f:
+            json.dump(self.index, f, ensure_ascii=False)
+        try:
+            os.rename(tmp, directory)
+        except OSError:  # 다른 프로세스가 먼저 만들었음
+            shutil.rmtree(tmp, ignore_errors=True)
+
+    @classmethod
+    def load(cls, directory):
+        with open(os.path.join(directory, INDEX_NAME), encoding="utf-8") as f:
+            index = json.load(f)
+        cells = {grain: (np.load(os.path.join(directory, f"{grain}.keys.npy"), mmap_mode="r"),
+                         np.load(os.path.join(directory, f"{grain}.values.npy"), mmap_mode="r"))
+                 for grain in index["grains"]}
+        return cls(cells, index)
+
+    @classmethod
+    def from_table(cls, table):
+        return cls(*build_cells(table))
+
+
+def region_donut_args(cube):
+    # Chart 3 도넛 입력 (권역, 비중 %, 띄우기). 지역 자료가 있으면 최근 연도 수출 비중에서 가장 큰 곳을 띄우고,
+    # 없으면 dashboard_data 의 고정 권역 비중을 쓴다.
+    if not cube.has_regions:
+        from dashboard_data import TRADE_REGIONS, TRADE_REGION_SHARES, TRADE_REGION_EXPLODE
+        return TRADE_REGIONS, TRADE_REGION_SHARES, TRADE_REGION_EXPLODE
+    regions, shares = cube.shares("region", "year")
+    explode = tuple(0.05 if i == shares.argmax() else 0 for i in range(len(regions)))
+    return list(regions), shares.round(1).tolist(), explode
+
+
+def kstat_cube(path=None):
+    # Trade.py 입구: K-stat 표의 큐브. 프로세스 안에서는 한 번, 디스크에 있으면 memory-map 으로.
+    from kstat_import import KSTAT_FILE, import_workbook, load_kstat_table
+
+    path = path or KSTAT_FILE
+    name = os.path.splitext(os.path.basename(import_workbook(path)))[0]  # 원본 내용 해시
+    with _lock:
+        cube = _cubes.get(name)
+        if cube is not None:
+            return cube
+        directory = os.path.join(cache_dir("cubes"), f"{name}.v{FORMAT}")
+        if os.path.exists(os.path.join(directory, INDEX_NAME)):
+            cube = TradeCube.load(directory)
+        else:
+            cube = TradeCube.from_table(load_kstat_table(path))
+            cube.save(directory)
+        _cubes[name] = cube
+    return cube
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="K-stat 표로 기간 × 지역 × 품목 집계 큐브를 만듭니다.")
+    parser.add_argument("path", nargs="?", default=None, help="K-stat 엑셀 (기본: 저장소의 총괄표)")
+    args = parser.parse_args(argv)
+
+    cube = kstat_cube(args.path)
+    print(f"지역 {len(cube.regions)}개, 품목 {len(cube.items)}개")
+    for grain in cube.grains:
+        keys, values = cube.cells[grain]
+        print(f"  {grain}: 기간 {len(cube.dates[grain])}개, 칸 {len(keys):,}개 "
+              f"{(keys.nbytes + values.nbytes) / 1024:,.1f}KB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
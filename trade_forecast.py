@@ -0,0 +1,250 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+# ==============================================================================
+# [무역 전망] 추세 · 계절 분해 + Holt(-Winters) 예측, 예측 구간 포함
+# ------------------------------------------------------------------------------
+# Trade.py 의 "연중 고공행진" 같은 전망을 글이 아니라 적합한 모형으로 보여주려는 것.
+# 수출 · 수입 · 수지 세 계열을 (계열, 시점) 배열 하나로 쌓아서 한꺼번에 계산한다.
+#   분해 : 추세 = 중심 이동평균 (슬라이딩 창 × 가중치, 행렬곱 한 번), 계절 = 추세를 뺀 값의 같은 달 평균
+#          계절은 주기가 1보다 클 때(월별 자료)만. 연도별 자료는 추세 + 나머지.
+#   예측 : Holt 선형 추세 지수평활 (월별이면 가법 계절을 더한 Holt-Winters)
+#          평활 계수(α, β, γ)는 격자 전체를 배열 한 축으로 놓고 한 번에 굴려서 고른다.
+#          예측 구간은 ETS(A,A,N/A) 의 h 단계 분산 공식으로.
+# - 같은 값의 계열이면 적합한 모형을 다시 쓴다 (키 = 값의 해시, 세션끼리 공유).
+# - 기억해 둔 모형의 계열이 새 계열의 앞부분과 같으면 (= 새 달이 붙었으면)
+#   계수는 그대로 두고 새 시점만 점화식으로 이어서 돌린다. REFIT_EVERY 개가 쌓이면 다시 적합.
+# ==============================================================================
+
+SERIES = ("Exports", "Imports", "Trade_Balance")
+LEVELS = (0.80, 0.95)
+Z = {0.80: 1.2816, 0.95: 1.9600}
+ALPHAS = np.linspace(0.05, 0.95, 19)
+BETAS = np.linspace(0.0, 0.5, 11)
+GAMMAS = np.linspace(0.0, 0.5, 6)
+ANNUAL_TREND_WINDOW = 3     # 연도별 자료의 추세 이동평균 폭 (년)
+REFIT_EVERY = 12            # 이어서 돌린 시점이 이만큼 쌓이면 계수를 다시 고른다
+MODEL_CACHE_SIZE = 64
+
+_models = OrderedDict()     # 값 해시 → HoltModel
+_lock = threading.Lock()
+
+
+def infer_period(dates):
+    # 날짜 간격으로 주기를 정한다: 월별 → 12, 분기별 → 4, 그 외(연도별) → 1
+    days = np.median(np.diff(pd.DatetimeIndex(dates).to_numpy().astype("datetime64[D]").astype(np.int64)))
+    if days < 45:
+        return 12
+    if days < 120:
+        return 4
+    return 1
+
+
+def _digest(values):
+    return hashlib.sha1(np.ascontiguousarray(values, dtype=np.float64).tobytes()).hexdigest()
+
+
+# ------------------------------------------------------------------------------
+# 분해
+# ------------------------------------------------------------------------------
+def _centered_mean(values, window):
+    # (계열, 시점) 의 중심 이동평균. 짝수 폭은 2×window 이동평균 (고전적 분해와 같음). 양 끝은 NaN.
+    if window % 2 == 0:
+        weights = np.r_[0.5, np.ones(window - 1), 0.5] / window
+    else:
+        weights = np.ones(window) / window
+    k = weights.size
+    out = np.full(values.shape, np.nan)
+    if values.shape[-1] < k:
+        return out
+    windows = np.lib.stride_tricks.sliding_window_view(values, k, axis=-1)
+    out[..., k // 2: values.shape[-1] - k // 2] = windows @ weights
+    return out
+
+
+def decompose(values, period):
+    # values: (계열, 시점) → 추세, 계절, 나머지 (모두 같은 모양)
+    values = np.atleast_2d(np.asarray(values, dtype=np.float64))
+    window = period if period > 1 else ANNUAL_TREND_WINDOW
+    trend = _centered_mean(values, window)
+    seasonal = np.zeros_like(values)
+    if period > 1 and values.shape[-1] >= 2 * period:
+        detrended = values - trend
+        n = values.shape[-1]
+        padded = np.full(values.shape[:-1] + (-(-n // period) * period,), np.nan)
+        padded[..., :n] = detrended
+        means = np.nanmean(padded.reshape(values.shape[:-1] + (-1, period)), axis=-2)
+        means -= means.mean(axis=-1, keepdims=True)
+        seasonal = np.take(means, np.arange(n) % period, axis=-1)
+    return trend, seasonal, values - trend - seasonal
+
+
+# ------------------------------------------------------------------------------
+# Holt(-Winters) 모형
+# ------------------------------------------------------------------------------
+def _init_state(values, period):
+    # 초기 수준 · 추세 · 계절 (계열마다)
+    if period > 1:
+        first, second = values[:, :period], values[:, period:2 * period]
+        level = first.mean(axis=1)
+        trend = (second.mean(axis=1) - level) / period
+        season = first - level[:, None]
+    else:
+        level = values[:, 0].copy()
+        trend = values[:, 1] - values[:, 0]
+        season = np.zeros((values.shape[0], 1))
+    return level, trend, season
+
+
+def _run(values, alpha, beta, gamma, level, trend, season, start, period):
+    # 점화식을 start 시점부터 끝까지 돌린다. alpha 등은 (격자, 1) 또는 (1, 계열)로 방송(broadcast)된다.
+    # 돌려주는 값: 한 단계 앞 예측오차 제곱합, 마지막 수준 · 추세 · 계절 (계절은 (.., 계열, 주기) 고리 버퍼)
+    sse = 0.0
+    for t in range(start, values.shape[1]):
+        y = values[:, t]
+        s = season[..., t % period]
+        error = y - (level + trend + s)
+        sse = sse + error ** 2
+        new_level = alpha * (y - s) + (1 - alpha) * (level + trend)
+        trend = beta * (new_level - level) + (1 - beta) * trend
+        if period > 1:
+            season = season.copy()
+            season[..., t % period] = gamma * (y - new_level) + (1 - gamma) * s
+        level = new_level
+    return sse, level, trend, season
+
+
+class HoltModel:
+    # 한 번 적합한 결과. 계열마다 계수가 따로 있다.
+    def __init__(self, values, period):
+        self.period = period
+        self.values = values
+        self.seasonal = period > 1 and values.shape[1] >= 2 * period
+        self._fit()
+
+    def _fit(self):
+        values, period = self.values, self.period if self.seasonal else 1
+        level0, trend0, season0 = _init_state(values, period)
+        start = period if period > 1 else 1
+
+        # 격자의 모든 (α, β, γ) 조합을 첫 축으로 쌓아서 한 번에 돌린다: (격자, 계열)
+        gammas = GAMMAS if period > 1 else np.zeros(1)
+        grid = np.array(np.meshgrid(ALPHAS, BETAS, gammas, indexing="ij")).reshape(3, -1)
+        alpha, beta, gamma = (g[:, None] for g in grid)
+        season = np.broadcast_to(season0, (grid.shape[1],) + season0.shape)
+        sse, *_ = _run(values, alpha, beta, gamma, level0, trend0, season, start, period)
+        best = np.argmin(sse, axis=0)
+        self.alpha, self.beta, self.gamma = grid[:, best]
+
+        self.sse, self.level, self.trend, self.season = _run(
+            values, self.alpha, self.beta, self.gamma, level0, trend0, season0, start, period)
+        self.n_fitted = values.shape[1] - start
+        self.since_fit = 0
+        self.digest = _digest(values)
+
+    def extend(self, values):
+        # values 가 지금 계열 + 새 시점들일 때: 계수는 그대로 두고 새 시점만 이어서 돌린다.
+        n = self.values.shape[1]
+        period = self.period if self.seasonal else 1
+        sse, self.level, self.trend, self.season = _run(
+            values, self.alpha, self.beta, self.gamma, self.level, self.trend, self.season, n, period)
+        self.sse = self.sse + sse
+        self.n_fitted += values.shape[1] - n
+        self.since_fit += values.shape[1] - n
+        self.values = values
+        self.digest = _digest(values)
+        if self.since_fit >= REFIT_EVERY or (not self.seasonal and self.period > 1
+                                             and values.shape[1] >= 2 * self.period):
+            self.seasonal = self.period > 1 and values.shape[1] >= 2 * self.period
+            self._fit()
+        return self
+
+    def forecast(self, horizon):
+        # 평균 (계열, h) 과 수준별 (하한, 상한)
+        period = self.period if self.seasonal else 1
+        n = self.values.shape[1]
+        h = np.arange(1, horizon + 1)
+        s = self.season[:, (n + h - 1) % period] if period > 1 else 0.0
+        mean = self.level[:, None] + h * self.trend[:, None] + s
+
+        # ETS(A,A,A) 분산: σ² (1 + Σ_{j<h} c_j²),  c_j = α(1 + β j) + γ·[j % m == 0]
+        n_params = 2 + (3 if period > 1 else 2)
+        sigma2 = self.sse / max(self.n_fitted - n_params, 1)
+        j = np.arange(1, horizon)
+        c = self.alpha[:, None] * (1 + self.beta[:, None] * j)
+        if period > 1:
+            c = c + self.gamma[:, None] * (j % period == 0)
+        var = sigma2[:, None] * (1 + np.concatenate([np.zeros((c.shape[0], 1)), np.cumsum(c ** 2, axis=1)], axis=1))
+        intervals = {level: (mean - Z[level] * np.sqrt(var), mean + Z[level] * np.sqrt(var)) for level in LEVELS}
+        return mean, intervals
+
+
+def fit(values, period):
+    # 같은 값이면 기억해 둔 모형, 앞부분이 같은 모형이 있으면 이어서, 없으면 새로 적합
+    values = np.atleast_2d(np.asarray(values, dtype=np.float64))
+    digest = _digest(values)
+    with _lock:
+        model = _models.get(digest)
+        if model is not None and model.period == period:
+            _models.move_to_end(digest)
+            return model
+        for old_digest, old in reversed(_models.items()):
+            n = old.values.shape[1]
+            if (old.period == period and old.values.shape[0] == values.shape[0] and n < values.shape[1]
+                    and _digest(values[:, :n]) == old_digest):
+                # 원래 모형은 그대로 두고 복사본을 이어 간다 (다른 세션이 아직 쓸 수 있음)
+                model = object.__new__(HoltModel)
+                model.__dict__.update(old.__dict__)
+                model.extend(values)
+                break
+        else:
+            model = HoltModel(values, period)
+        _models[digest] = model
+        while len(_models) > MODEL_CACHE_SIZE:
+            _models.popitem(last=False)
+    return model
+
+
+# ------------------------------------------------------------------------------
+# Trade.py 용
+# ------------------------------------------------------------------------------
+class TradeForecast:
+    # 계열은 SERIES 순서. 모든 배열의 첫 축이 계열.
+    def __init__(self, series, horizon):
+        dates = pd.DatetimeIndex(series["Date"])
+        self.period = infer_period(dates)
+        self.names = SERIES
+        self.dates = dates.to_numpy()
+        self.values = series[list(SERIES)].to_numpy(dtype=np.float64).T
+        self.trend, self.seasonal, self.resid = decompose(self.values, self.period)
+
+        model = fit(self.values, self.period)
+        self.model = model
+        self.mean, self.intervals = model.forecast(horizon)
+        step = pd.DateOffset(months=12 // self.period) if self.period > 1 else pd.DateOffset(years=1)
+        self.future_dates = pd.date_range(dates[-1] + step, periods=horizon, freq=step).to_numpy()
+
+    def chart_data(self, names=("Exports", "Imports")):
+        # trade_charts.forecast_fan 에 넘길 배열만
+        rows = [self.names.index(name) for name in names]
+        return {
+            "names": list(names),
+            "dates": self.dates,
+            "values": self.values[rows],
+            "trend": self.trend[rows],
+            "future_dates": self.future_dates,
+            "mean": self.mean[rows],
+            "lower": {level: lo[rows] for level, (lo, hi) in self.intervals.items()},
+            "upper": {level: hi[rows] for level, (lo, hi) in self.intervals.items()},
+        }
+
+
+def trade_forecast(series, horizon=None):
+    # 주기에 맞춰 기본 예측 기간: 월별 12개월, 분기별 4분기, 연도별 3년
+    if horizon is None:
+        horizon = {12: 12, 4: 4}.get(infer_period(series["Date"]), 3)
+    return TradeForecast(series, horizon)
@@ -0,0 +1,150 @@
+import os
+
+import numpy as np
+
+from data_loader import derived
+
+# ==============================================================================
+# [인터랙티브 차트] 긴 시계열을 화면 폭만큼만 솎아서 Vega-Lite 로 브라우저에 보낸다
+# ------------------------------------------------------------------------------
+# matplotlib 경로는 모든 점을 마커까지 서버에서 그려 PNG 로 보낸다. 수십 년치 월별(또는 일별 통관)
+# 자료면 그리는 시간과 이미지가 점 수에 비례해서 커진다. 여기서는
+#   - 보이는 구간만 잘라서 (정렬된 날짜라 np.searchsorted 두 번)
+#   - 점이 CHART_POINTS(≈ 차트 픽셀 폭)보다 많으면 솎는다
+#       선  : LTTB (Largest-Triangle-Three-Buckets) — 구간마다 모양을 가장 잘 살리는 점 하나
+#       막대: 최소/최대 솎기 — 구간마다 가장 낮은 점과 높은 점 (흑자 · 적자 극값을 놓치지 않음)
+#   - 작은 JSON(Vega-Lite 사양)으로 st.vega_lite_chart 에 넘긴다. (altair 없이 사양 dict 를 직접 만든다)
+# 그래서 보내는 점 수와 브라우저 그리기 시간은 자료 길이와 상관없이 계열당 CHART_POINTS 안쪽이다.
+# 확대는 Trade.py 의 기간 슬라이더: 좁은 구간을 고르면 그 구간만 다시 잘라서 솎으므로 더 촘촘해진다.
+# 차트 안에서는 마우스 휠로 이동 · 확대도 된다 (보낸 점 안에서).
+# ==============================================================================
+
+CHART_POINTS = int(os.environ.get("CHART_POINTS", "800"))
+SERIES_LABELS = {"Exports": "수출", "Imports": "수입", "Trade_Balance": "무역수지"}
+
+
+# ------------------------------------------------------------------------------
+# 솎기
+# ------------------------------------------------------------------------------
+def lttb_indices(x, y, n_out):
+    # 남길 점 번호 (처음 · 끝 포함 n_out 개). 가운데 점들을 n_out - 2 개 구간으로 나누고,
+    # 구간마다 "앞에서 고른 점 - 이 점 - 다음 구간 평균점" 삼각형이 가장 큰 점을 고른다.
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)     # 구간 경계 (가운데 점들)
+    # 다음 구간 평균점: 구간 합을 reduceat 한 번으로. 마지막 구간의 '다음' 은 끝점.
+    counts = np.diff(edges)
+    avg_x = np.append(np.add.reduceat(x[:-1], edges[:-1])[:len(counts)] / counts, x[-1])
+    avg_y = np.append(np.add.reduceat(y[:-1], edges[:-1])[:len(counts)] / counts, y[-1])
+
+    picked = np.empty(n_out, dtype=np.int64)
+    picked[0], picked[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        bx, by = x[lo:hi], y[lo:hi]
+        area = np.abs((x[a] - avg_x[i + 1]) * (by - y[a]) - (x[a] - bx) * (avg_y[i + 1] - y[a]))
+        a = lo + int(np.argmax(area))
+        picked[i + 1] = a
+    return picked
+
+
+def minmax_indices(y, n_out):
+    # 구간마다 최솟값 · 최댓값 점 (처음 · 끝 포함, 많아야 n_out 개). 길이를 맞춰 (구간, 폭) 으로 접고 한 번에.
+    n = len(y)
+    if n_out >= n or n_out < 4:
+        return np.arange(n)
+    buckets = (n_out - 2) // 2
+    width = -(-n // buckets)
+    padded = np.full(buckets * width, np.nan)
+    padded[:n] = y
+    padded = padded.reshape(buckets, width)
+    valid = ~np.isnan(padded).all(axis=1)
+    offsets = np.arange(buckets)[valid] * width
+    lows = offsets + np.nanargmin(padded[valid], axis=1)
+    highs = offsets + np.nanargmax(padded[valid], axis=1)
+    return np.unique(np.concatenate([[0, n - 1], lows, highs]))
+
+
+def downsample(x, y, n_out=CHART_POINTS, method="lttb"):
+    if method == "minmax":
+        return minmax_indices(y, n_out)
+    return lttb_indices(x, y, n_out)
+
+
+# ------------------------------------------------------------------------------
+# 구간 자르기 + JSON
+# ------------------------------------------------------------------------------
+class SeriesSource:
+    # trade_series 모양의 표에서 날짜(정수 일)와 계열 배열만 뽑아 둔 것. 확대할 때마다 여기서 자른다.
+    def __init__(self, df):
+        self.dates = df["Date"].to_numpy().astype("datetime64[D]")
+        self.days = self.dates.astype(np.int64).astype(np.float64)
+        self.values = {name: df[name].to_numpy(dtype=np.float64) for name in SERIES_LABELS if name in df.columns}
+
+    def bounds(self):
+        return self.dates[0], self.dates[-1]
+
+    def window(self, start, end, names, n_out=CHART_POINTS, method="lttb"):
+        # [start, end] 구간의 긴 모양 레코드 (계열마다 많아야 n_out 개)
+        lo = np.searchsorted(self.dates, np.datetime64(start, "D"), side="left")
+        hi = np.searchsorted(self.dates, np.datetime64(end, "D"), side="right")
+        records = []
+        for name in names:
+            y = self.values[name][lo:hi]
+            keep = downsample(self.days[lo:hi], y, n_out, method)
+            dates = np.datetime_as_string(self.dates[lo:hi][keep], unit="D")
+            label = SERIES_LABELS[name]
+            records.extend({"date": d, "series": label, "value": v}
+                           for d, v in zip(dates.tolist(), np.round(y[keep], 3).tolist()))
+        return records, hi - lo
+
+
+def series_source(df):
+    return derived(df, "series_source", SeriesSource)
+
+
+# ------------------------------------------------------------------------------
+# Vega-Lite 사양 (trade_charts.py 의 matplotlib 차트와 같은 색)
+# ------------------------------------------------------------------------------
+def _zoom_param():
+    # 차트 안에서 휠 확대 · 끌어서 이동 (x 축만)
+    return [{"name": "zoom", "select": {"type": "interval", "encodings": ["x"]}, "bind": "scales"}]
+
+
+def trend_spec(records, title):
+    # Chart 1 대체: 수출입 선 그래프
+    return {
+        "title": title,
+        "data": {"values": records},
+        "params": _zoom_param(),
+        "mark": {"type": "line", "point": len(records) <= 200, "strokeWidth": 2.5},
+        "encoding": {
+            "x": {"field": "date", "type": "temporal", "title": None},
+            "y": {"field": "value", "type": "quantitative", "title": "금액 (10억 달러)", "scale": {"zero": False}},
+            "color": {"field": "series", "type": "nominal", "title": None,
+                      "scale": {"domain": ["수출", "수입"], "range": ["#004c70", "#d45087"]}},
+            "tooltip": [{"field": "date", "type": "temporal"}, {"field": "series"},
+                        {"field": "value", "type": "quantitative", "format": ",.1f"}],
+        },
+    }
+
+
+def balance_spec(records, title):
+    # Chart 2 대체: 무역수지 막대 (흑자 파랑 / 적자 빨강)
+    return {
+        "title": title,
+        "data": {"values": records},
+        "params": _zoom_param(),
+        "mark": {"type": "bar", "opacity": 0.8},
+        "encoding": {
+            "x": {"field": "date", "type": "temporal", "title": None},
+            "y": {"field": "value", "type": "quantitative", "title": "수지 (10억 달러)"},
+            "color": {"condition": {"test": "datum.value >= 0", "value": "#005eb8"}, "value": "#e03a3e"},
+            "tooltip": [{"field": "date", "type": "temporal"},
+                        {"field": "value", "type": "quantitative", "format": "+,.1f"}],
+        },
+    }
@@ -0,0 +1,258 @@
+import io
+import os
+import sys
+import time
+import hashlib
+import argparse
+import threading
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+import data_loader
+from data_loader import TRADE_FILE, file_signature
+from figure_cache import figure_cache
+from trade_cube import TradeCube, kstat_cube
+
+# ==============================================================================
+# [무역 자료 갱신] 원본에 새 달(해)이 붙으면 붙은 부분만 읽고, 바뀐 집계만 다시 계산한다
+# ------------------------------------------------------------------------------
+# 달마다 trade_data.csv 에 줄이 붙거나 새 K-stat 내보내기 파일이 들어온다. 예전에는 무엇이든 바뀌면
+# 전부 다시 읽고 다시 계산했다. 여기서는
+#   1) 찾기   : CSV 는 지난번에 읽은 위치(바이트 offset)와 그 직전 CHECK_BYTES 의 해시를 기억해 둔다.
+#               크기가 커졌고 그 해시가 그대로면 "뒤에 줄이 붙은 것" → 붙은 바이트만 해석한다.
+#               (앞부분이 바뀌었거나 K-stat 엑셀처럼 통째로 다시 쓰는 파일이면 전부 읽고,
+#                예전 표가 새 표의 앞부분과 같은지 줄 해시로 비교해서 새 줄만 골라낸다)
+#   2) 계산   : 새 줄로 작은 큐브를 만들어 해당 칸에만 더하고 (TradeCube.extended),
+#               연 증감률 · 누적 수지는 처음 바뀐 해부터만 다시 계산한다.
+#   3) 그림   : 바뀐 결과에 기대는 그림만 figure_cache.invalidate 로 버린다.
+#               "trade:series" (전체 수출입 계열: Chart 1 · 2 · 4 · 5), "trade:regions" (지역 비중: Chart 3)
+# 새 줄이 예전 기간 사이에 끼거나 처음 보는 지역 · 품목이 나오면 처음부터 다시 만든다.
+#
+# 대시보드는 TradeFeed.state 를 한 번 꺼내 쓴다. 갱신은 새 상태를 만들어 통째로 바꿔 끼우므로
+# 그리고 있던 세션은 끝까지 예전 상태를 본다.
+#   TRADE_SOURCE           : kstat (기본, K-stat 엑셀) 또는 csv (trade_data.csv)
+#   TRADE_REFRESH_INTERVAL : 원본을 확인하는 간격(초). 0 이면 감시하지 않음 (기본 30)
+#
+#   python trade_refresh.py --watch    → 원본을 감시하면서 갱신 내용을 출력
+# ==============================================================================
+
+SOURCE = os.environ.get("TRADE_SOURCE", "kstat")
+REFRESH_INTERVAL = float(os.environ.get("TRADE_REFRESH_INTERVAL", "30"))
+CHECK_BYTES = 4096          # 붙은 줄인지 확인할 때 해시하는 직전 구간 길이
+SERIES_TAG = "trade:series"
+REGIONS_TAG = "trade:regions"
+
+FeedState = namedtuple("FeedState", [
+    "version",       # 갱신할 때마다 1씩
+    "signature",     # 원본 파일 서명 (경로, 수정시각, 크기)
+    "table",         # 원본 표 (기간 순)
+    "cube",          # TradeCube
+    "years",         # (해,) 연도
+    "yoy",           # (해, 2) 수출 · 수입 전년 대비 증감률 (%). 바로 전 해가 없으면 NaN
+    "running",       # (해,) 첫 해부터의 누적 무역수지 (10억 달러)
+    "offset",        # CSV: 해석을 끝낸 바이트 위치 (마지막 줄바꿈 다음)
+    "tail_digest",   # CSV: offset 직전 CHECK_BYTES 의 해시
+    "updated",       # 마지막 갱신 시각 (time.time)
+])
+
+Update = namedtuple("Update", ["mode", "rows", "tags"])  # mode: append / diff / rebuild
+
+
+def _period_key(table):
+    year = table["Year"].to_numpy(dtype=np.int64)
+    return year * 12 + (table["Month"].to_numpy(dtype=np.int64) - 1 if "Month" in table.columns else 0)
+
+
+def _row_hashes(table):
+    return pd.util.hash_pandas_object(table, index=False).to_numpy()
+
+
+def _tail(path, offset):
+    # 파일 끝까지 읽은 뒤 마지막 줄바꿈까지를 offset 으로 (쓰다 만 줄은 다음 번에)
+    with open(path, "rb") as f:
+        f.seek(offset)
+        data = f.read()
+    end = data.rfind(b"\n") + 1
+    return data[:end], offset + end
+
+
+def _csv_position(path):
+    # 처음부터 다 읽었을 때의 (offset, 직전 구간 해시)
+    with open(path, "rb") as f:
+        offset = f.read().rfind(b"\n") + 1
+    return offset, _tail_digest(path, offset)
+
+
+def _tail_digest(path, offset):
+    with open(path, "rb") as f:
+        f.seek(max(offset - CHECK_BYTES, 0))
+        return hashlib.sha1(f.read(min(offset, CHECK_BYTES))).hexdigest()
+
+
+# ------------------------------------------------------------------------------
+# 파생 집계 (연 증감률 · 누적 수지)
+# ------------------------------------------------------------------------------
+def _derive(cube, previous=None, first=0):
+    # 연 단위 전체 × 전체 계열에서. previous 가 있으면 first 번째 해부터만 새로 계산해서 뒤에 붙인다.
+    totals = np.asarray(cube.cell("year"))                        # (해, 수출 · 수입 · 수지) 천 달러
+    years = cube.dates["year"].astype("datetime64[Y]").astype(np.int64) + 1970
+    if previous is None:
+        first = 0
+    start = max(first - 1, 0)                                      # 증감률은 바로 전 해가 필요
+    amounts, prior = totals[start + 1:, :2], totals[start:-1, :2]
+    consecutive = (years[start + 1:] - years[start:-1] == 1)[:, None]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        growth = np.where(consecutive, (amounts / prior - 1) * 100, np.nan)
+    if first == 0:
+        growth = np.vstack([np.full((1, 2), np.nan), growth])
+    carried = previous.running[first - 1] if first > 0 else 0.0
+    running = carried + np.cumsum(totals[first:, 2]) / 1e6
+
+    if first > 0:
+        growth = np.vstack([previous.yoy[:first], growth])
+        running = np.concatenate([previous.running[:first], running])
+    return years, growth, running
+
+
+# ------------------------------------------------------------------------------
+# 원본 하나의 현재 상태
+# ------------------------------------------------------------------------------
+class TradeFeed:
+    def __init__(self, source=SOURCE, path=None):
+        self.source = source
+        self.path = path or (TRADE_FILE if source == "csv" else None)
+        self._lock = threading.Lock()   # 갱신은 한 번에 하나만 (읽는 쪽은 잠그지 않음)
+        self.state = self._build(self._signature(), self._load(), version=1)
+
+    def _signature(self):
+        if self.source == "csv":
+            return file_signature(self.path)
+        from kstat_import import KSTAT_FILE
+        return file_signature(self.path or KSTAT_FILE)
+
+    def _load(self):
+        if self.source == "csv":
+            return data_loader.load_trade_table(self.path)
+        from kstat_import import load_kstat_table
+        return load_kstat_table(self.path) if self.path else load_kstat_table()
+
+    def _build(self, signature, table, version):
+        # 처음부터: 큐브 · 파생 집계 전부
+        cube = kstat_cube(self.path) if self.source == "kstat" else TradeCube.from_table(table)
+        years, yoy, running = _derive(cube)
+        offset, digest = _csv_position(self.path) if self.source == "csv" else (0, None)
+        return FeedState(version, signature, table, cube, years, yoy, running, offset, digest, time.time())
+
+    def _appended_rows(self, state, signature):
+        # CSV 뒤에 줄만 붙었으면 그 줄들 (표 모양), 아니면 None
+        if self.source != "csv" or signature[2] < state.offset:
+            return None, state.offset, state.tail_digest
+        if _tail_digest(self.path, state.offset) != state.tail_digest:
+            return None, state.offset, state.tail_digest
+        data, offset = _tail(self.path, state.offset)
+        rows = data_loader.parse_trade_csv(io.BytesIO(data), skiprows=0) if data else state.table.iloc[:0]
+        return rows, offset, _tail_digest(self.path, offset)
+
+    def refresh(self):
+        # 원본이 바뀌었으면 새 상태로 바꿔 끼우고 Update 를, 그대로면 None 을 돌려준다.
+        with self._lock:
+            state = self.state
+            signature = self._signature()
+            if signature == state.signature:
+                return None
+
+            rows, offset, digest = self._appended_rows(state, signature)
+            mode = "append"
+            if rows is not None and len(rows) and _period_key(rows).min() <= _period_key(state.table).max():
+                rows = None   # 예전 기간 사이에 끼는 줄 → 아래에서 전부 읽음
+            if rows is not None:
+                table = pd.concat([state.table, rows], ignore_index=True)
+                data_loader.replace_table(self.path, "trade", signature, table)
+            else:
+                # 전부 읽고, 예전 표가 새 표의 앞부분 그대로면 나머지 줄만 새 줄로
+                # (순번은 최신 해가 맨 위에 끼면 전부 밀리므로 비교에서 뺀다)
+                mode = "diff"
+                table = self._load()
+                old = state.table
+                columns = [c for c in old.columns if c != "No"]
+                same = (list(table.columns) == list(old.columns) and len(table) >= len(old)
+                        and np.array_equal(_row_hashes(table[columns].iloc[:len(old)]), _row_hashes(old[columns])))
+                rows = table.iloc[len(old):].reset_index(drop=True) if same else None
+                if self.source == "csv":
+                    offset, digest = _csv_position(self.path)
+
+            if rows is not None and len(rows) == 0:
+                # 내용은 그대로 (저장만 다시 했거나 쓰다 만 줄): 서명 · 위치만 갱신
+                self.state = state._replace(signature=signature, table=table, offset=offset, tail_digest=digest)
+                return Update(mode, 0, ())
+            extended = state.cube.extended(rows) if rows is not None else None
+            if extended is None:
+                self.state = self._build(signature, table, state.version + 1)
+                self._invalidate((SERIES_TAG, REGIONS_TAG))
+                return Update("rebuild", len(table), (SERIES_TAG, REGIONS_TAG))
+
+            cube, first_changed = extended
+            years, yoy, running = _derive(cube, state, first_changed["year"])
+            self.state = FeedState(state.version + 1, signature, table, cube, years, yoy, running,
+                                   offset, digest, time.time())
+            tags = (SERIES_TAG, REGIONS_TAG) if cube.has_regions else (SERIES_TAG,)
+            self._invalidate(tags)
+            return Update(mode, len(rows), tags)
+
+    def _invalidate(self, tags):
+        figure_cache.invalidate(*tags)
+
+
+_feed = None
+_feed_lock = threading.Lock()
+
+
+def _watch(feed, interval):
+    while True:
+        time.sleep(interval)
+        try:
+            feed.refresh()
+        except Exception as exc:  # 파일이 쓰이는 중 등: 다음 확인 때 다시
+            print(f"[trade_refresh] 갱신 실패: {exc!r}", file=sys.stderr)
+
+
+def trade_feed():
+    # Trade.py 입구: 프로세스에 하나. REFRESH_INTERVAL 마다 원본을 확인하는 스레드도 한 번만 띄운다.
+    global _feed
+    with _feed_lock:
+        if _feed is None:
+            _feed = TradeFeed()
+            if REFRESH_INTERVAL > 0:
+                threading.Thread(target=_watch, args=(_feed, REFRESH_INTERVAL),
+                                 name="trade-refresh", daemon=True).start()
+        return _feed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="무역 원본 파일을 감시하면서 붙은 줄만 반영합니다.")
+    parser.add_argument("--source", choices=["kstat", "csv"], default=SOURCE, help="원본 종류 (기본: TRADE_SOURCE)")
+    parser.add_argument("--path", default=None, help="원본 파일 (기본: 저장소 파일)")
+    parser.add_argument("--watch", action="store_true", help="계속 감시 (없으면 상태만 출력)")
+    parser.add_argument("--interval", type=float, default=REFRESH_INTERVAL or 5, help="확인 간격(초)")
+    args = parser.parse_args(argv)
+
+    feed = TradeFeed(args.source, args.path)
+    state = feed.state
+    print(f"[시작] {args.source}: {len(state.table):,}줄, {state.years[0]}~{state.years[-1]}, "
+          f"누적 수지 {state.running[-1]:+,.1f} 십억 달러")
+    while args.watch:
+        time.sleep(args.interval)
+        started = time.perf_counter()
+        update = feed.refresh()
+        if update is not None:
+            state = feed.state
+            print(f"[갱신 v{state.version}] {update.mode}: 새 줄 {update.rows:,}개, "
+                  f"{(time.perf_counter() - started) * 1000:.1f}ms, 그림 꼬리표 {', '.join(update.tags) or '-'}; "
+                  f"{state.years[-1]}년 수출 {state.yoy[-1, 0]:+.1f}%, 누적 수지 {state.running[-1]:+,.1f}", flush=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
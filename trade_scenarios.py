@@ -0,0 +1,239 @@
+import os
+import threading
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from data_loader import derived
+
+# ==============================================================================
+# [무역수지 시나리오] 유가 충격을 넣은 월별 수출입 경로를 수만 개 한꺼번에 뽑는다 (Monte Carlo)
+# ------------------------------------------------------------------------------
+# Trade.py 의 "배럴당 90달러 돌파 시 흑자 폭 축소" 를 숫자로 확인하려는 것.
+# 모든 경로를 (경로 수, 개월) 배열 하나로 만들고 누적합으로 한 번에 굴린다. (경로마다 반복문 X)
+#   수출 = 기준 수출 × exp(누적(추세 + 잡음)) × 계절성
+#   수입 = 기준 수입 × exp(누적(추세 + 잡음)) × 계절성 × (1 + 에너지 비중 × (유가 / 기준 유가 - 1))
+#   기준 유가 = 기준 수입(최근 연도 실적)에 이미 들어 있는 유가 (그해 평균). 시작 유가가 이보다 높으면
+#   첫 달부터 수입이 그만큼 비싸진다.
+#   유가 = 시작 유가 × exp(누적(잡음 + 충격)),  충격은 달마다 확률 p 로 +jump 만큼 튐
+# 수출 · 수입 잡음은 상관(rho)을 준다 (경기가 좋으면 둘 다 늘어남).
+# 결과는 월별 무역수지 분위수(부채꼴 차트)와 "그 달 적자일 확률".
+#
+# - 기준값 · 추세 · 변동성은 K-stat 연도별 실적에서 뽑는다 (params_from_history).
+#   연도 자료라 계절성은 추정할 수 없어서 기본값은 완만한 코사인(12월 최고)이고, 12개 계수를 직접 줄 수 있다.
+# - 경로가 많으면(CHUNK_PATHS 초과) 덩어리로 나눠 프로세스 풀에 맡긴다.
+#   덩어리마다 시드를 SeedSequence 로 나눠 주므로 워커 수와 상관없이 결과가 같다.
+#   워커는 경로 배열을 돌려보내지 않고 합계 · 개수와 분위수 점(SKETCH, 0.1% 간격)만 보낸다.
+#   덩어리들의 분위수는 덩어리 분포를 경로 수로 가중해 섞은 분포에서 구한다 (덩어리 하나면 정확히 같음).
+# - 같은 조건의 결과는 프로세스 안에서 기억해 둔다 (슬라이더를 되돌리면 바로 나옴).
+# ==============================================================================
+
+QUANTILES = (5, 25, 50, 75, 95)
+CHUNK_PATHS = 200_000                                     # 한 번에 만드는 경로 수 (메모리 · 작업 단위)
+WORKERS = int(os.environ.get("SCENARIO_WORKERS", "0")) or (os.cpu_count() or 1)
+RESULT_CACHE_SIZE = 32
+SKETCH = np.linspace(0, 100, 1001)                        # 덩어리마다 돌려주는 분위수 점 (%)
+
+ScenarioParams = namedtuple("ScenarioParams", [
+    "months",            # 시뮬레이션 기간 (개월)
+    "paths",             # 경로 수
+    "export_base",       # 첫 달 직전 월 수출 (10억 달러)
+    "import_base",       # 첫 달 직전 월 수입 (10억 달러)
+    "export_drift",      # 월 추세 (로그 성장률)
+    "import_drift",
+    "export_vol",        # 월 잡음 표준편차 (로그)
+    "import_vol",
+    "correlation",       # 수출 · 수입 잡음 상관
+    "seasonal",          # 12개 월별 계수 (1월부터, 평균 1) 또는 None → 기본 코사인
+    "oil_start",         # 시작 유가 (달러/배럴)
+    "oil_reference",     # 기준 유가: 기준 수입에 들어 있는 유가 (최근 연도 평균, 달러/배럴)
+    "oil_vol",           # 유가 월 변동성 (로그)
+    "shock_prob",        # 달마다 유가 충격이 올 확률
+    "shock_size",        # 충격 크기 (로그, 0.2 ≈ +22%)
+    "energy_share",      # 수입 중 에너지 비중 (유가에 비례해 움직이는 몫)
+    "oil_threshold",     # 보고용 기준 유가 (이 값을 넘는 달의 확률 · 수지를 따로 봄)
+    "start_month",       # 첫 달 (1~12)
+    "seed",
+], defaults=[
+    12, 100_000, 59.0, 52.6, 0.003, 0.003, 0.035, 0.035, 0.6, None,
+    75.0, 75.0, 0.08, 0.05, 0.2, 0.25, 90.0, 1, 2025,
+])
+
+
+def params_from_history(series, **overrides):
+    # trade_series 모양(Date / Exports / Imports, 10억 달러, 연도별)에서 기준값 · 추세 · 변동성을 뽑는다.
+    # 연 로그성장률의 평균 / 표준편차 → 월 단위로 (평균 / 12, 표준편차 / √12)
+    exports = series["Exports"].to_numpy(dtype=np.float64)
+    imports = series["Imports"].to_numpy(dtype=np.float64)
+    growth_x = np.diff(np.log(exports))
+    growth_m = np.diff(np.log(imports))
+    fitted = dict(
+        export_base=exports[-1] / 12,
+        import_base=imports[-1] / 12,
+        export_drift=growth_x.mean() / 12,
+        import_drift=growth_m.mean() / 12,
+        export_vol=growth_x.std(ddof=1) / np.sqrt(12),
+        import_vol=growth_m.std(ddof=1) / np.sqrt(12),
+        correlation=np.corrcoef(growth_x, growth_m)[0, 1],
+    )
+    fitted = {key: float(value) for key, value in fitted.items()}
+    fitted.update(overrides)
+    return ScenarioParams(**fitted)
+
+
+def history_params(series, **overrides):
+    # Trade.py 에서: 표마다 한 번만 뽑아 두고 슬라이더 값만 바꿔 끼운다.
+    return derived(series, "scenario_params", params_from_history)._replace(**overrides)
+
+
+def seasonal_factors(params):
+    # (12,) 월별 계수. 기본값은 ±3% 코사인 (12월 최고, 6월 최저)
+    if params.seasonal is not None:
+        factors = np.asarray(params.seasonal, dtype=np.float64)
+        return factors / factors.mean()
+    month = np.arange(12)
+    return 1 + 0.03 * np.cos(2 * np.pi * (month - 11) / 12)
+
+
+# ------------------------------------------------------------------------------
+# 경로 만들기 (덩어리 하나)
+# ------------------------------------------------------------------------------
+def simulate_chunk(params, paths, seed_seq):
+    # (paths, months) 배열들을 돌려준다: 수출, 수입, 수지, 유가
+    # 분위수 · 확률만 보므로 float32 로 충분하다 (난수 생성 · exp 가 두 배 빨라짐).
+    rng = np.random.default_rng(seed_seq)
+    shape = (paths, params.months)
+    f32 = np.float32
+
+    # 상관 있는 두 잡음: z2 = rho * z1 + sqrt(1 - rho^2) * e
+    z1 = rng.standard_normal(shape, dtype=f32)
+    z2 = rng.standard_normal(shape, dtype=f32)
+    z2 *= f32(np.sqrt(1 - params.correlation ** 2))
+    z2 += f32(params.correlation) * z1
+    log_x = np.cumsum(f32(params.export_drift) + f32(params.export_vol) * z1, axis=1)
+    log_m = np.cumsum(f32(params.import_drift) + f32(params.import_vol) * z2, axis=1)
+
+    oil_steps = rng.standard_normal(shape, dtype=f32)
+    oil_steps *= f32(params.oil_vol)
+    oil_steps += f32(-0.5 * params.oil_vol ** 2)
+    oil_steps += (rng.random(shape, dtype=f32) < params.shock_prob) * f32(params.shock_size)
+    oil = f32(params.oil_start) * np.exp(np.cumsum(oil_steps, axis=1))
+
+    season = seasonal_factors(params)[(params.start_month - 1 + np.arange(params.months)) % 12].astype(f32)
+    exports = f32(params.export_base) * np.exp(log_x) * season
+    imports = f32(params.import_base) * np.exp(log_m) * season
+    imports *= 1 + f32(params.energy_share) * (oil / f32(params.oil_reference) - 1)
+    return exports, imports, exports - imports, oil
+
+
+def _chunk_summary(params, paths, seed_seq):
+    # 워커에서: 큰 배열 대신 합칠 수 있는 합계 · 개수와 분위수 점만 돌려준다
+    exports, imports, balance, oil = simulate_chunk(params, paths, seed_seq)
+    over = oil > params.oil_threshold
+    return dict(
+        paths=paths,
+        balance_sketch=np.percentile(balance, SKETCH, axis=0),
+        exports_sum=exports.sum(axis=0, dtype=np.float64),
+        imports_sum=imports.sum(axis=0, dtype=np.float64),
+        deficit=(balance < 0).sum(axis=0),
+        any_deficit=int((balance < 0).any(axis=1).sum()),
+        oil_over=over.sum(axis=0),
+        balance_over_sum=np.where(over, balance, 0).sum(axis=0, dtype=np.float64),
+        annual_sketch=np.percentile(balance.sum(axis=1), SKETCH),
+    )
+
+
+def _merge_quantiles(sketches, sizes, q):
+    # 덩어리별 분위수 점 (점, 열...) → 경로 수로 가중해 섞은 분포의 q 분위수 (q, 열...)
+    # 섞은 분포의 누적확률 F(x) = Σ 가중치 × F_덩어리(x) 를 모든 분위수 점에서 구하고 뒤집는다.
+    weights = np.asarray(sizes, dtype=np.float64) / sum(sizes)
+    stacked = np.stack([np.asarray(s, dtype=np.float64).reshape(len(SKETCH), -1) for s in sketches])
+    out = np.empty((len(q), stacked.shape[2]))
+    for j in range(stacked.shape[2]):
+        xs = np.sort(stacked[:, :, j].ravel())
+        cdf = sum(w * np.interp(xs, sketch[:, j], SKETCH) for w, sketch in zip(weights, stacked))
+        out[:, j] = np.interp(q, cdf, xs)
+    return out.reshape((len(q),) + np.shape(sketches[0])[1:])
+
+
+# ------------------------------------------------------------------------------
+# 모으기
+# ------------------------------------------------------------------------------
+class ScenarioResult:
+    # 월별 배열은 모두 (개월,), 분위수는 (분위수, 개월)
+    def __init__(self, params, parts):
+        sizes = [p["paths"] for p in parts]
+        n = sum(sizes)
+        self.params = params
+        self.months = np.arange(1, params.months + 1)
+        self.quantiles = QUANTILES
+        self.balance_q = _merge_quantiles([p["balance_sketch"] for p in parts], sizes, QUANTILES)
+        self.exports_mean = sum(p["exports_sum"] for p in parts) / n
+        self.imports_mean = sum(p["imports_sum"] for p in parts) / n
+        self.p_deficit = sum(p["deficit"] for p in parts) / n            # 그 달 적자일 확률
+        self.p_any_deficit = sum(p["any_deficit"] for p in parts) / n     # 기간 중 적자 달이 한 번이라도 있을 확률
+        oil_over = sum(p["oil_over"] for p in parts)
+        self.p_oil_over = oil_over / n                                     # 그 달 유가가 기준을 넘을 확률
+        with np.errstate(invalid="ignore", divide="ignore"):
+            self.balance_when_oil_over = sum(p["balance_over_sum"] for p in parts) / oil_over
+        self.annual_balance_q = _merge_quantiles([p["annual_sketch"] for p in parts], sizes, QUANTILES)  # 기간 누적 수지
+
+    def month_labels(self):
+        start = self.params.start_month - 1
+        return [f"{(start + m) % 12 + 1}월" for m in range(self.params.months)]
+
+    def chart_data(self):
+        # trade_charts.scenario_fan 에 넘길 배열만 (그림 캐시 키가 내용으로 만들어지도록)
+        return {
+            "labels": self.month_labels(),
+            "quantiles": self.quantiles,
+            "balance_q": self.balance_q,
+            "p_deficit": self.p_deficit,
+            "paths": self.params.paths,
+        }
+
+
+_executors = {}                 # 워커 수 → 프로세스 풀 (run(workers=N) 마다 그 크기의 풀)
+_executor_lock = threading.Lock()
+_results = OrderedDict()
+_results_lock = threading.Lock()
+
+
+def _get_executor(workers):
+    with _executor_lock:
+        executor = _executors.get(workers)
+        if executor is None:
+            executor = _executors[workers] = ProcessPoolExecutor(max_workers=workers)
+        return executor
+
+
+def run(params=None, workers=None):
+    # 시나리오 한 번. 같은 params 면 기억해 둔 결과를 돌려준다.
+    params = params or ScenarioParams()
+    if params.seasonal is not None:
+        # 리스트 · 배열로 준 계수도 결과 캐시 키로 쓸 수 있도록 튜플로 바꾼다.
+        params = params._replace(seasonal=tuple(float(v) for v in params.seasonal))
+    with _results_lock:
+        if params in _results:
+            _results.move_to_end(params)
+            return _results[params]
+
+    sizes = [CHUNK_PATHS] * (params.paths // CHUNK_PATHS)
+    if params.paths % CHUNK_PATHS:
+        sizes.append(params.paths % CHUNK_PATHS)
+    seeds = np.random.SeedSequence(params.seed).spawn(len(sizes))
+    workers = WORKERS if workers is None else workers
+
+    if len(sizes) > 1 and workers > 1:
+        futures = [_get_executor(workers).submit(_chunk_summary, params, size, seed) for size, seed in zip(sizes, seeds)]
+        parts = [future.result() for future in futures]
+    else:
+        parts = [_chunk_summary(params, size, seed) for size, seed in zip(sizes, seeds)]
+
+    result = ScenarioResult(params, parts)
+    with _results_lock:
+        _results[params] = result
+        while len(_results) > RESULT_CACHE_SIZE:
+            _results.popitem(last=False)
+    return result